@@ -4,6 +4,23 @@ import os
 import math
 import json
 import sys
+import time
+import mmap
+import struct
+import hashlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    print("NumPy não encontrado. Usando sistema de partículas em Python puro.")
+
+try:
+    from PIL import Image, ImageSequence
+except ImportError:
+    Image = ImageSequence = None
 
 pygame.init()
 
@@ -12,62 +29,374 @@ tela = pygame.display.set_mode((largura, altura))
 pygame.display.set_caption("Nave vs Meteoros - Versão Aprimorada")
 clock = pygame.time.Clock()
 
+# == CONFIGURAÇÕES DE QUALIDADE ==
+CONFIG_QUALIDADE = {
+    "rastro_particulas": 5,  # Pontos de rastro por partícula (0 desliga os rastros)
+    "memoria_cache_luzes_mb": 32,  # Orçamento do cache de gradientes de luz e brilho
+    "escala_lightmap": 2,  # Luzes e brilhos acumulados em 1/2 da resolução (4 = 1/4, 1 = resolução cheia)
+    "lightmap_suave": False,  # Ampliação bilinear do lightmap (mais bonita, ~1ms a mais por frame)
+    "pos_processamento": {  # Passes do pós-processamento (F5-F8 alternam durante o jogo)
+        "brilho": True,
+        "congelamento": True,
+        "vinheta": False,
+        "scanlines": True,
+    },
+    "estrelas_fundo": 150,  # Estrelas por tela somando as camadas (o custo por frame não depende disso)
+    "altura_camada_estrelas": 2,  # Altura de cada camada do fundo em telas (maior = repete menos)
+    "grupos_piscar_estrelas": 3,  # Sobreposições animadas por camada, cada uma piscando num ritmo
+    "passos_rotacao": 64,  # Ângulos pré-renderizados por sprite giratório (meteoros, projéteis, portal)
+    "pre_renderizar_rotacoes": False,  # True gera todos os ângulos no carregamento em vez de sob demanda
+    "memoria_animacoes_mb": 48,  # Orçamento dos quadros de GIF decodificados (animações sem uso saem primeiro)
+    "lado_max_sprite_atlas": 64,  # Sprites com largura e altura até este valor vão para o atlas
+    "tamanho_pagina_atlas": 256,  # Lado (px) de cada página do atlas
+    "celula_grade_colisao": 64,  # Lado (px) das células do hash espacial de colisões
+    "broadphase_vetorizada": False,  # True (com NumPy) usa o kernel AABB vetorizado - só compensa em cenas densas
+    "previsao_teleporte_passos": 15,  # Passos à frente em que meteoros ainda contam como ocupando (0 = só agora)
+    "capacidade_projeteis": 4096,  # Projéteis vivos de uma vez (jogador + bosses); tiros além disso se perdem
+}
+
+
+# == RELÓGIO DO JOGO ==
+class FonteTempoVirtual:
+    """Fonte de tempo manual: execuções headless e replays avançam o tempo sem o relógio real"""
+
+    def __init__(self, inicio_ms=0):
+        self.ms = inicio_ms
+
+    def avancar(self, ms):
+        self.ms += ms
+
+    def __call__(self):
+        return self.ms
+
+
+class RelogioJogo:
+    """Relógio único do jogo: lido uma vez por frame e compartilhado por todos os subsistemas"""
+
+    def __init__(self, fonte=None):
+        self.fonte = fonte or pygame.time.get_ticks
+        self.agora = 0  # Tempo de jogo em ms - é o "agora" de todo o frame
+        self.escala = 1.0
+        self.pausado = False
+        self.ultimo_real = self.fonte()
+
+    def usar_fonte(self, fonte):
+        """Troca a fonte de tempo (ex: FonteTempoVirtual) sem saltos no tempo de jogo"""
+        self.fonte = fonte
+        self.ultimo_real = fonte()
+
+    def amostrar(self):
+        """Lê a fonte uma única vez e devolve quanto tempo de jogo o frame deve simular"""
+        real = self.fonte()
+        delta = real - self.ultimo_real
+        self.ultimo_real = real
+        if self.pausado:
+            return 0.0
+        return delta * self.escala
+
+    def avancar(self, ms):
+        self.agora += ms
+
+    def alternar_pausa(self):
+        self.pausado = not self.pausado
+
+
+relogio = RelogioJogo()
+
+
+# == MANIFESTO E RESOLUÇÃO DE ASSETS ==
+DIRETORIO_JOGO = os.path.dirname(os.path.abspath(__file__))
+
+# Nome lógico: (arquivo, tamanhos usados, cor do sprite gerado se o arquivo não existir - uma só ou uma por tamanho)
+MANIFESTO_ASSETS = {
+    "nave_azulroxo": ("nave_azulroxo3.gif", ((40, 40),), (100, 150, 255)),
+    "nave_laranja": ("nave_laranja3.gif", ((40, 40),), (100, 150, 255)),
+    "nave_rosa": ("nave_rosa2.gif", ((40, 40),), (100, 150, 255)),
+    "nave_verde": ("nave_verde3.gif", ((40, 40),), (100, 150, 255)),
+    "nave_vermelho1": ("nave_vermelho1.gif", ((40, 40),), (100, 150, 255)),
+    "nave_vermelho3": ("nave_vermelho3.gif", ((40, 40),), (100, 150, 255)),
+    "nave_gabriel": ("nave_gabriel.png", ((40, 40),), (0, 255, 0)),
+    "nave_paulo": ("nave_paulo.png", ((40, 40),), (255, 0, 0)),
+    "nave_vitor": ("nave_vitor.png", ((40, 40),), (0, 0, 255)),
+    "meteoro": ("meteoro.gif", ((60, 60), (80, 80), (100, 100)), ((150, 100, 50), (150, 100, 50), (120, 80, 40))),
+    "projetil": ("projetil_base.gif", ((15, 25),), (255, 255, 100)),
+    "projetil_boss": ("projetil_boss.gif", ((15, 25),), (255, 100, 100)),
+    "boss": ("nave_boss.gif", ((70, 70), (50, 50), (30, 30)),  # Boss, boss menor e drone
+             ((255, 50, 50), (200, 50, 50), (150, 50, 50))),
+    "mega_boss": ("mega_boss_img.png", ((90, 90),), (200, 50, 150)),
+    "boss_gabriel": ("boss.gabriel.png", ((150, 150),), (255, 0, 255)),
+    "coracao": ("coracao.png", ((30, 30),), (255, 100, 100)),
+    "portal": ("portal.gif", ((60, 60),), (100, 255, 200)),
+}
 
-# == SISTEMA FLEXÍVEL DE CARREGAMENTO DE IMAGENS ==
-def encontrar_arquivos_imagem():
-    """Encontra arquivos de imagem em vários locais possíveis"""
-    locais_possiveis = [
-        os.path.dirname(__file__),  # Diretório atual do script
-        os.path.join(os.path.dirname(__file__), "imagens"),
-        os.path.join(os.path.dirname(__file__), "assets"),
-        os.path.join(os.path.dirname(__file__), "sprites"),
+
+def caminhos_busca_assets():
+    """Ordem de busca dos arquivos: NAVE_ASSETS (separado por os.pathsep) e depois os locais conhecidos"""
+    extras = [local for local in os.environ.get("NAVE_ASSETS", "").split(os.pathsep) if local]
+    return extras + [
+        DIRETORIO_JOGO,
+        os.path.join(DIRETORIO_JOGO, "imagens"),
+        os.path.join(DIRETORIO_JOGO, "assets"),
+        os.path.join(DIRETORIO_JOGO, "sprites"),
         os.path.join(os.path.expanduser("~"), "Pictures"),
         os.path.join(os.path.expanduser("~"), "Downloads"),
         os.path.join(os.path.expanduser("~"), "Documents"),
         r"C:\Users\aluno\PyCharm\Cotacao-Kivy\corrida",
     ]
 
-    for local in locais_possiveis:
-        if os.path.exists(local):
-            try:
-                arquivos = [f for f in os.listdir(local) if
-                            f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
-                if arquivos:
-                    print(f"Imagens encontradas em: {local}")
-                    return local, arquivos
-            except (PermissionError, OSError) as e:
-                print(f"Erro ao acessar {local}: {e}")
-                continue
 
-    print("Nenhuma imagem encontrada. Usando sprites gerados.")
-    return None, []
+class IndiceAssets:
+    """Resolve cada arquivo pelo caminho de busca (sem listar diretórios) e guarda o resultado em disco"""
 
+    def __init__(self, caminho_indice, caminhos_busca):
+        self.caminho_indice = caminho_indice
+        self.caminhos_busca = caminhos_busca
+        self.resolvidos = {}  # arquivo -> caminho completo
+        self.alterado = False
+        self.carregar()
 
-caminho_imagens, arquivos_disponiveis = encontrar_arquivos_imagem()
-print("Arquivos encontrados:", arquivos_disponiveis)
+    def carregar(self):
+        try:
+            with open(self.caminho_indice, "r") as f:
+                dados = json.load(f)
+        except (OSError, ValueError):
+            return
+        # Índice de outro caminho de busca não serve
+        if dados.get("caminhos_busca") == self.caminhos_busca:
+            self.resolvidos = dados.get("arquivos", {})
+
+    def resolver(self, arquivo):
+        """Caminho completo do arquivo ou None - índice fresco custa um stat, sem busca"""
+        caminho = self.resolvidos.get(arquivo)
+        if caminho and os.path.isfile(caminho):
+            return caminho
+
+        for local in self.caminhos_busca:
+            candidato = os.path.join(local, arquivo)
+            if os.path.isfile(candidato):
+                self.resolvidos[arquivo] = candidato
+                self.alterado = True
+                return candidato
+
+        if arquivo in self.resolvidos:
+            del self.resolvidos[arquivo]
+            self.alterado = True
+        return None
+
+    def salvar(self):
+        if not self.alterado:
+            return
+        try:
+            with open(self.caminho_indice, "w") as f:
+                json.dump({"caminhos_busca": self.caminhos_busca, "arquivos": self.resolvidos}, f, indent=2)
+            self.alterado = False
+        except OSError as e:
+            print(f"Erro ao salvar índice de assets: {e}")
+
+
+indice_assets = IndiceAssets(os.path.join(DIRETORIO_JOGO, "indice_assets.json"), caminhos_busca_assets())
+
+
+# == CACHE DE SPRITES PRÉ-RENDERIZADOS ==
+class CacheSprites:
+    """Cache LRU de superfícies: cada variante é renderizada uma vez e reutilizada"""
+
+    def __init__(self, capacidade=3000, limite_bytes=None, medir_bytes=None):
+        self.capacidade = capacidade
+        self.limite_bytes = limite_bytes
+        self.medir_bytes = medir_bytes or self.tamanho_bytes
+        self.sprites = OrderedDict()
+        self.bytes_em_uso = 0
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def obter(self, chave, criar, *args):
+        """Retorna o sprite da chave, chamando criar(*args) só na primeira vez"""
+        sprite = self.sprites.get(chave)
+        if sprite is not None:
+            self.sprites.move_to_end(chave)
+            self.acertos += 1
+            return sprite
+
+        self.falhas += 1
+        sprite = criar(*args)
+        self.sprites[chave] = sprite
+        self.bytes_em_uso += self.medir_bytes(sprite)
+        while len(self.sprites) > 1 and (len(self.sprites) > self.capacidade or (
+                self.limite_bytes is not None and self.bytes_em_uso > self.limite_bytes)):
+            _, removido = self.sprites.popitem(last=False)
+            self.bytes_em_uso -= self.medir_bytes(removido)
+            self.remocoes += 1
+        return sprite
+
+    @staticmethod
+    def tamanho_bytes(sprite):
+        return sprite.get_width() * sprite.get_height() * sprite.get_bytesize()
+
+    def estatisticas(self):
+        total = self.acertos + self.falhas
+        return {
+            'sprites': len(self.sprites),
+            'bytes': self.bytes_em_uso,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'remocoes': self.remocoes,
+            'taxa_acerto': self.acertos / total if total else 0.0
+        }
+
+    def clear(self):
+        self.sprites.clear()
+        self.bytes_em_uso = 0
 
 
 # == SISTEMA DE SHADERS E EFEITOS VISUAIS SUPER AVANÇADOS ==
+# Camadas concêntricas de cada tipo de gradiente: (quantidade, recuo do raio por camada)
+CAMADAS_GRADIENTE = {"luz": (4, 12), "brilho": (5, 6)}
+
+cache_luzes = CacheSprites(4000, CONFIG_QUALIDADE["memoria_cache_luzes_mb"] * 1024 * 1024)
+
+
+def chave_gradiente(tipo, raio, cor, alpha, escala=1):
+    """Quantiza raio (~6%), cor (3 bits por canal) e alpha (16 níveis) dos gradientes de luz"""
+    raio = int(raio / escala)
+    passo = max(1, raio // 16)
+    raio_q = max(1, raio // passo * passo)
+    cor_q = (int(cor[0]) >> 5, int(cor[1]) >> 5, int(cor[2]) >> 5)
+    return tipo, raio_q, cor_q, min(255, int(alpha)) >> 4, escala
+
+
+def renderizar_gradiente(tipo, raio, cor_q, alpha_q, escala):
+    """Renderiza um gradiente radial em camadas (só em falhas do cache)"""
+    cor = (cor_q[0] * 255 // 7, cor_q[1] * 255 // 7, cor_q[2] * 255 // 7)
+    alpha = alpha_q * 17
+    camadas, recuo = CAMADAS_GRADIENTE[tipo]
+    recuo = max(1, recuo // escala)
+
+    surf = pygame.Surface((raio * 2, raio * 2), pygame.SRCALPHA)
+    for i in range(camadas):
+        alpha_camada = alpha // (i + 1)
+        if alpha_camada > 0:
+            pygame.draw.circle(surf, cor + (alpha_camada,), (raio, raio), max(1, raio - i * recuo))
+    return surf
+
+
+def obter_gradiente(tipo, raio, cor, alpha, escala=1):
+    chave = chave_gradiente(tipo, raio, cor, alpha, escala)
+    return cache_luzes.obter(chave, renderizar_gradiente, *chave)
+
+
+# == FEIXES DE LASER PERSISTENTES ==
+BRILHOS_POR_FEIXE = 96
+FAISCAS_POR_FEIXE = 160
+CICLO_BRILHO_FEIXE = 600  # ms até um brilho do feixe encolher e renascer
+VIDA_FAISCA_FEIXE = 800  # ms de vida de cada faísca antes de reaparecer na origem
+COR_FAISCA_LASER = (255, 50, 50)
+
+
+class FeixeLaser:
+    """Efeito de um laser que vive enquanto o dono o mantém ativo - brilhos e faíscas são sorteados uma vez"""
+
+    def __init__(self, cor, largura, duracao, alcance_faiscas=None):
+        self.cor = cor
+        self.largura = largura
+        self.duracao = duracao  # Esmaecimento depois que o dono para de manter o feixe
+        self.alcance_faiscas = alcance_faiscas  # Faíscas só nos primeiros N pixels (None = feixe inteiro)
+        self.start_pos = (0, 0)
+        self.end_pos = (0, 0)
+        self.ultimo_refresh = relogio.agora
+
+        # (posição ao longo do feixe 0-1, desvio x, desvio y, raio, intensidade, fase)
+        self.brilhos = [
+            (i / BRILHOS_POR_FEIXE, random.uniform(-8, 8), random.uniform(-8, 8),
+             random.uniform(4, 10), random.uniform(0.6, 0.9), random.uniform(0, CICLO_BRILHO_FEIXE))
+            for i in range(BRILHOS_POR_FEIXE)
+        ]
+        # (posição ao longo do feixe 0-1, desvio x, velocidade x, velocidade y, tamanho, fase)
+        self.faiscas = [
+            (random.random(), random.uniform(-12, 12), random.uniform(-2, 2), random.uniform(-1, 1),
+             random.uniform(2, 4), random.uniform(0, VIDA_FAISCA_FEIXE))
+            for _ in range(FAISCAS_POR_FEIXE)
+        ]
+
+    def manter(self, start_pos, end_pos):
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        self.ultimo_refresh = relogio.agora
+
+    def alpha(self, tempo_atual):
+        return max(0, int(255 * (1 - (tempo_atual - self.ultimo_refresh) / self.duracao)))
+
+    def desenhar_rastro(self, surface, tempo_atual):
+        alpha = self.alpha(tempo_atual)
+        if alpha > 0:
+            pygame.draw.line(surface, self.cor + (alpha // 2,), self.start_pos, self.end_pos,
+                             max(1, self.largura // 2))
+
+    def acumular_brilhos(self, lightmap, escala, tempo_atual):
+        """Soma os brilhos do feixe no lightmap; retorna se algo foi desenhado"""
+        alpha = self.alpha(tempo_atual)
+        if alpha <= 0:
+            return False
+
+        (sx, sy), (ex, ey) = self.start_pos, self.end_pos
+        for u, dx, dy, raio, intensidade, fase in self.brilhos:
+            progresso = ((tempo_atual + fase) % CICLO_BRILHO_FEIXE) / CICLO_BRILHO_FEIXE
+            raio_atual = int(raio * (1 - progresso))
+            alpha_brilho = int(alpha * (1 - progresso) * intensidade)
+            if raio_atual < escala or alpha_brilho <= 0:
+                continue
+
+            sprite = obter_gradiente("brilho", raio_atual, self.cor, alpha_brilho, escala)
+            meio = sprite.get_width() // 2
+            x = sx + (ex - sx) * u + dx
+            y = sy + (ey - sy) * u + dy
+            lightmap.blit(sprite, (x // escala - meio, y // escala - meio), special_flags=pygame.BLEND_ADD)
+        return True
+
+    def desenhar_faiscas(self, surface, tempo_atual):
+        alpha = self.alpha(tempo_atual)
+        if alpha <= 0:
+            return
+
+        (sx, sy), (ex, ey) = self.start_pos, self.end_pos
+        comprimento = math.hypot(ex - sx, ey - sy)
+        alcance = 1.0
+        if self.alcance_faiscas is not None and comprimento > 0:
+            alcance = min(1.0, self.alcance_faiscas / comprimento)
+
+        lote = []
+        for u, dx, vx, vy, tamanho, fase in self.faiscas:
+            idade = (tempo_atual + fase) % VIDA_FAISCA_FEIXE
+            progresso = idade / VIDA_FAISCA_FEIXE
+            passos = idade / PASSO_SIMULACAO
+            x = sx + (ex - sx) * u * alcance + dx + vx * passos
+            y = sy + (ey - sy) * u * alcance + vy * passos
+            tamanho_atual = tamanho * (0.9 + 0.2 * math.sin(progresso * 20))
+            adicionar_forma_particula(lote, "laser", x, y, tamanho_atual, 0, COR_FAISCA_LASER,
+                                      int(alpha * (1 - progresso)), tempo_atual)
+        surface.blits(lote, False)
+
+
 class EfeitosVisuais:
     def __init__(self):
-        self.brilho_buffer = pygame.Surface((largura, altura), pygame.SRCALPHA)
+        # Lightmap: luzes e brilhos somados em baixa resolução, ampliados para brilho_buffer
+        self.escala_lightmap = max(1, CONFIG_QUALIDADE["escala_lightmap"])
+        self.lightmap = pygame.Surface((largura // self.escala_lightmap, altura // self.escala_lightmap))
+        self.brilho_buffer = pygame.Surface((largura, altura))
         self.particulas_brilho = []
         self.luzes_dinamicas = []
-        self.scanlines = pygame.Surface((largura, altura), pygame.SRCALPHA)
-        self.inicializar_scanlines()
-        self.rastros_laser = []
-
-    def inicializar_scanlines(self):
-        """Cria efeito de scanlines para dar profundidade"""
-        for y in range(0, altura, 4):
-            pygame.draw.line(self.scanlines, (0, 0, 0, 15), (0, y), (largura, y))
+        self.feixes = {}  # dono -> FeixeLaser
 
     def criar_brilho(self, x, y, cor, raio=50, duracao=1000, intensidade=1.0):
         """Cria um efeito de brilho com partículas de luz"""
         if isinstance(cor, tuple) and len(cor) == 3:
             self.particulas_brilho.append({
                 'x': x, 'y': y, 'cor': cor, 'raio': raio,
-                'tempo_inicio': pygame.time.get_ticks(),
+                'tempo_inicio': relogio.agora,
                 'duracao': duracao,
                 'intensidade': intensidade
             })
@@ -77,7 +406,7 @@ class EfeitosVisuais:
         self.luzes_dinamicas.append({
             'x': x, 'y': y, 'cor': cor, 'raio': raio,
             'raio_base': raio,
-            'tempo_inicio': pygame.time.get_ticks(),
+            'tempo_inicio': relogio.agora,
             'duracao': duracao,
             'pulsante': pulsante,
             'alpha': 255
@@ -89,50 +418,21 @@ class EfeitosVisuais:
             self.particulas_brilho.append({
                 'x': x, 'y': y, 'cor': cor,
                 'raio': 10 + i * 20,
-                'tempo_inicio': pygame.time.get_ticks() + i * 100,
+                'tempo_inicio': relogio.agora + i * 100,
                 'duracao': duracao,
                 'intensidade': 0.8 - i * 0.2
             })
 
-    def criar_rastro_laser(self, start_pos, end_pos, cor, largura=10, duracao=300):
-        """Cria um rastro para lasers - EFEITO MELHORADO"""
-        tempo_atual = pygame.time.get_ticks()
-
-        # Adicionar ao sistema de rastros
-        self.rastros_laser.append({
-            'start_pos': start_pos,
-            'end_pos': end_pos,
-            'cor': cor,
-            'largura': largura,
-            'tempo_inicio': tempo_atual,
-            'duracao': duracao
-        })
-
-        # Criar partículas ao longo do laser
-        distancia = math.sqrt((end_pos[0] - start_pos[0]) ** 2 + (end_pos[1] - start_pos[1]) ** 2)
-        num_particulas = max(5, int(distancia / 8))
-
-        for i in range(num_particulas):
-            progresso = i / num_particulas
-            x = start_pos[0] + (end_pos[0] - start_pos[0]) * progresso
-            y = start_pos[1] + (end_pos[1] - start_pos[1]) * progresso
-
-            # Adicionar variação aleatória
-            variacao_x = random.uniform(-8, 8)
-            variacao_y = random.uniform(-8, 8)
-
-            self.particulas_brilho.append({
-                'x': x + variacao_x,
-                'y': y + variacao_y,
-                'cor': cor,
-                'raio': random.uniform(4, 10),
-                'tempo_inicio': tempo_atual + random.randint(0, 100),
-                'duracao': duracao + random.randint(0, 200),
-                'intensidade': random.uniform(0.6, 0.9)
-            })
+    def manter_feixe(self, dono, start_pos, end_pos, cor, largura=10, duracao=300, alcance_faiscas=None):
+        """Mantém vivo o feixe de laser do dono, criando-o na primeira chamada"""
+        feixe = self.feixes.get(dono)
+        if feixe is None:
+            feixe = FeixeLaser(cor, largura, duracao, alcance_faiscas)
+            self.feixes[dono] = feixe
+        feixe.manter(start_pos, end_pos)
 
     def atualizar_brilhos(self):
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
 
         # Atualizar partículas de brilho
         self.particulas_brilho = [brilho for brilho in self.particulas_brilho
@@ -153,91 +453,237 @@ class EfeitosVisuais:
                 novas_luzes.append(luz)
         self.luzes_dinamicas = novas_luzes
 
-        # Atualizar rastros de laser
-        self.rastros_laser = [rastro for rastro in self.rastros_laser
-                              if tempo_atual - rastro['tempo_inicio'] < rastro['duracao']]
+        # Remover feixes que já esmaeceram
+        for dono in [dono for dono, feixe in self.feixes.items() if feixe.alpha(tempo_atual) <= 0]:
+            del self.feixes[dono]
 
     def desenhar_brilhos(self, surface):
-        # Desenhar luzes dinâmicas primeiro (como base)
-        for luz in self.luzes_dinamicas:
-            surf_luz = pygame.Surface((luz['raio'] * 2, luz['raio'] * 2), pygame.SRCALPHA)
+        tempo_atual = relogio.agora
 
-            # Gradiente radial para luz - MELHORADO
-            for i in range(4):
-                alpha = max(0, luz['alpha'] // (i + 1))
-                if alpha > 0:
-                    raio_camada = max(1, luz['raio'] - i * 12)
-                    cor_luz = luz['cor'] + (alpha,)
-                    pygame.draw.circle(surf_luz, cor_luz,
-                                       (luz['raio'], luz['raio']), raio_camada)
-
-            surface.blit(surf_luz, (luz['x'] - luz['raio'], luz['y'] - luz['raio']),
-                         special_flags=pygame.BLEND_ADD)
-
-        # Desenhar rastros de laser
-        for rastro in self.rastros_laser:
-            tempo_atual = pygame.time.get_ticks()
-            progresso = (tempo_atual - rastro['tempo_inicio']) / rastro['duracao']
-            alpha = max(0, int(255 * (1 - progresso)))
+        # Desenhar rastros dos feixes de laser
+        for feixe in self.feixes.values():
+            feixe.desenhar_rastro(surface, tempo_atual)
 
-            if alpha > 0:
-                # Desenhar linha de rastro
-                cor_rastro = rastro['cor'] + (alpha // 2,)
-                pygame.draw.line(surface, cor_rastro,
-                                 rastro['start_pos'], rastro['end_pos'],
-                                 max(1, rastro['largura'] // 2))
+        # Faíscas dos feixes
+        for feixe in self.feixes.values():
+            feixe.desenhar_faiscas(surface, tempo_atual)
+
+    def compor_lightmap(self, surface):
+        """Luzes e brilhos vão para o lightmap e entram na tela num único blit aditivo"""
+        if not self.acumular_lightmap(relogio.agora):
+            return
+        if self.escala_lightmap > 1:
+            if CONFIG_QUALIDADE["lightmap_suave"]:
+                pygame.transform.smoothscale(self.lightmap, (largura, altura), self.brilho_buffer)
+            else:
+                pygame.transform.scale(self.lightmap, (largura, altura), self.brilho_buffer)
+            surface.blit(self.brilho_buffer, (0, 0), special_flags=pygame.BLEND_ADD)
+        else:
+            surface.blit(self.lightmap, (0, 0), special_flags=pygame.BLEND_ADD)
 
-        # Desenhar partículas de brilho
+    def acumular_lightmap(self, tempo_atual):
+        """Soma luzes dinâmicas e brilhos no lightmap em baixa resolução; retorna se algo foi desenhado"""
+        escala = self.escala_lightmap
+        self.lightmap.fill((0, 0, 0))
+        desenhou = False
+
+        # Luzes dinâmicas primeiro (como base) - gradiente radial do cache
+        for luz in self.luzes_dinamicas:
+            if luz['alpha'] <= 0 or luz['raio'] < escala:
+                continue
+            surf_luz = obter_gradiente("luz", luz['raio'], luz['cor'], luz['alpha'], escala)
+            meio = surf_luz.get_width() // 2
+            self.lightmap.blit(surf_luz, (luz['x'] // escala - meio, luz['y'] // escala - meio),
+                               special_flags=pygame.BLEND_ADD)
+            desenhou = True
+
+        # Partículas de brilho e anéis das ondas de choque
         for brilho in self.particulas_brilho:
-            tempo_atual = pygame.time.get_ticks()
             progresso = (tempo_atual - brilho['tempo_inicio']) / brilho['duracao']
+            if progresso < 0:
+                continue  # Anéis atrasados da onda de choque ainda não começaram
             alpha = max(0, int(255 * (1 - progresso) * brilho['intensidade']))
             raio_atual = int(brilho['raio'] * (1 - progresso))
 
-            if isinstance(brilho['cor'], tuple) and len(brilho['cor']) == 3 and alpha > 0:
-                surf_brilho = pygame.Surface((raio_atual * 2, raio_atual * 2), pygame.SRCALPHA)
+            if isinstance(brilho['cor'], tuple) and len(brilho['cor']) == 3 and alpha > 0 and raio_atual >= escala:
+                surf_brilho = obter_gradiente("brilho", raio_atual, brilho['cor'], alpha, escala)
+                meio = surf_brilho.get_width() // 2
+                self.lightmap.blit(surf_brilho, (brilho['x'] // escala - meio, brilho['y'] // escala - meio),
+                                   special_flags=pygame.BLEND_ADD)
+                desenhou = True
 
-                # Efeito de brilho com múltiplas camadas - MELHORADO
-                for i in range(5):
-                    alpha_camada = max(0, alpha // (i + 1))
-                    if alpha_camada > 0:
-                        cor_brilho = brilho['cor'] + (alpha_camada,)
-                        raio_camada = max(1, raio_atual - i * 6)
-                        pygame.draw.circle(surf_brilho, cor_brilho,
-                                           (raio_atual, raio_atual), raio_camada)
+        # Brilhos pré-sorteados dos feixes de laser
+        for feixe in self.feixes.values():
+            desenhou = feixe.acumular_brilhos(self.lightmap, escala, tempo_atual) or desenhou
 
-                surface.blit(surf_brilho, (brilho['x'] - raio_atual, brilho['y'] - raio_atual),
-                             special_flags=pygame.BLEND_ADD)
-
-        # Aplicar scanlines
-        surface.blit(self.scanlines, (0, 0))
+        return desenhou
 
 
 efeitos = EfeitosVisuais()
 
 
 # == SISTEMA DE PARTÍCULAS SUPER AVANÇADO ==
+TIPOS_PARTICULA = ("normal", "fumaca", "faisca", "estrela", "energia", "cristal", "laser")
+TIPOS_COM_RASTRO = ("estrela", "faisca", "laser")
+TIPOS_COM_ROTACAO = ("estrela", "cristal", "laser")
+
+# Quantização das chaves do cache de formas
+PASSOS_ROTACAO_PARTICULA = 8
+SIMETRIA_ROTACAO_PARTICULA = {"estrela": 72, "cristal": 90}
+
+cache_particulas = CacheSprites(8000)
+
+
+def chave_forma_particula(tipo, tamanho, rotacao, cor, alpha):
+    """Quantiza tamanho, rotação, cor e alpha para reaproveitar sprites entre partículas"""
+    tamanho_q = max(2, int(tamanho * 2 + 0.5))  # meio pixel
+
+    simetria = SIMETRIA_ROTACAO_PARTICULA.get(tipo)
+    if simetria:
+        passo = simetria / PASSOS_ROTACAO_PARTICULA
+        rotacao_q = int((rotacao % simetria) / passo + 0.5) % PASSOS_ROTACAO_PARTICULA
+    else:
+        rotacao_q = 0
+
+    cor_q = (int(cor[0]) >> 5, int(cor[1]) >> 5, int(cor[2]) >> 5)
+    return tipo, tamanho_q, rotacao_q, cor_q, alpha >> 4
+
+
+def renderizar_forma_particula(tipo, tamanho_q, rotacao_q, cor_q, alpha_q):
+    """Renderiza uma variante de partícula numa superfície nova (só em falhas do cache)"""
+    tamanho = tamanho_q / 2
+    cor = (cor_q[0] * 255 // 7, cor_q[1] * 255 // 7, cor_q[2] * 255 // 7)
+    alpha = alpha_q * 17
+    cor_com_alpha = cor + (alpha,)
+
+    if tipo == "estrela":
+        rotacao = rotacao_q * SIMETRIA_ROTACAO_PARTICULA["estrela"] / PASSOS_ROTACAO_PARTICULA
+        surf = pygame.Surface((tamanho * 3, tamanho * 3), pygame.SRCALPHA)
+        pontos = []
+        for i in range(5):
+            angulo = math.radians(rotacao + i * 72)
+            raio_externo = tamanho
+            raio_interno = max(1, tamanho * 0.4)
+
+            x_ext = tamanho * 1.5 + math.cos(angulo) * raio_externo
+            y_ext = tamanho * 1.5 + math.sin(angulo) * raio_externo
+            pontos.append((x_ext, y_ext))
+
+            x_int = tamanho * 1.5 + math.cos(angulo + math.radians(36)) * raio_interno
+            y_int = tamanho * 1.5 + math.sin(angulo + math.radians(36)) * raio_interno
+            pontos.append((x_int, y_int))
+
+        pygame.draw.polygon(surf, cor_com_alpha, pontos)
+
+    elif tipo == "cristal":
+        rotacao = math.radians(rotacao_q * SIMETRIA_ROTACAO_PARTICULA["cristal"] / PASSOS_ROTACAO_PARTICULA)
+        surf = pygame.Surface((tamanho * 2, tamanho * 2), pygame.SRCALPHA)
+        pontos = [
+            (tamanho, 0),
+            (tamanho * 2, tamanho),
+            (tamanho, tamanho * 2),
+            (0, tamanho)
+        ]
+        pontos_rotacionados = []
+        for px, py in pontos:
+            px -= tamanho
+            py -= tamanho
+            px_rot = px * math.cos(rotacao) - py * math.sin(rotacao)
+            py_rot = px * math.sin(rotacao) + py * math.cos(rotacao)
+            pontos_rotacionados.append((px_rot + tamanho, py_rot + tamanho))
+
+        pygame.draw.polygon(surf, cor_com_alpha, pontos_rotacionados)
+
+    elif tipo == "energia":
+        surf = pygame.Surface((tamanho * 2, tamanho * 2), pygame.SRCALPHA)
+
+        # Núcleo brilhante
+        pygame.draw.circle(surf, cor_com_alpha, (tamanho, tamanho), max(1, tamanho))
+
+        # Aurora externa
+        for i in range(2):
+            alpha_aurora = max(0, alpha // (i + 2))
+            if alpha_aurora > 0:
+                cor_aurora = cor + (alpha_aurora,)
+                pygame.draw.circle(surf, cor_aurora, (tamanho, tamanho),
+                                   max(1, tamanho + 2 + i * 3), 2)
+
+    elif tipo == "laser":
+        # Partícula especial para efeitos de laser
+        surf = pygame.Surface((tamanho * 2, tamanho * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, cor_com_alpha, (tamanho, tamanho), max(1, tamanho))
+
+        # Brilho extra para partículas de laser
+        for i in range(2):
+            alpha_brilho = max(0, alpha // (i + 3))
+            if alpha_brilho > 0:
+                cor_brilho = cor + (alpha_brilho,)
+                pygame.draw.circle(surf, cor_brilho, (tamanho, tamanho),
+                                   max(1, tamanho + 1 + i * 2))
+
+    else:
+        surf = pygame.Surface((tamanho * 2, tamanho * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, cor_com_alpha, (tamanho, tamanho), max(1, tamanho))
+
+    return surf
+
+
+def obter_sprite_particula(tipo, tamanho, rotacao, cor, alpha):
+    chave = chave_forma_particula(tipo, tamanho, rotacao, cor, alpha)
+    return cache_particulas.obter(chave, renderizar_forma_particula, *chave)
+
+
+def adicionar_ponto_rastro(lote, x, y, tamanho, cor, alpha):
+    """Adiciona um ponto de rastro (sprite já desbotado) ao lote de blits do frame"""
+    sprite = obter_sprite_particula("normal", tamanho, 0, cor, alpha)
+    lote.append((sprite, (int(x - sprite.get_width() / 2), int(y - sprite.get_height() / 2))))
+
+
+def adicionar_forma_particula(lote, tipo, x, y, tamanho, rotacao, cor, alpha, tempo_atual):
+    """Adiciona a forma de uma partícula (sprite do cache) ao lote de blits do frame"""
+    if tipo == "energia":
+        # Partícula de energia com efeito pulsante
+        pulsacao = 0.5 + 0.5 * math.sin(tempo_atual * 0.02)
+        tamanho = tamanho * (0.8 + 0.4 * pulsacao)
+
+    sprite = obter_sprite_particula(tipo, tamanho, rotacao, cor, alpha)
+    lote.append((sprite, (int(x - sprite.get_width() / 2), int(y - sprite.get_height() / 2))))
+
+
 class ParticulaAvancada:
+    __slots__ = ("x", "y", "cor", "velocidade_x", "velocidade_y", "vida_util", "tempo_inicio",
+                 "tamanho", "tamanho_original", "tipo", "gravidade", "rotacao",
+                 "velocidade_rotacao", "trail", "trail_pos", "trail_tamanho", "max_trail", "prioridade")
+
     def __init__(self, x, y, cor, velocidade_x=0, velocidade_y=0,
-                 vida_util=1000, tamanho=3, tipo="normal", gravidade=0, rotacao=0):
+                 vida_util=1000, tamanho=3, tipo="normal", gravidade=0, rotacao=0, prioridade=0):
+        self.max_trail = CONFIG_QUALIDADE["rastro_particulas"]
+        self.trail = [(0.0, 0.0)] * self.max_trail  # Buffer circular para partículas com rastro
+        self.reiniciar(x, y, cor, velocidade_x, velocidade_y, vida_util, tamanho, tipo, gravidade, rotacao,
+                       prioridade)
+
+    def reiniciar(self, x, y, cor, velocidade_x=0, velocidade_y=0,
+                  vida_util=1000, tamanho=3, tipo="normal", gravidade=0, rotacao=0, prioridade=0):
+        """Reinicia a partícula com novos valores - usado ao reciclar do pool"""
         self.x = x
         self.y = y
         self.cor = cor if isinstance(cor, tuple) and len(cor) == 3 else (255, 255, 255)
         self.velocidade_x = velocidade_x
         self.velocidade_y = velocidade_y
         self.vida_util = vida_util
-        self.tempo_inicio = pygame.time.get_ticks()
+        self.tempo_inicio = relogio.agora
         self.tamanho = max(1, tamanho)
         self.tamanho_original = self.tamanho
         self.tipo = tipo
         self.gravidade = gravidade
         self.rotacao = rotacao if rotacao != 0 else random.uniform(0, 360)
         self.velocidade_rotacao = random.uniform(-5, 5)
-        self.trail = []  # Para partículas com rastro
-        self.max_trail = 5
+        self.prioridade = prioridade
+        self.trail_pos = 0
+        self.trail_tamanho = 0
 
     def atualizar(self):
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
         tempo_decorrido_part = tempo_atual - self.tempo_inicio
 
         if tempo_decorrido_part > self.vida_util:
@@ -249,12 +695,13 @@ class ParticulaAvancada:
         self.velocidade_y += self.gravidade
 
         # Adicionar posição ao rastro
-        if self.tipo in ["estrela", "faisca", "laser"]:
-            self.trail.append((self.x, self.y))
-            if len(self.trail) > self.max_trail:
-                self.trail.pop(0)
+        if self.max_trail and self.tipo in TIPOS_COM_RASTRO:
+            self.trail_pos = (self.trail_pos + 1) % self.max_trail
+            self.trail[self.trail_pos] = (self.x, self.y)
+            if self.trail_tamanho < self.max_trail:
+                self.trail_tamanho += 1
 
-        if self.tipo in ["estrela", "cristal", "laser"]:
+        if self.tipo in TIPOS_COM_ROTACAO:
             self.rotacao += self.velocidade_rotacao
 
         progresso = tempo_decorrido_part / self.vida_util
@@ -273,117 +720,428 @@ class ParticulaAvancada:
 
         return True
 
-    def desenhar(self, surface):
-        tempo_decorrido_part = pygame.time.get_ticks() - self.tempo_inicio
+    def adicionar_aos_lotes(self, lote_rastros, lote_formas, tempo_atual):
+        tempo_decorrido_part = tempo_atual - self.tempo_inicio
         progresso = tempo_decorrido_part / self.vida_util
         alpha = max(0, int(255 * (1 - progresso)))
 
         if alpha <= 0:
             return
 
-        cor_com_alpha = self.cor + (alpha,)
+        # Rastro do ponto mais antigo ao mais recente (o mais antigo tem alpha zero)
+        total = self.trail_tamanho
+        for i in range(1, total):
+            trail_alpha = int(alpha * (i / total) * 0.5)
+            if trail_alpha > 0:
+                trail_x, trail_y = self.trail[(self.trail_pos - (total - 1 - i)) % self.max_trail]
+                adicionar_ponto_rastro(lote_rastros, trail_x, trail_y, self.tamanho * (i / total),
+                                       self.cor, trail_alpha)
 
-        # Desenhar rastro primeiro (se houver)
-        if self.trail and self.tipo in ["estrela", "faisca", "laser"]:
-            for i, (trail_x, trail_y) in enumerate(self.trail):
-                trail_alpha = alpha * (i / len(self.trail)) * 0.5
-                trail_cor = self.cor + (int(trail_alpha),)
-                trail_size = self.tamanho * (i / len(self.trail))
+        adicionar_forma_particula(lote_formas, self.tipo, self.x, self.y, self.tamanho,
+                                  self.rotacao, self.cor, alpha, tempo_atual)
 
-                surf_trail = pygame.Surface((trail_size * 2, trail_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(surf_trail, trail_cor, (trail_size, trail_size), max(1, trail_size))
-                surface.blit(surf_trail, (int(trail_x - trail_size), int(trail_y - trail_size)))
+    def desenhar(self, surface):
+        lote_rastros = []
+        lote_formas = []
+        self.adicionar_aos_lotes(lote_rastros, lote_formas, relogio.agora)
+        surface.blits(lote_rastros, False)
+        surface.blits(lote_formas, False)
 
-        if self.tipo == "estrela":
-            surf = pygame.Surface((self.tamanho * 3, self.tamanho * 3), pygame.SRCALPHA)
-            pontos = []
-            for i in range(5):
-                angulo = math.radians(self.rotacao + i * 72)
-                raio_externo = self.tamanho
-                raio_interno = max(1, self.tamanho * 0.4)
-
-                x_ext = self.tamanho * 1.5 + math.cos(angulo) * raio_externo
-                y_ext = self.tamanho * 1.5 + math.sin(angulo) * raio_externo
-                pontos.append((x_ext, y_ext))
-
-                x_int = self.tamanho * 1.5 + math.cos(angulo + math.radians(36)) * raio_interno
-                y_int = self.tamanho * 1.5 + math.sin(angulo + math.radians(36)) * raio_interno
-                pontos.append((x_int, y_int))
-
-            pygame.draw.polygon(surf, cor_com_alpha, pontos)
-            surface.blit(surf, (int(self.x - self.tamanho * 1.5), int(self.y - self.tamanho * 1.5)))
-
-        elif self.tipo == "cristal":
-            surf = pygame.Surface((self.tamanho * 2, self.tamanho * 2), pygame.SRCALPHA)
-            pontos = [
-                (self.tamanho, 0),
-                (self.tamanho * 2, self.tamanho),
-                (self.tamanho, self.tamanho * 2),
-                (0, self.tamanho)
-            ]
-            pontos_rotacionados = []
-            for px, py in pontos:
-                px -= self.tamanho
-                py -= self.tamanho
-                px_rot = px * math.cos(math.radians(self.rotacao)) - py * math.sin(math.radians(self.rotacao))
-                py_rot = px * math.sin(math.radians(self.rotacao)) + py * math.cos(math.radians(self.rotacao))
-                pontos_rotacionados.append((px_rot + self.tamanho, py_rot + self.tamanho))
-
-            pygame.draw.polygon(surf, cor_com_alpha, pontos_rotacionados)
-            surface.blit(surf, (int(self.x - self.tamanho), int(self.y - self.tamanho)))
-
-        elif self.tipo == "energia":
-            # Partícula de energia com efeito pulsante
-            pulsacao = 0.5 + 0.5 * math.sin(pygame.time.get_ticks() * 0.02)
-            tamanho_pulsante = self.tamanho * (0.8 + 0.4 * pulsacao)
-
-            surf = pygame.Surface((tamanho_pulsante * 2, tamanho_pulsante * 2), pygame.SRCALPHA)
-
-            # Núcleo brilhante
-            pygame.draw.circle(surf, cor_com_alpha,
-                               (tamanho_pulsante, tamanho_pulsante),
-                               max(1, tamanho_pulsante))
-
-            # Aurora externa
-            for i in range(2):
-                alpha_aurora = max(0, alpha // (i + 2))
-                if alpha_aurora > 0:
-                    cor_aurora = self.cor + (alpha_aurora,)
-                    pygame.draw.circle(surf, cor_aurora,
-                                       (tamanho_pulsante, tamanho_pulsante),
-                                       max(1, tamanho_pulsante + 2 + i * 3), 2)
-
-            surface.blit(surf, (int(self.x - tamanho_pulsante), int(self.y - tamanho_pulsante)))
 
-        elif self.tipo == "laser":
-            # Partícula especial para efeitos de laser
-            surf = pygame.Surface((self.tamanho * 2, self.tamanho * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, cor_com_alpha, (self.tamanho, self.tamanho), max(1, self.tamanho))
+class PoolParticulas:
+    """Pool de ParticulaAvancada com lista livre - partículas mortas são recicladas"""
+
+    def __init__(self):
+        self.livres = []
+        self.em_uso = 0
+        self.pico = 0
+        self.alocacoes = 0
+        self.reusos = 0
+        self.alocacoes_frame = 0
+        self.alocacoes_ultimo_frame = 0
+
+    def obter(self, *args):
+        if self.livres:
+            particula = self.livres.pop()
+            particula.reiniciar(*args)
+            self.reusos += 1
+        else:
+            particula = ParticulaAvancada(*args)
+            self.alocacoes += 1
+            self.alocacoes_frame += 1
 
-            # Brilho extra para partículas de laser
-            for i in range(2):
-                alpha_brilho = max(0, alpha // (i + 3))
-                if alpha_brilho > 0:
-                    cor_brilho = self.cor + (alpha_brilho,)
-                    pygame.draw.circle(surf, cor_brilho, (self.tamanho, self.tamanho),
-                                       max(1, self.tamanho + 1 + i * 2))
+        self.em_uso += 1
+        if self.em_uso > self.pico:
+            self.pico = self.em_uso
+        return particula
 
-            surface.blit(surf, (int(self.x - self.tamanho), int(self.y - self.tamanho)))
+    def devolver(self, particula):
+        self.livres.append(particula)
+        self.em_uso -= 1
 
-        else:
-            surf = pygame.Surface((self.tamanho * 2, self.tamanho * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, cor_com_alpha, (self.tamanho, self.tamanho), max(1, self.tamanho))
-            surface.blit(surf, (int(self.x - self.tamanho), int(self.y - self.tamanho)))
+    def iniciar_frame(self):
+        self.alocacoes_ultimo_frame = self.alocacoes_frame
+        self.alocacoes_frame = 0
+
+    def estatisticas(self):
+        total = self.alocacoes + self.reusos
+        return {
+            'em_uso': self.em_uso,
+            'livres': len(self.livres),
+            'pico': self.pico,
+            'alocacoes': self.alocacoes,
+            'taxa_reuso': self.reusos / total if total else 0.0,
+            'alocacoes_por_frame': self.alocacoes_ultimo_frame
+        }
+
+
+class SistemaParticulasObjetos:
+    """Sistema de partículas em Python puro (um objeto por partícula, vindo de um pool)"""
+
+    def __init__(self):
+        self.particulas = []
+        self.pool = PoolParticulas()
+
+    def __len__(self):
+        return len(self.particulas)
+
+    def emitir(self, x, y, cor, velocidade_x=0, velocidade_y=0,
+               vida_util=1000, tamanho=3, tipo="normal", gravidade=0, rotacao=0, prioridade=0):
+        self.particulas.append(self.pool.obter(x, y, cor, velocidade_x, velocidade_y,
+                                               vida_util, tamanho, tipo, gravidade, rotacao, prioridade))
+
+    def despejar(self, quantidade, prioridade):
+        """Remove as partículas mais antigas com prioridade menor que a informada"""
+        candidatas = [particula for particula in self.particulas if particula.prioridade < prioridade]
+        if not candidatas:
+            return 0
+
+        candidatas.sort(key=lambda particula: particula.tempo_inicio)
+        remover = {id(particula) for particula in candidatas[:quantidade]}
+        for particula in candidatas[:quantidade]:
+            self.pool.devolver(particula)
+        self.particulas = [particula for particula in self.particulas if id(particula) not in remover]
+        return len(remover)
+
+    def iniciar_frame(self):
+        """Fecha as contagens do frame renderizado anterior (chamado uma vez por frame, não por passo)"""
+        self.pool.iniciar_frame()
+
+    def atualizar(self):
+        # Remoção por troca com a última: O(1) por partícula morta (a ordem não importa)
+        lista = self.particulas
+        i = 0
+        while i < len(lista):
+            particula = lista[i]
+            if particula.atualizar():
+                i += 1
+                continue
+
+            ultima = lista.pop()
+            if i < len(lista):
+                lista[i] = ultima
+            self.pool.devolver(particula)
+
+    def desenhar(self, surface):
+        tempo_atual = relogio.agora
+        lote_rastros = []
+        lote_formas = []
+        for particula in self.particulas:
+            particula.adicionar_aos_lotes(lote_rastros, lote_formas, tempo_atual)
+
+        # Todos os rastros em uma única passada, depois todas as formas
+        surface.blits(lote_rastros, False)
+        surface.blits(lote_formas, False)
+
+    def clear(self):
+        for particula in self.particulas:
+            self.pool.devolver(particula)
+        self.particulas.clear()
+
+    def estatisticas(self):
+        return self.pool.estatisticas()
+
+
+class SistemaParticulasVetorizado:
+    """Sistema de partículas em arrays NumPy (struct-of-arrays) atualizado em um único passo"""
+
+    def __init__(self, capacidade=2048):
+        self.capacidade = capacidade
+        self.quantidade = 0
+
+        self.x = np.zeros(capacidade, np.float32)
+        self.y = np.zeros(capacidade, np.float32)
+        self.velocidade_x = np.zeros(capacidade, np.float32)
+        self.velocidade_y = np.zeros(capacidade, np.float32)
+        self.gravidade = np.zeros(capacidade, np.float32)
+        self.tamanho = np.ones(capacidade, np.float32)
+        self.tamanho_original = np.ones(capacidade, np.float32)
+        self.rotacao = np.zeros(capacidade, np.float32)
+        self.velocidade_rotacao = np.zeros(capacidade, np.float32)
+        self.tempo_inicio = np.zeros(capacidade, np.int64)
+        self.vida_util = np.ones(capacidade, np.float32)
+        self.cor = np.zeros((capacidade, 3), np.uint8)
+        self.tipo = np.zeros(capacidade, np.int8)
+        self.prioridade = np.zeros(capacidade, np.int8)
+
+        # Rastro: buffer circular com as últimas posições de cada partícula. Todas as partículas
+        # gravam no mesmo índice a cada frame, então a posição de escrita é única para o sistema
+        self.max_rastro = CONFIG_QUALIDADE["rastro_particulas"]
+        self.trail = np.zeros((capacidade, self.max_rastro, 2), np.float32)
+        self.trail_tamanho = np.zeros(capacidade, np.int8)
+        self.trail_pos = 0
+
+        # Tabelas de comportamento indexadas pelo código do tipo
+        self.tipo_tem_rastro = np.array([t in TIPOS_COM_RASTRO for t in TIPOS_PARTICULA])
+        self.tipo_tem_rotacao = np.array([t in TIPOS_COM_ROTACAO for t in TIPOS_PARTICULA])
+        self.codigo_tipo = {tipo: codigo for codigo, tipo in enumerate(TIPOS_PARTICULA)}
+
+        self.arrays = [self.x, self.y, self.velocidade_x, self.velocidade_y, self.gravidade,
+                       self.tamanho, self.tamanho_original, self.rotacao, self.velocidade_rotacao,
+                       self.tempo_inicio, self.vida_util, self.cor, self.tipo, self.prioridade,
+                       self.trail, self.trail_tamanho]
+
+    def __len__(self):
+        return self.quantidade
+
+    def emitir(self, x, y, cor, velocidade_x=0, velocidade_y=0,
+               vida_util=1000, tamanho=3, tipo="normal", gravidade=0, rotacao=0, prioridade=0):
+        """Adiciona uma partícula - mesma assinatura de ParticulaAvancada"""
+        if self.quantidade >= self.capacidade:
+            return False
+
+        i = self.quantidade
+        self.x[i] = x
+        self.y[i] = y
+        self.velocidade_x[i] = velocidade_x
+        self.velocidade_y[i] = velocidade_y
+        self.gravidade[i] = gravidade
+        self.tamanho[i] = self.tamanho_original[i] = max(1, tamanho)
+        self.rotacao[i] = rotacao if rotacao != 0 else random.uniform(0, 360)
+        self.velocidade_rotacao[i] = random.uniform(-5, 5)
+        self.tempo_inicio[i] = relogio.agora
+        self.vida_util[i] = vida_util
+        self.cor[i] = cor if isinstance(cor, tuple) and len(cor) == 3 else (255, 255, 255)
+        self.tipo[i] = self.codigo_tipo.get(tipo, 0)
+        self.prioridade[i] = prioridade
+        self.trail_tamanho[i] = 0
+        self.quantidade += 1
+        return True
+
+    def atualizar(self):
+        n = self.quantidade
+        if n == 0:
+            return
+
+        tempo_decorrido = (relogio.agora - self.tempo_inicio[:n]).astype(np.float32)
+        vivas = tempo_decorrido <= self.vida_util[:n]
+
+        if not vivas.all():
+            indices = np.flatnonzero(vivas)
+            self.compactar(indices)
+            n = self.quantidade
+            tempo_decorrido = tempo_decorrido[indices]
+            if n == 0:
+                return
+
+        tipo = self.tipo[:n]
+
+        # Atualizar posição
+        self.x[:n] += self.velocidade_x[:n]
+        self.y[:n] += self.velocidade_y[:n]
+        self.velocidade_y[:n] += self.gravidade[:n]
+
+        # Adicionar posição ao rastro
+        com_rastro = np.flatnonzero(self.tipo_tem_rastro[tipo]) if self.max_rastro else []
+        if len(com_rastro):
+            self.trail_pos = (self.trail_pos + 1) % self.max_rastro
+            self.trail[com_rastro, self.trail_pos, 0] = self.x[com_rastro]
+            self.trail[com_rastro, self.trail_pos, 1] = self.y[com_rastro]
+            self.trail_tamanho[com_rastro] = np.minimum(self.trail_tamanho[com_rastro] + 1, self.max_rastro)
+
+        self.rotacao[:n] += self.velocidade_rotacao[:n] * self.tipo_tem_rotacao[tipo]
+
+        # Comportamentos diferentes por tipo
+        progresso = tempo_decorrido / self.vida_util[:n]
+        original = self.tamanho_original[:n]
+        codigo = self.codigo_tipo
+        self.tamanho[:n] = np.select(
+            [tipo == codigo["fumaca"], tipo == codigo["faisca"],
+             tipo == codigo["estrela"], tipo == codigo["laser"]],
+            [original * (1 + progresso * 0.5),
+             np.maximum(1, original * (1 - progresso * 2)),
+             original * (0.8 + 0.4 * np.sin(progresso * 10)),
+             original * (0.9 + 0.2 * np.sin(progresso * 20))],
+            np.maximum(1, original * (1 - progresso))
+        )
+
+    def compactar(self, indices):
+        """Move as partículas dos índices para o início dos arrays, sem remoção individual"""
+        n = len(indices)
+        for array in self.arrays:
+            array[:n] = array[indices]
+        self.quantidade = n
+
+    def despejar(self, quantidade, prioridade):
+        """Remove as partículas mais antigas com prioridade menor que a informada"""
+        n = self.quantidade
+        candidatas = np.flatnonzero(self.prioridade[:n] < prioridade)
+        if len(candidatas) == 0:
+            return 0
+
+        if len(candidatas) > quantidade:
+            mais_antigas = np.argpartition(self.tempo_inicio[candidatas], quantidade - 1)[:quantidade]
+            candidatas = candidatas[mais_antigas]
+
+        vivas = np.ones(n, bool)
+        vivas[candidatas] = False
+        self.compactar(np.flatnonzero(vivas))
+        return len(candidatas)
+
+    def desenhar(self, surface):
+        n = self.quantidade
+        if n == 0:
+            return
+
+        tempo_atual = relogio.agora
+        progresso = (tempo_atual - self.tempo_inicio[:n]) / self.vida_util[:n]
+        alphas = np.clip(255 * (1 - progresso), 0, 255).astype(np.int32)
+
+        # Converter para listas uma vez só - acesso elemento a elemento em NumPy é lento
+        xs = self.x[:n].tolist()
+        ys = self.y[:n].tolist()
+        tamanhos = self.tamanho[:n].tolist()
+        rotacoes = self.rotacao[:n].tolist()
+        cores = [tuple(cor) for cor in self.cor[:n].tolist()]
+        tipos = self.tipo[:n].tolist()
+
+        lote_rastros = self.montar_lote_rastros(alphas, cores)
+        lote_formas = []
+        for i, alpha in enumerate(alphas.tolist()):
+            if alpha > 0:
+                adicionar_forma_particula(lote_formas, TIPOS_PARTICULA[tipos[i]], xs[i], ys[i], tamanhos[i],
+                                          rotacoes[i], cores[i], alpha, tempo_atual)
+
+        # Todos os rastros em uma única passada, depois todas as formas
+        surface.blits(lote_rastros, False)
+        surface.blits(lote_formas, False)
+
+    def montar_lote_rastros(self, alphas, cores):
+        """Calcula posição, tamanho e alpha de todos os pontos de rastro de uma vez"""
+        lote = []
+        n = self.quantidade
+        if not self.max_rastro:
+            return lote
+
+        com_rastro = np.flatnonzero((self.trail_tamanho[:n] > 1) & (alphas > 0))
+        if len(com_rastro) == 0:
+            return lote
+
+        # Ponto i do rastro (0 = mais antigo) de cada partícula, lido do buffer circular
+        total = self.trail_tamanho[com_rastro].astype(np.int32)[:, None]
+        i = np.arange(self.max_rastro)[None, :]
+        fracao = i / total
+        alpha_rastro = (alphas[com_rastro, None] * fracao * 0.5).astype(np.int32)
+        validos = (i < total) & (alpha_rastro > 0)
+        slots = (self.trail_pos - (total - 1 - i)) % self.max_rastro
+
+        linhas, colunas = np.nonzero(validos)
+        donos = com_rastro[linhas]
+        pontos = self.trail[donos, slots[linhas, colunas]]
+        xs = pontos[:, 0].tolist()
+        ys = pontos[:, 1].tolist()
+        tamanhos = (self.tamanho[donos] * fracao[linhas, colunas]).tolist()
+        alphas_rastro = alpha_rastro[linhas, colunas].tolist()
+
+        for j, dono in enumerate(donos.tolist()):
+            adicionar_ponto_rastro(lote, xs[j], ys[j], tamanhos[j], cores[dono], alphas_rastro[j])
+        return lote
+
+    def clear(self):
+        self.quantidade = 0
+
+    def iniciar_frame(self):
+        """Nada a fechar: os arrays são pré-alocados, não há alocações por frame para contar"""
+
+    def estatisticas(self):
+        return {'em_uso': self.quantidade, 'capacidade': self.capacidade}
+
+
+# == ORÇAMENTO GLOBAL DE PARTÍCULAS ==
+LIMITE_PARTICULAS = 800
+
+# Prioridade de cada emissor: quem tem prioridade maior pode despejar partículas de prioridade menor
+PRIORIDADE_EMISSORES = {
+    "explosao": 3,
+    "congelamento": 2,
+    "escudo": 2,
+    "portal": 1,
+    "propulsao": 1,
+    "estrelas": 0
+}
+
+
+class OrcamentoParticulas:
+    """Distribui a capacidade do sistema de partículas entre os emissores por prioridade"""
+
+    def __init__(self, sistema, limite=LIMITE_PARTICULAS, prioridades=None):
+        self.sistema = sistema
+        self.limite = limite
+        self.prioridades = dict(PRIORIDADE_EMISSORES if prioridades is None else prioridades)
+        self.concedidas = {}
+        self.negadas = {}
+        self.despejadas = 0
+        self.concedidas_ultimo_frame = {}
+        self.negadas_ultimo_frame = {}
+        self.despejadas_ultimo_frame = 0
+
+    def solicitar(self, emissor, quantidade):
+        """Retorna quantas das partículas pedidas o emissor pode criar agora"""
+        livres = max(0, self.limite - len(self.sistema))
+
+        if livres < quantidade:
+            # Abrir espaço despejando as partículas mais antigas de prioridade menor
+            despejadas = self.sistema.despejar(quantidade - livres, self.prioridades.get(emissor, 0))
+            self.despejadas += despejadas
+            livres += despejadas
+
+        concedidas = min(quantidade, livres)
+        self.concedidas[emissor] = self.concedidas.get(emissor, 0) + concedidas
+        self.negadas[emissor] = self.negadas.get(emissor, 0) + quantidade - concedidas
+        return concedidas
+
+    def iniciar_frame(self):
+        self.concedidas_ultimo_frame = self.concedidas
+        self.negadas_ultimo_frame = self.negadas
+        self.despejadas_ultimo_frame = self.despejadas
+        self.concedidas = {}
+        self.negadas = {}
+        self.despejadas = 0
+
+    def estatisticas(self):
+        emissores = set(self.concedidas_ultimo_frame) | set(self.negadas_ultimo_frame)
+        return {
+            'particulas': len(self.sistema),
+            'limite': self.limite,
+            'despejadas': self.despejadas_ultimo_frame,
+            'emissores': {emissor: {'concedidas': self.concedidas_ultimo_frame.get(emissor, 0),
+                                    'negadas': self.negadas_ultimo_frame.get(emissor, 0)}
+                          for emissor in sorted(emissores)}
+        }
 
 
 # == FUNÇÕES GLOBAIS DE EFEITOS VISUAIS ==
-particulas = []
+if np is not None:
+    particulas = SistemaParticulasVetorizado()
+else:
+    particulas = SistemaParticulasObjetos()
+
+orcamento_particulas = OrcamentoParticulas(particulas)
 
 
 def criar_particulas_explosao_avancada(x, y, quantidade=25, cor_base=(255, 165, 0), tamanho_base=50):
     """Cria uma explosão avançada com múltiplos tipos de partículas"""
-    if len(particulas) > 800:
-        quantidade = min(quantidade, 10)
+    quantidade = orcamento_particulas.solicitar("explosao", quantidade)
 
     # Efeitos de brilho
     efeitos.criar_brilho(x, y, cor_base, tamanho_base, 1500, 1.0)
@@ -407,90 +1165,97 @@ def criar_particulas_explosao_avancada(x, y, quantidade=25, cor_base=(255, 165,
             min(255, max(50, cor_base[2] + variacao))
         )
 
-        particulas.append(ParticulaAvancada(
+        particulas.emitir(
             x, y, cor,
             math.cos(angulo) * velocidade,
             math.sin(angulo) * velocidade,
             vida_util, tamanho, tipo,
-            gravidade=random.uniform(0.01, 0.05) if tipo == "fumaca" else 0
-        ))
+            gravidade=random.uniform(0.01, 0.05) if tipo == "fumaca" else 0,
+            prioridade=PRIORIDADE_EMISSORES["explosao"]
+        )
 
 
 def criar_particulas_estrelas_avancadas():
     """Cria partículas de estrelas para o fundo"""
     for _ in range(3):
-        if random.random() < 0.2 and len(particulas) < 700:
+        if random.random() < 0.2:
             x = random.randint(0, largura)
             velocidade = random.uniform(0.8, 3)
             tamanho = random.uniform(1, 3)
             brilho = random.randint(150, 255)
 
-            for i in range(3):
-                particulas.append(ParticulaAvancada(
+            for i in range(orcamento_particulas.solicitar("estrelas", 3)):
+                particulas.emitir(
                     x + random.randint(-10, 10),
                     -5 - i * 5,
                     (brilho, brilho, brilho),
                     0, velocidade + i * 0.5,
                     1000, tamanho * (1 - i * 0.3),
-                    "estrela"
-                ))
+                    "estrela", prioridade=PRIORIDADE_EMISSORES["estrelas"]
+                )
 
 
 def criar_particulas_propulsao_avancada():
     """Cria partículas de propulsão da nave"""
     global game_over, particulas, jogador
-    if not game_over and len(particulas) < 750:
-        for i in range(4):
+    if not game_over:
+        offsets = []
+        for i in range(orcamento_particulas.solicitar("propulsao", 4)):
             offset_x = random.randint(-18, 18)
             cor_base = (random.randint(150, 255), random.randint(50, 150), 0)
+            offsets.append(offset_x)
 
-            particulas.append(ParticulaAvancada(
+            particulas.emitir(
                 jogador.centerx + offset_x,
                 jogador.bottom,
                 cor_base,
                 random.uniform(-1, 1), random.uniform(2, 5),
-                600, random.randint(3, 6), "fumaca", 0.02
-            ))
+                600, random.randint(3, 6), "fumaca", 0.02,
+                prioridade=PRIORIDADE_EMISSORES["propulsao"]
+            )
 
-            if random.random() < 0.3:
-                particulas.append(ParticulaAvancada(
+        for offset_x in offsets:
+            if random.random() < 0.3 and orcamento_particulas.solicitar("propulsao", 1):
+                particulas.emitir(
                     jogador.centerx + offset_x,
                     jogador.bottom,
                     (255, 255, 200),
                     random.uniform(-2, 2), random.uniform(3, 6),
-                    300, random.randint(1, 3), "faisca"
-                ))
+                    300, random.randint(1, 3), "faisca",
+                    prioridade=PRIORIDADE_EMISSORES["propulsao"]
+                )
 
 
 def criar_particulas_escudo_avancado(x, y, cor=(100, 200, 255)):
     """Cria partículas para escudo em qualquer posição"""
-    if len(particulas) < 800:
-        for i in range(3):
-            angulo = random.uniform(0, 2 * math.pi)
-            distancia = 35 + random.uniform(-8, 8)
-            px = x + math.cos(angulo) * distancia
-            py = y + math.sin(angulo) * distancia
+    for i in range(orcamento_particulas.solicitar("escudo", 3)):
+        angulo = random.uniform(0, 2 * math.pi)
+        distancia = 35 + random.uniform(-8, 8)
+        px = x + math.cos(angulo) * distancia
+        py = y + math.sin(angulo) * distancia
 
-            particulas.append(ParticulaAvancada(
-                px, py, cor,
-                random.uniform(-1, 1), random.uniform(-1, 1),
-                1000, random.randint(2, 4), "cristal"
-            ))
+        particulas.emitir(
+            px, py, cor,
+            random.uniform(-1, 1), random.uniform(-1, 1),
+            1000, random.randint(2, 4), "cristal",
+            prioridade=PRIORIDADE_EMISSORES["escudo"]
+        )
 
 
 def criar_efeito_congelamento(x, y):
     """Cria efeito de congelamento em qualquer posição"""
-    for _ in range(10):
+    for _ in range(orcamento_particulas.solicitar("congelamento", 10)):
         angulo = random.uniform(0, 2 * math.pi)
         distancia = random.uniform(0, 40)
         px = x + math.cos(angulo) * distancia
         py = y + math.sin(angulo) * distancia
 
-        particulas.append(ParticulaAvancada(
+        particulas.emitir(
             px, py, (100, 200, 255),
             random.uniform(-1, 1), random.uniform(-1, 1),
-            1000, random.uniform(2, 4), "cristal"
-        ))
+            1000, random.uniform(2, 4), "cristal",
+            prioridade=PRIORIDADE_EMISSORES["congelamento"]
+        )
 
     # Efeito de brilho azul
     efeitos.criar_brilho(x, y, (100, 200, 255), 30, 500, 0.8)
@@ -498,88 +1263,326 @@ def criar_efeito_congelamento(x, y):
 
 def criar_particulas_portal(x, y):
     """Cria partículas para portal"""
-    for _ in range(5):
+    for _ in range(orcamento_particulas.solicitar("portal", 5)):
         angulo = random.uniform(0, 2 * math.pi)
         distancia = random.uniform(20, 40)
         px = x + math.cos(angulo) * distancia
         py = y + math.sin(angulo) * distancia
 
-        particulas.append(ParticulaAvancada(
+        particulas.emitir(
             px, py, (100, 200, 255),
             (x - px) * 0.1, (y - py) * 0.1,
-            1500, random.uniform(2, 5), "estrela"
-        ))
-
+            1500, random.uniform(2, 5), "estrela",
+            prioridade=PRIORIDADE_EMISSORES["portal"]
+        )
 
-def criar_particulas_laser(x, y, cor=(255, 50, 50), quantidade=15):
-    """Cria partículas especiais para efeitos de laser"""
-    for _ in range(quantidade):
-        offset_x = random.uniform(-10, 10)
-        offset_y = random.uniform(-5, 5)
 
-        particulas.append(ParticulaAvancada(
-            x + offset_x, y + offset_y, cor,
-            random.uniform(-2, 2), random.uniform(-1, 1),
-            800, random.uniform(2, 4), "laser"
-        ))
+# == SISTEMA DE FUNDO DINÂMICO SUPER AVANÇADO ==
+# (velocidade em px a cada 1/60 s, tamanho mínimo, tamanho máximo, fração das estrelas) - do fundo para a frente
+CAMADAS_ESTRELAS = (
+    (0.2, 0.3, 1.2, 0.5),
+    (0.45, 0.8, 1.8, 0.3),
+    (0.7, 1.5, 2.5, 0.2),
+)
 
 
-# == SISTEMA DE FUNDO DINÂMICO SUPER AVANÇADO ==
 class FundoEstelar:
+    """Fundo em camadas pré-renderizadas que se repetem na vertical - desenhar é só um punhado de blits"""
+
     def __init__(self):
-        self.estrelas = []
+        self.telas_por_camada = max(1, CONFIG_QUALIDADE["altura_camada_estrelas"])
+        self.altura_camada = altura * self.telas_por_camada
+        self.tempo = 0.0
+        self.camadas = []
+        self.deslocamentos = []
         self.inicializar_estrelas()
 
     def inicializar_estrelas(self):
-        for _ in range(150):
-            self.estrelas.append({
-                'x': random.randint(0, largura),
-                'y': random.randint(0, altura),
-                'velocidade': random.uniform(0.1, 0.8),
-                'tamanho': random.uniform(0.3, 2.5),
-                'brilho': random.randint(100, 255),
-                'piscar_vel': random.uniform(0.005, 0.03),
-                'cor': (random.randint(200, 255), random.randint(200, 255), random.randint(200, 255))
-            })
+        total = CONFIG_QUALIDADE["estrelas_fundo"] * self.telas_por_camada
+        grupos = max(1, CONFIG_QUALIDADE["grupos_piscar_estrelas"])
+
+        for velocidade, tamanho_min, tamanho_max, fracao in CAMADAS_ESTRELAS:
+            # Cada grupo é uma sobreposição com colorkey cujo alpha anima o piscar de todas as suas estrelas
+            sobreposicoes = []
+            for _ in range(grupos):
+                surf = pygame.Surface((largura, self.altura_camada)).convert()
+                surf.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+                sobreposicoes.append([surf, random.uniform(0.005, 0.03)])
+
+            for _ in range(int(total * fracao)):
+                surf = random.choice(sobreposicoes)[0]
+                x = random.randint(0, largura)
+                y = random.randint(0, self.altura_camada)
+                tamanho = random.uniform(tamanho_min, tamanho_max)
+                cor = (random.randint(200, 255), random.randint(200, 255), random.randint(200, 255))
+                # Repetir nas bordas para a camada emendar sem cortes
+                for deslocamento_y in (-self.altura_camada, 0, self.altura_camada):
+                    pygame.draw.circle(surf, cor, (x, y + deslocamento_y), tamanho)
+
+            self.camadas.append((velocidade, sobreposicoes))
+            self.deslocamentos.append(random.uniform(0, self.altura_camada))
+
+    def atualizar(self, dt):
+        """Avança rolagem e piscar por dt ms reais, então a velocidade é a mesma em qualquer loop"""
+        self.tempo += dt
+        passos = dt * 60 / 1000
+
+        for i, (velocidade, sobreposicoes) in enumerate(self.camadas):
+            self.deslocamentos[i] = (self.deslocamentos[i] + velocidade * passos) % self.altura_camada
+
+            for sobreposicao in sobreposicoes:
+                brilho = 150 + int(105 * abs(math.sin(self.tempo * sobreposicao[1])))
+                sobreposicao[0].set_alpha(brilho, pygame.RLEACCEL)
 
-    def atualizar(self):
-        tempo_atual = pygame.time.get_ticks()
+    def desenhar(self, surface):
+        for deslocamento, (_, sobreposicoes) in zip(self.deslocamentos, self.camadas):
+            y = int(deslocamento)
+            for surf, _ in sobreposicoes:
+                surface.blit(surf, (0, y - self.altura_camada))
+                if y < altura:
+                    surface.blit(surf, (0, y))
 
-        for estrela in self.estrelas:
-            estrela['y'] += estrela['velocidade']
-            if estrela['y'] > altura:
-                estrela['y'] = 0
-                estrela['x'] = random.randint(0, largura)
 
-            estrela['brilho'] = 150 + int(105 * abs(math.sin(tempo_atual * estrela['piscar_vel'])))
+fundo_estelar = FundoEstelar()
 
-    def desenhar(self, surface):
-        # Desenhar estrelas
-        for estrela in self.estrelas:
-            brilho = estrela['brilho']
-            cor_estrela = (
-                min(255, estrela['cor'][0] * brilho // 255),
-                min(255, estrela['cor'][1] * brilho // 255),
-                min(255, estrela['cor'][2] * brilho // 255)
-            )
 
-            pygame.draw.circle(surface, cor_estrela,
-                               (int(estrela['x']), int(estrela['y'])),
-                               estrela['tamanho'])
+# == PACOTE DE ASSETS PRÉ-ESCALADOS ==
+EMPACOTAR_ASSETS = "--empacotar-assets" in sys.argv
+DESPEJAR_ATLAS = "--despejar-atlas" in sys.argv
+DIRETORIO_DESPEJO_ATLAS = os.path.join(DIRETORIO_JOGO, "atlas_debug")
+ARQUIVO_PACOTE_ASSETS = os.path.join(DIRETORIO_JOGO, "pacote_assets.bin")
 
 
-fundo_estelar = FundoEstelar()
+class PacoteAssets:
+    """Todas as variantes (arquivo, escala) em RGBA cru num só arquivo mapeado em memória"""
+
+    MAGICO = b"NVPACK01"
+    CABECALHO = struct.Struct("<8sQI")  # mágico, posição e tamanho do índice JSON (gravado depois dos pixels)
+    ALINHAMENTO = 16
+
+    def __init__(self, caminho, indice, manifesto):
+        self.caminho = caminho
+        self.indice = indice
+        self.manifesto = manifesto
+        self.mapa = None
+        self.formato = None
+        self.variantes = {}  # "arquivo|LxA" -> [offset, largura, altura]
+        self.carregadas = {}  # (arquivo, (largura, altura)) -> Surface usada nesta execução
+        self.desatualizado = False
+        if EMPACOTAR_ASSETS:
+            self.desatualizado = True  # vai ser regravado: nenhum sprite deve sair do arquivo antigo
+        else:
+            self.abrir()
+
+    @staticmethod
+    def chave(nome_arquivo, escala):
+        return f"{nome_arquivo}|{escala[0]}x{escala[1]}"
+
+    @staticmethod
+    def formato_tela():
+        """Ordem de bytes igual à de convert_alpha(), para os blits não precisarem converter pixels"""
+        amostra = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+        return "BGRA" if amostra.get_masks()[0] == 0xFF0000 else "RGBA"
+
+    @staticmethod
+    def assinatura_arquivo(caminho):
+        with open(caminho, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    def abrir(self):
+        # Pacote gravado numa execução em que o antigo ainda estava mapeado: entra agora, antes de mapear
+        pendente = self.caminho + ".novo"
+        if os.path.exists(pendente):
+            try:
+                os.replace(pendente, self.caminho)
+            except OSError as e:
+                print(f"Erro ao instalar pacote de assets novo: {e}")
+
+        if not os.path.exists(self.caminho):
+            self.desatualizado = True
+            return
+
+        try:
+            mapa, inicio_indice, indice = self.mapear()
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Pacote de assets ilegível ({e}) - será reconstruído")
+            self.desatualizado = True
+            return
+
+        fontes_renovadas = []
+        if (indice["formato"] != self.formato_tela() or not self.fontes_validas(indice, fontes_renovadas)
+                or not self.variantes_completas(indice)):
+            print("Pacote de assets desatualizado - será reconstruído")
+            mapa.close()
+            self.desatualizado = True
+            return
+
+        if fontes_renovadas:
+            # Fontes só tocadas (mesmo hash): o mtime novo vai para o índice e a próxima abertura não recalcula
+            mapa.close()
+            self.regravar_indice(inicio_indice, indice)
+            try:
+                mapa, _, indice = self.mapear()
+            except (OSError, ValueError, struct.error) as e:
+                print(f"Pacote de assets ilegível ({e}) - será reconstruído")
+                self.desatualizado = True
+                return
+
+        self.mapa = mapa
+        self.formato = indice["formato"]
+        self.variantes = indice["variantes"]
+
+    def mapear(self):
+        """Mapeia o arquivo e lê o índice JSON gravado depois dos pixels"""
+        with open(self.caminho, "rb") as f:
+            mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        try:
+            magico, inicio_indice, tamanho_indice = self.CABECALHO.unpack_from(mapa, 0)
+            if magico != self.MAGICO:
+                raise ValueError("cabeçalho inválido")
+            indice = json.loads(mapa[inicio_indice:inicio_indice + tamanho_indice].decode("utf-8"))
+        except (ValueError, struct.error):
+            mapa.close()
+            raise
+        return mapa, inicio_indice, indice
+
+    def fontes_validas(self, indice, renovadas):
+        """Compara caminho, mtime e tamanho; só recalcula o hash de quem mudou de mtime.
+        Se o hash bate, o mtime novo entra no índice e o nome vai para renovadas"""
+        for nome_arquivo, fonte in indice["fontes"].items():
+            caminho_fonte, mtime, tamanho, assinatura = fonte
+            if self.indice.resolver(nome_arquivo) != caminho_fonte:
+                return False
+            try:
+                info = os.stat(caminho_fonte)
+            except OSError:
+                return False
+            if info.st_size != tamanho:
+                return False
+            if info.st_mtime_ns != mtime:
+                if self.assinatura_arquivo(caminho_fonte) != assinatura:
+                    return False
+                fonte[1] = info.st_mtime_ns
+                renovadas.append(nome_arquivo)
+        return True
+
+    def regravar_indice(self, inicio_indice, indice):
+        """Troca só o índice do final do arquivo - os pixels ficam onde estão (o mapa já deve estar fechado)"""
+        indice_bytes = json.dumps(indice).encode("utf-8")
+        try:
+            with open(self.caminho, "r+b") as f:
+                f.seek(inicio_indice)
+                f.write(indice_bytes)
+                f.truncate()
+                f.seek(0)
+                f.write(self.CABECALHO.pack(self.MAGICO, inicio_indice, len(indice_bytes)))
+        except OSError as e:
+            print(f"Erro ao atualizar o índice do pacote de assets: {e}")
+
+    def variantes_completas(self, indice):
+        """Toda variante do manifesto com arquivo presente já está no pacote - senão ele é refeito antes de ser usado"""
+        for nome_arquivo, tamanhos, _ in self.manifesto.values():
+            if self.indice.resolver(nome_arquivo) is None:
+                continue
+            if any(self.chave(nome_arquivo, tamanho) not in indice["variantes"] for tamanho in tamanhos):
+                return False
+        return True
+
+    def fechar(self):
+        """Solta o arquivo mapeado; False se ainda há Surface viva apontando para ele"""
+        if self.mapa is None:
+            return True
+        # As cópias mantêm os pixels para gravar, sem prender o mapa pelas referências do próprio pacote
+        self.carregadas = {chave: surf.copy() for chave, surf in self.carregadas.items()}
+        try:
+            self.mapa.close()
+        except BufferError:
+            return False
+        self.mapa = None
+        self.variantes = {}
+        return True
+
+    def obter(self, nome_arquivo, escala):
+        """Surface apontando direto para o arquivo mapeado (sem cópia) ou None se a variante não existe"""
+        if self.mapa is None:
+            return None
+        variante = self.variantes.get(self.chave(nome_arquivo, escala))
+        if variante is None:
+            return None
+
+        offset, largura_img, altura_img = variante
+        dados = memoryview(self.mapa)[offset:offset + largura_img * altura_img * 4]
+        surf = pygame.image.frombuffer(dados, (largura_img, altura_img), self.formato)
+        self.carregadas[(nome_arquivo, escala)] = surf
+        return surf
+
+    def registrar(self, nome_arquivo, escala, surf):
+        """Variante decodificada do arquivo original - entra no pacote na próxima gravação"""
+        self.carregadas[(nome_arquivo, escala)] = surf
+        self.desatualizado = True
+
+    def salvar(self):
+        formato = self.formato_tela()
+        fontes = {}
+        variantes = {}
+        blocos = []
+        offset = self.CABECALHO.size + (-self.CABECALHO.size % self.ALINHAMENTO)
+        for (nome_arquivo, escala), surf in sorted(self.carregadas.items()):
+            if nome_arquivo not in fontes:
+                caminho_fonte = self.indice.resolver(nome_arquivo)
+                info = os.stat(caminho_fonte)
+                fontes[nome_arquivo] = [caminho_fonte, info.st_mtime_ns, info.st_size,
+                                        self.assinatura_arquivo(caminho_fonte)]
+
+            dados = pygame.image.tobytes(surf, formato)
+            variantes[self.chave(nome_arquivo, escala)] = [offset, surf.get_width(), surf.get_height()]
+            blocos.append(dados + bytes(-len(dados) % self.ALINHAMENTO))
+            offset += len(blocos[-1])
+
+        indice = {"formato": formato, "fontes": fontes, "variantes": variantes}
+        indice_bytes = json.dumps(indice).encode("utf-8")
+
+        temporario = self.caminho + ".tmp"
+        pendente = self.caminho + ".novo"
+        try:
+            with open(temporario, "wb") as f:
+                f.write(self.CABECALHO.pack(self.MAGICO, offset, len(indice_bytes)))
+                f.write(bytes(-self.CABECALHO.size % self.ALINHAMENTO))
+                for bloco in blocos:
+                    f.write(bloco)
+                f.write(indice_bytes)
+            os.replace(temporario, pendente)
+            self.desatualizado = False
+            print(f"Pacote de assets gravado: {len(variantes)} variantes, {offset // 1024} KB de pixels")
+        except OSError as e:
+            print(f"Erro ao gravar pacote de assets: {e}")
+            return
+
+        # No Windows um arquivo mapeado não pode ser substituído: o mapa antigo é fechado antes
+        if not self.fechar():
+            print("Pacote antigo ainda em uso - o novo entra na próxima execução")
+            return
+        self.abrir()
+
+
+pacote_assets = PacoteAssets(ARQUIVO_PACOTE_ASSETS, indice_assets, MANIFESTO_ASSETS)
 
 
 # == CARREGAMENTO DE IMAGENS COM FALLBACK ==
 def carregar_imagem_ou_criar(nome_arquivo, escala, cor_fallback=None):
-    if caminho_imagens:
-        caminho_completo = os.path.join(caminho_imagens, nome_arquivo)
+    caminho_completo = indice_assets.resolver(nome_arquivo)
+    if caminho_completo:
+        img = pacote_assets.obter(nome_arquivo, escala)
+        if img is not None:
+            return img
+
         if os.path.exists(caminho_completo):
             try:
                 img = pygame.image.load(caminho_completo)
                 img = img.convert_alpha()
-                return pygame.transform.scale(img, escala)
+                img = pygame.transform.scale(img, escala)
+                pacote_assets.registrar(nome_arquivo, escala, img)
+                return img
             except pygame.error as e:
                 print(f"Erro ao carregar {nome_arquivo}: {e}")
 
@@ -614,36 +1617,700 @@ def carregar_imagem_ou_criar(nome_arquivo, escala, cor_fallback=None):
 
 
 # == CARREGAR TODAS AS IMAGENS ==
-naves_imagens = []
-naves_arquivos = ["nave_azulroxo3.gif", "nave_laranja3.gif", "nave_rosa2.gif",
-                  "nave_verde3.gif", "nave_vermelho1.gif", "nave_vermelho3.gif"]
-
-for nave_arquivo in naves_arquivos:
-    img = carregar_imagem_ou_criar(nave_arquivo, (40, 40), (100, 150, 255))
-    naves_imagens.append(img)
+imagens_assets = {}
+for nome_asset, (arquivo_asset, tamanhos_asset, cores_asset) in MANIFESTO_ASSETS.items():
+    for i, tamanho_asset in enumerate(tamanhos_asset):
+        cor_asset = cores_asset[i] if isinstance(cores_asset[0], tuple) else cores_asset
+        imagens_assets[(nome_asset, tamanho_asset)] = carregar_imagem_ou_criar(arquivo_asset, tamanho_asset, cor_asset)
+indice_assets.salvar()
+print(f"Assets resolvidos: {len(indice_assets.resolvidos)} de {len(MANIFESTO_ASSETS)} arquivos do manifesto")
+
+
+# == ATLAS DE SPRITES PEQUENOS ==
+class AtlasSprites:
+    """Empacota sprites pequenos em poucas páginas grandes e entrega subsurfaces por nome"""
+
+    def __init__(self, tamanho_pagina=512, margem=1):
+        self.tamanho_pagina = tamanho_pagina
+        self.margem = margem  # Pixel transparente entre sprites para não vazar cor vizinha
+        self.paginas = []
+        self.regioes = {}  # nome -> (índice da página, Rect)
+        self.vistas = {}
+
+    def nova_pagina(self):
+        self.paginas.append(pygame.Surface((self.tamanho_pagina, self.tamanho_pagina), pygame.SRCALPHA).convert_alpha())
+        return len(self.paginas) - 1
+
+    def empacotar(self, sprites):
+        """Prateleiras por altura decrescente; abre uma página nova quando a atual enche"""
+        ordem = sorted(sprites.items(), key=lambda item: (-item[1].get_height(), -item[1].get_width()))
+        pagina = None
+        x = y = altura_prateleira = 0
+        for nome, surf in ordem:
+            largura, altura = surf.get_size()
+            if pagina is not None and x + largura > self.tamanho_pagina:
+                x = 0
+                y += altura_prateleira + self.margem
+                altura_prateleira = 0
+            if pagina is None or y + altura > self.tamanho_pagina:
+                pagina = self.nova_pagina()
+                x = y = altura_prateleira = 0
+
+            regiao = pygame.Rect(x, y, largura, altura)
+            self.paginas[pagina].blit(surf, regiao, special_flags=pygame.BLEND_RGBA_MAX)
+            self.regioes[nome] = (pagina, regiao)
+            self.vistas[nome] = self.paginas[pagina].subsurface(regiao)
+            x += largura + self.margem
+            altura_prateleira = max(altura_prateleira, altura)
+
+    def obter(self, nome):
+        return self.vistas[nome]
+
+    def ocupacao(self):
+        if not self.paginas:
+            return 0.0
+        area = sum(regiao.width * regiao.height for _, regiao in self.regioes.values())
+        return area / (len(self.paginas) * self.tamanho_pagina ** 2)
+
+    def despejar(self, diretorio):
+        """Grava cada página em PNG com as regiões em JSON, para inspecionar o empacotamento"""
+        os.makedirs(diretorio, exist_ok=True)
+        for i, pagina in enumerate(self.paginas):
+            pygame.image.save(pagina, os.path.join(diretorio, f"atlas_{i}.png"))
+        regioes = {str(nome): [pagina, list(regiao)] for nome, (pagina, regiao) in self.regioes.items()}
+        with open(os.path.join(diretorio, "atlas.json"), "w", encoding="utf-8") as f:
+            json.dump(regioes, f, indent=2, ensure_ascii=False)
+        print(f"Atlas despejado em {diretorio}")
+
+
+atlas_sprites = AtlasSprites(CONFIG_QUALIDADE["tamanho_pagina_atlas"])
+lado_max_atlas = CONFIG_QUALIDADE["lado_max_sprite_atlas"]
+atlas_sprites.empacotar({chave: surf for chave, surf in imagens_assets.items()
+                         if surf.get_width() <= lado_max_atlas and surf.get_height() <= lado_max_atlas})
+imagens_assets.update(atlas_sprites.vistas)
+print(f"Atlas de sprites: {len(atlas_sprites.regioes)} sprites em {len(atlas_sprites.paginas)} página(s), "
+      f"{atlas_sprites.ocupacao():.0%} ocupado")
+if DESPEJAR_ATLAS:
+    atlas_sprites.despejar(DIRETORIO_DESPEJO_ATLAS)
+
+
+def imagem_asset(nome, tamanho):
+    return imagens_assets[(nome, tamanho)]
+
+
+# Assets de cada nave na ordem de seleção (as três últimas são as naves admin)
+NAVES_ASSETS = ("nave_azulroxo", "nave_laranja", "nave_rosa", "nave_verde", "nave_vermelho1", "nave_vermelho3",
+                "nave_gabriel", "nave_paulo", "nave_vitor")
+
+naves_imagens = [imagem_asset(nome, (40, 40)) for nome in NAVES_ASSETS[:6]]
 
 # Adicionar naves de administrador
-nave_gabriel_img = carregar_imagem_ou_criar("nave_gabriel.png", (40, 40), (0, 255, 0))
-nave_paulo_img = carregar_imagem_ou_criar("nave_paulo.png", (40, 40), (255, 0, 0))
-nave_vitor_img = carregar_imagem_ou_criar("nave_vitor.png", (40, 40), (0, 0, 255))
+nave_gabriel_img = imagem_asset("nave_gabriel", (40, 40))
+nave_paulo_img = imagem_asset("nave_paulo", (40, 40))
+nave_vitor_img = imagem_asset("nave_vitor", (40, 40))
 
 # Adicionar as naves admin à lista de naves
 naves_imagens.append(nave_gabriel_img)
 naves_imagens.append(nave_paulo_img)
 naves_imagens.append(nave_vitor_img)
 
-meteoro_img = carregar_imagem_ou_criar("meteoro.gif", (60, 60), (150, 100, 50))
-meteoro_grande_img = carregar_imagem_ou_criar("meteoro.gif", (80, 80), (150, 100, 50))
-meteoro_enorme_img = carregar_imagem_ou_criar("meteoro.gif", (100, 100), (120, 80, 40))
-projetil_img = carregar_imagem_ou_criar("projetil_base.gif", (15, 25), (255, 255, 100))
-projetil_boss_img = carregar_imagem_ou_criar("projetil_boss.gif", (15, 25), (255, 100, 100))
-boss_img = carregar_imagem_ou_criar("nave_boss.gif", (70, 70), (255, 50, 50))
-boss_menor_img = carregar_imagem_ou_criar("nave_boss.gif", (50, 50), (200, 50, 50))
-mega_boss_img = carregar_imagem_ou_criar("mega_boss_img.png", (90, 90), (200, 50, 150))
-boss_gabriel_img = carregar_imagem_ou_criar("boss.gabriel.png", (150, 150), (255, 0, 255))
-drone_img = carregar_imagem_ou_criar("nave_boss.gif", (30, 30), (150, 50, 50))  # CORRIGIDO: drone.boss.png -> nave_boss.gif
-coracao_img = carregar_imagem_ou_criar("coracao.png", (30, 30), (255, 100, 100))
-portal_img = carregar_imagem_ou_criar("portal.gif", (60, 60), (100, 255, 200))
+meteoro_img = imagem_asset("meteoro", (60, 60))
+meteoro_grande_img = imagem_asset("meteoro", (80, 80))
+meteoro_enorme_img = imagem_asset("meteoro", (100, 100))
+projetil_img = imagem_asset("projetil", (15, 25))
+projetil_boss_img = imagem_asset("projetil_boss", (15, 25))
+boss_img = imagem_asset("boss", (70, 70))
+boss_menor_img = imagem_asset("boss", (50, 50))
+mega_boss_img = imagem_asset("mega_boss", (90, 90))
+boss_gabriel_img = imagem_asset("boss_gabriel", (150, 150))
+drone_img = imagem_asset("boss", (30, 30))
+coracao_img = imagem_asset("coracao", (30, 30))
+portal_img = imagem_asset("portal", (60, 60))
+
+
+# == ANIMAÇÕES DE GIF ==
+if not hasattr(pygame.image, "load_animation") and Image is None:
+    print("Sem decodificador de GIF animado (pygame-ce ou Pillow). Animações usarão só o primeiro quadro.")
+
+
+class Animacao:
+    """Quadros de um GIF decodificados uma vez num atlas horizontal, já na escala usada pelo jogo"""
+
+    def __init__(self, quadros):
+        largura_quadro, altura_quadro = quadros[0][0].get_size()
+        if len(quadros) == 1:
+            self.atlas = quadros[0][0]
+        else:
+            self.atlas = pygame.Surface((largura_quadro * len(quadros), altura_quadro), pygame.SRCALPHA)
+            for i, (surf, _) in enumerate(quadros):
+                self.atlas.blit(surf, (i * largura_quadro, 0))
+            self.atlas = self.atlas.convert_alpha()
+
+        self.quadros = [self.atlas.subsurface((i * largura_quadro, 0, largura_quadro, altura_quadro))
+                        for i in range(len(quadros))]
+        self.inicios = []
+        self.duracao_total = 0
+        for _, duracao in quadros:
+            self.inicios.append(self.duracao_total)
+            self.duracao_total += duracao if duracao > 0 else 100  # GIFs sem atraso usam 100ms
+        self.bytes = CacheSprites.tamanho_bytes(self.atlas)
+
+    def quadro(self, tempo_ms):
+        if len(self.quadros) == 1:
+            return self.quadros[0]
+        return self.quadros[bisect_right(self.inicios, tempo_ms % self.duracao_total) - 1]
+
+
+def decodificar_gif(caminho):
+    """Lista de (Surface, duração em ms) com todos os quadros, ou None sem decodificador disponível"""
+    if hasattr(pygame.image, "load_animation"):
+        return [(surf.convert_alpha(), duracao) for surf, duracao in pygame.image.load_animation(caminho)]
+
+    if Image is not None:
+        quadros = []
+        with Image.open(caminho) as gif:
+            for quadro in ImageSequence.Iterator(gif):
+                rgba = quadro.convert("RGBA")
+                surf = pygame.image.frombytes(rgba.tobytes(), rgba.size, "RGBA").convert_alpha()
+                quadros.append((surf, quadro.info.get("duration", 100)))
+        return quadros
+
+    return None
+
+
+def criar_animacao(arquivo, escala, imagem_estatica):
+    quadros = None
+    caminho = indice_assets.resolver(arquivo)
+    if caminho and arquivo.lower().endswith(".gif"):
+        try:
+            quadros = decodificar_gif(caminho)
+        except (pygame.error, OSError, ValueError) as e:
+            print(f"Erro ao decodificar animação {arquivo}: {e}")
+
+    if not quadros:
+        return Animacao([(imagem_estatica, 0)])
+    return Animacao([(pygame.transform.scale(surf, escala), duracao) for surf, duracao in quadros])
+
+
+cache_animacoes = CacheSprites(64, CONFIG_QUALIDADE["memoria_animacoes_mb"] * 1024 * 1024,
+                               medir_bytes=lambda animacao: animacao.bytes)
+
+
+def animacao_asset(nome, tamanho):
+    """Animação do asset do manifesto, decodificada no primeiro uso"""
+    return cache_animacoes.obter((nome, tamanho), criar_animacao,
+                                 MANIFESTO_ASSETS[nome][0], tamanho, imagem_asset(nome, tamanho))
+
+
+def quadro_asset(nome, tamanho):
+    """Quadro atual da animação, sincronizado pelo relógio do jogo"""
+    return animacao_asset(nome, tamanho).quadro(relogio.agora)
+
+
+# == CACHE DE ROTAÇÕES ==
+cache_rotacoes = CacheSprites(1024)
+
+
+def passo_rotacao(angulo):
+    passos = CONFIG_QUALIDADE["passos_rotacao"]
+    return int(round(angulo % 360 * passos / 360)) % passos
+
+
+def obter_rotacao(imagem, angulo):
+    """Retorna a imagem girada no ângulo pré-renderizado mais próximo"""
+    passo = passo_rotacao(angulo)
+    return cache_rotacoes.obter((imagem, passo), pygame.transform.rotate, imagem,
+                                passo * 360 / CONFIG_QUALIDADE["passos_rotacao"])
+
+
+def desenhar_rotacionado(surface, imagem, angulo, centro):
+    """Desenha a imagem girada com o centro no lugar certo (a caixa girada é maior que a original)"""
+    sprite = obter_rotacao(imagem, angulo)
+    surface.blit(sprite, sprite.get_rect(center=centro))
+
+
+def pre_renderizar_rotacoes(imagens):
+    passos = CONFIG_QUALIDADE["passos_rotacao"]
+    for imagem in imagens:
+        for passo in range(passos):
+            obter_rotacao(imagem, passo * 360 / passos)
+            obter_mascara(imagem, passo * 360 / passos)
+
+
+# == MÁSCARAS DE COLISÃO ==
+cache_mascaras = CacheSprites(1024, medir_bytes=lambda mascara: mascara.get_size()[0] * mascara.get_size()[1] // 8)
+metricas_colisao = {'amplas': 0, 'precisas': 0}  # Testes por frame (zerados no início de cada frame)
+
+
+def mascara_rotacionada(imagem, angulo):
+    return pygame.mask.from_surface(obter_rotacao(imagem, angulo))
+
+
+def obter_mascara(imagem, angulo=None):
+    """Máscara do sprite como ele é desenhado: parado, ou no mesmo passo de rotação do cache de rotações"""
+    if angulo is None:
+        return cache_mascaras.obter((imagem, None), pygame.mask.from_surface, imagem)
+    return cache_mascaras.obter((imagem, passo_rotacao(angulo)), mascara_rotacionada, imagem, angulo)
+
+
+def posicionar_mascara(rect, imagem, angulo):
+    """Sprites parados são desenhados no canto do rect; girados, centralizados nele"""
+    mascara = obter_mascara(imagem, angulo)
+    if angulo is None:
+        return mascara, rect.topleft
+    largura_mascara, altura_mascara = mascara.get_size()
+    return mascara, (rect.centerx - largura_mascara // 2, rect.centery - altura_mascara // 2)
+
+
+def sprites_colidem(rect_a, imagem_a, rect_b, imagem_b, angulo_a=None, angulo_b=None):
+    """Broadphase pelos rects; a sobreposição de máscaras só roda para os pares que se tocam"""
+    metricas_colisao['amplas'] += 1
+    if not rect_a.colliderect(rect_b):
+        return False
+
+    metricas_colisao['precisas'] += 1
+    mascara_a, (xa, ya) = posicionar_mascara(rect_a, imagem_a, angulo_a)
+    mascara_b, (xb, yb) = posicionar_mascara(rect_b, imagem_b, angulo_b)
+    return mascara_a.overlap(mascara_b, (xb - xa, yb - ya)) is not None
+
+
+def imagem_meteoro(meteoro):
+    tipo = mundo.obter(meteoro, "sprite")
+    if tipo == "enorme":
+        return meteoro_enorme_img
+    if tipo == "grande":
+        return meteoro_grande_img
+    return meteoro_img
+
+
+def asset_boss(boss):
+    """Asset (nome, tamanho) com que o boss é desenhado - a máscara sai do quadro atual desse asset"""
+    if isinstance(boss, BossGabriel):
+        return "boss_gabriel", (150, 150)
+    if isinstance(boss, BossNivel15) or boss.tipo_boss == 3:
+        return "mega_boss", (90, 90)
+    if boss.tipo_boss == 2 and boss.usar_lazer:
+        return "boss", (50, 50)
+    return "boss", (70, 70)
+
+
+def imagem_jogador():
+    """Quadro da nave que está na tela agora - a máscara acompanha a animação"""
+    return quadro_asset(NAVES_ASSETS[nave_selecionada], (40, 40))
+
+
+# == GRADE ESPACIAL DE COLISÃO ==
+# Como cada categoria registrada na grade é testada: rect, imagem da máscara (None = só rect) e ângulo
+FORMAS_COLISAO = {
+    "meteoro": lambda meteoro: (mundo.obter(meteoro, "transform"), imagem_meteoro(meteoro),
+                                mundo.obter(meteoro, "rotacao")[0]),
+    "boss": lambda boss: (boss.rect, quadro_asset(*asset_boss(boss)), None),
+    "drone": lambda drone: (drone.rect, quadro_asset("boss", (30, 30)), None),
+    "coracao": lambda coracao: (mundo.obter(coracao, "transform"), None, None),
+    "portal": lambda portal: (mundo.obter(portal, "transform"), None, None),
+}
+
+
+def filtrar_acertos(categoria, candidatos, rect, imagem=None, angulo=None):
+    """Fase precisa sobre os candidatos da broadphase: rect e, se as duas partes tiverem imagem, máscara"""
+    forma = FORMAS_COLISAO[categoria]
+    resultado = []
+    for entidade in candidatos:
+        rect_b, imagem_b, angulo_b = forma(entidade)
+        if imagem is None or imagem_b is None:
+            metricas_colisao['amplas'] += 1
+            if rect.colliderect(rect_b):
+                resultado.append(entidade)
+        elif sprites_colidem(rect, imagem, rect_b, imagem_b, angulo, angulo_b):
+            resultado.append(entidade)
+    return resultado
+
+
+def chave_entidade(entidade):
+    """Chave de dicionário: IDs do mundo e objetos valem por si; dicts pela identidade"""
+    return id(entidade) if isinstance(entidade, dict) else entidade
+
+
+class GradeEspacial:
+    """Hash espacial de grade uniforme: cada entidade fica nas células que seu rect cobre, por categoria"""
+
+    def __init__(self, tamanho_celula=64):
+        self.tamanho_celula = tamanho_celula
+        self.celulas = {categoria: {} for categoria in FORMAS_COLISAO}
+        self.registros = {}  # chave_entidade(entidade) -> (categoria, células, ordem de inserção)
+        self.ordem = 0
+
+    def limpar(self):
+        for celulas in self.celulas.values():
+            celulas.clear()
+        self.registros.clear()
+        self.ordem = 0
+
+    def cobertura(self, rect):
+        t = self.tamanho_celula
+        for cx in range(rect.left // t, (rect.right - 1) // t + 1):
+            for cy in range(rect.top // t, (rect.bottom - 1) // t + 1):
+                yield cx, cy
+
+    def inserir(self, categoria, entidade, rect):
+        celulas = self.celulas[categoria]
+        chaves = list(self.cobertura(rect))
+        for chave in chaves:
+            celulas.setdefault(chave, []).append(entidade)
+        self.registros[chave_entidade(entidade)] = (categoria, chaves, self.ordem)
+        self.ordem += 1
+
+    def remover(self, entidade):
+        registro = self.registros.pop(chave_entidade(entidade), None)
+        if registro is None:
+            return
+        categoria, chaves, _ = registro
+        for chave in chaves:
+            self.celulas[categoria][chave].remove(entidade)
+
+    def consultar(self, categoria, rect):
+        """Candidatos da categoria nas células que o rect cobre, sem repetição e na ordem de inserção"""
+        celulas = self.celulas[categoria]
+        candidatos = {}
+        for chave in self.cobertura(rect):
+            for entidade in celulas.get(chave, ()):
+                candidatos[chave_entidade(entidade)] = entidade
+        return sorted(candidatos.values(), key=lambda entidade: self.registros[chave_entidade(entidade)][2])
+
+    def consultar_lote(self, categoria, rects):
+        return [self.consultar(categoria, rect) for rect in rects]
+
+    def contem(self, entidade):
+        return chave_entidade(entidade) in self.registros
+
+    def acertos(self, categoria, rect, imagem=None, angulo=None):
+        """Entidades da categoria que colidem de fato com o sprite (rect e, se houver imagem, máscara)"""
+        return filtrar_acertos(categoria, self.consultar(categoria, rect), rect, imagem, angulo)
+
+    def primeiro_acerto(self, categoria, rect, imagem=None, angulo=None):
+        acertos = self.acertos(categoria, rect, imagem, angulo)
+        return acertos[0] if acertos else None
+
+
+# == BROADPHASE VETORIZADA (NUMPY) ==
+def pares_aabb(a, b):
+    """Índices (i, j) de todos os pares em que a[i] e b[j] se sobrepõem - arrays (N, 4) de x, y, largura, altura"""
+    ax, ay, aw, ah = (a[:, k, None] for k in range(4))
+    bx, by, bw, bh = (b[:, k] for k in range(4))
+    sobrepostos = (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+    return np.nonzero(sobrepostos)
+
+
+class BroadphaseVetorizada:
+    """Mesma interface da grade, mas com os rects de cada categoria num array e os pares calculados de uma vez"""
+
+    def __init__(self):
+        self.entidades = {categoria: [] for categoria in FORMAS_COLISAO}
+        self.rects = {categoria: [] for categoria in FORMAS_COLISAO}
+        self.arrays = {}  # categoria -> array (N, 4), montado na primeira consulta depois de inserções
+        self.linhas = {}  # chave_entidade(entidade) -> (categoria, linha viva no array); removidas saem daqui
+
+    def limpar(self):
+        for categoria in FORMAS_COLISAO:
+            self.entidades[categoria].clear()
+            self.rects[categoria].clear()
+        self.arrays.clear()
+        self.linhas.clear()
+
+    def inserir(self, categoria, entidade, rect):
+        self.linhas[chave_entidade(entidade)] = (categoria, len(self.entidades[categoria]))
+        self.entidades[categoria].append(entidade)
+        self.rects[categoria].append(tuple(rect))
+        self.arrays.pop(categoria, None)
+
+    def remover(self, entidade):
+        self.linhas.pop(chave_entidade(entidade), None)
+
+    def contem(self, entidade):
+        return chave_entidade(entidade) in self.linhas
+
+    def viva(self, categoria, linha, entidade):
+        """A linha ainda é o registro atual da entidade (não foi removida nem reinserida depois)"""
+        return self.linhas.get(chave_entidade(entidade)) == (categoria, linha)
+
+    def array(self, categoria):
+        if categoria not in self.arrays:
+            self.arrays[categoria] = np.array(self.rects[categoria], dtype=np.int32).reshape(-1, 4)
+        return self.arrays[categoria]
+
+    def consultar_lote(self, categoria, rects):
+        """Candidatos de cada rect consultado, na ordem de inserção - um único teste AABB para o lote todo"""
+        candidatos = [[] for _ in rects]
+        if not rects or not self.entidades[categoria]:
+            return candidatos
+
+        consultas = np.array([tuple(rect) for rect in rects], dtype=np.int32).reshape(-1, 4)
+        indices_consulta, indices_alvo = pares_aabb(consultas, self.array(categoria))
+        entidades = self.entidades[categoria]
+        for i, j in zip(indices_consulta.tolist(), indices_alvo.tolist()):
+            entidade = entidades[j]
+            if self.viva(categoria, j, entidade):
+                candidatos[i].append(entidade)
+        return candidatos
+
+    def consultar(self, categoria, rect):
+        """Um rect só (contato do jogador): laço Python direto - montar arrays para uma consulta custa mais"""
+        return [entidade for j, (entidade, alvo) in enumerate(zip(self.entidades[categoria], self.rects[categoria]))
+                if rect.colliderect(alvo) and self.viva(categoria, j, entidade)]
+
+    def acertos(self, categoria, rect, imagem=None, angulo=None):
+        return filtrar_acertos(categoria, self.consultar(categoria, rect), rect, imagem, angulo)
+
+    def primeiro_acerto(self, categoria, rect, imagem=None, angulo=None):
+        acertos = self.acertos(categoria, rect, imagem, angulo)
+        return acertos[0] if acertos else None
+
+
+if np is not None and CONFIG_QUALIDADE["broadphase_vetorizada"]:
+    grade_colisao = BroadphaseVetorizada()
+else:
+    grade_colisao = GradeEspacial(CONFIG_QUALIDADE["celula_grade_colisao"])
+
+
+# == ÍNDICE DE VARREDURA PARA FEIXES ==
+class IndiceVarredura:
+    """Sweep-and-prune num eixo: as entradas vivem entre consultas (entram e saem junto com as entidades)
+    e são reordenadas por inserção no máximo uma vez por passo, na primeira consulta depois que andaram"""
+
+    def __init__(self, rects_por_categoria, eixo=0):
+        self.rects_por_categoria = rects_por_categoria  # categoria -> função que lê o rect atual da entidade
+        self.eixo = eixo  # 0 = x, 1 = y
+        self.entradas = []  # [início, fim, categoria, entidade], em ordem de início
+        self.inicios = []  # Início de cada entrada, paralelo a entradas, para a busca binária
+        self.registros = {}  # chave_entidade(entidade) -> entrada
+        self.maior_extensao = 0
+        self.movidas = False  # As entidades andaram desde a última ordenação
+        self.trocas = 0  # Trocas da última ordenação - perto de zero quando as entidades andam pouco
+
+    def medir(self, entrada):
+        rect = self.rects_por_categoria[entrada[2]](entrada[3])
+        if self.eixo == 0:
+            entrada[0], entrada[1] = rect.left, rect.right
+        else:
+            entrada[0], entrada[1] = rect.top, rect.bottom
+
+    def inserir(self, categoria, entidade):
+        entrada = [0, 0, categoria, entidade]
+        self.medir(entrada)
+        posicao = bisect_right(self.inicios, entrada[0])
+        self.entradas.insert(posicao, entrada)
+        self.inicios.insert(posicao, entrada[0])
+        self.registros[chave_entidade(entidade)] = entrada
+        self.maior_extensao = max(self.maior_extensao, entrada[1] - entrada[0])
+
+    def remover(self, entidade):
+        entrada = self.registros.pop(chave_entidade(entidade), None)
+        if entrada is None:
+            return
+        posicao = bisect_left(self.inicios, entrada[0])
+        while self.entradas[posicao] is not entrada:
+            posicao += 1
+        del self.entradas[posicao]
+        del self.inicios[posicao]
+
+    def limpar(self):
+        self.entradas.clear()
+        self.inicios.clear()
+        self.registros.clear()
+        self.maior_extensao = 0
+        self.movidas = False
+
+    def marcar_movidas(self):
+        """Chamado uma vez por passo depois do movimento: só marca, a reordenação espera alguma consulta"""
+        self.movidas = True
+
+    def reordenar(self):
+        """Relê os intervalos e reordena; a ordem do último passo já está quase certa, então fica perto de O(n)"""
+        entradas = self.entradas
+        for entrada in entradas:
+            self.medir(entrada)
+
+        self.trocas = 0
+        for i in range(1, len(entradas)):
+            entrada = entradas[i]
+            j = i - 1
+            while j >= 0 and entradas[j][0] > entrada[0]:
+                entradas[j + 1] = entradas[j]
+                j -= 1
+                self.trocas += 1
+            entradas[j + 1] = entrada
+
+        self.inicios[:] = [entrada[0] for entrada in entradas]
+        self.maior_extensao = max((entrada[1] - entrada[0] for entrada in entradas), default=0)
+        self.movidas = False
+
+    def consultar(self, inicio, fim, categorias=None):
+        """Entradas cujo intervalo cruza [inicio, fim) - busca binária mais o trecho que pode sobrepor"""
+        if self.movidas:
+            self.reordenar()
+        primeiro = bisect_right(self.inicios, inicio - self.maior_extensao)
+        ultimo = bisect_left(self.inicios, fim)
+        return [entrada for entrada in self.entradas[primeiro:ultimo]
+                if entrada[1] > inicio and (categorias is None or entrada[2] in categorias)]
+
+
+def caixa_feixe(inicio, fim, largura_feixe):
+    """Retângulo envolvente do feixe de inicio a fim com a espessura dada"""
+    x0, x1 = sorted((inicio[0], fim[0]))
+    y0, y1 = sorted((inicio[1], fim[1]))
+    caixa = pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+    if y0 != y1:  # Não horizontal: espessura no x
+        caixa.x -= largura_feixe // 2
+        caixa.width += largura_feixe
+    if x0 != x1:  # Não vertical: espessura no y
+        caixa.y -= largura_feixe // 2
+        caixa.height += largura_feixe
+    return caixa
+
+
+def feixe_atinge(inicio, fim, largura_feixe, rect, caixa=None):
+    """Teste preciso de um feixe contra um rect; feixes inclinados usam clipline no rect engordado"""
+    if caixa is None:
+        caixa = caixa_feixe(inicio, fim, largura_feixe)
+    if not caixa.colliderect(rect):
+        return False
+    if inicio[0] == fim[0] or inicio[1] == fim[1]:
+        return True
+    return bool(rect.inflate(largura_feixe, largura_feixe).clipline(inicio, fim))
+
+
+# Rect atual de cada categoria que os feixes atingem (bosses e drones podem trocar de rect)
+RECTS_ALVO_FEIXE = {
+    "meteoro": lambda meteoro: mundo.obter(meteoro, "transform"),
+    "boss": lambda boss: boss.rect,
+    "drone": lambda drone: drone.rect,
+}
+
+indice_feixes = IndiceVarredura(RECTS_ALVO_FEIXE, eixo=0)
+
+
+def acertos_feixe(inicio, fim, largura_feixe, categorias=None):
+    """(categoria, entidade) atingidas pelo feixe, consultando o índice pelo intervalo em x do feixe"""
+    caixa = caixa_feixe(inicio, fim, largura_feixe)
+    return [(categoria, entidade)
+            for _, _, categoria, entidade in indice_feixes.consultar(caixa.left, caixa.right, categorias)
+            if feixe_atinge(inicio, fim, largura_feixe, RECTS_ALVO_FEIXE[categoria](entidade), caixa)]
+
+
+# == MAPA DE OCUPAÇÃO DO CAMPO ==
+class MapaOcupacao:
+    """Bitmap de células ocupadas e campo de distâncias; responde qual célula livre fica mais perto de um ponto"""
+
+    def __init__(self, area, tamanho_celula=40):
+        self.area = area
+        self.tamanho_celula = tamanho_celula
+        self.colunas = -(-area.width // tamanho_celula)
+        self.linhas = -(-area.height // tamanho_celula)
+        self.ocupacao = None
+        self.campo_folga = None
+
+        meio = tamanho_celula / 2
+        if np is not None:
+            self.centros_x = area.x + np.arange(self.colunas)[None, :] * tamanho_celula + meio
+            self.centros_y = area.y + np.arange(self.linhas)[:, None] * tamanho_celula + meio
+        else:
+            self.centros_x = [area.x + c * tamanho_celula + meio for c in range(self.colunas)]
+            self.centros_y = [area.y + l * tamanho_celula + meio for l in range(self.linhas)]
+        self.reconstruir([])
+
+    def fatia_celulas(self, rect):
+        """(linha0, linha1, coluna0, coluna1) das células que o rect toca, ou None se estiver fora da área"""
+        t = self.tamanho_celula
+        c0 = max(0, (rect.left - self.area.x) // t)
+        c1 = min(self.colunas, (rect.right - 1 - self.area.x) // t + 1)
+        l0 = max(0, (rect.top - self.area.y) // t)
+        l1 = min(self.linhas, (rect.bottom - 1 - self.area.y) // t + 1)
+        if c0 >= c1 or l0 >= l1:
+            return None
+        return l0, l1, c0, c1
+
+    def reconstruir(self, rects):
+        """Rasteriza os rects: cada um marca só as células que cobre, em vez de testar célula por célula"""
+        if np is not None:
+            self.ocupacao = np.zeros((self.linhas, self.colunas), dtype=bool)
+        else:
+            self.ocupacao = [[False] * self.colunas for _ in range(self.linhas)]
+
+        for rect in rects:
+            fatia = self.fatia_celulas(rect)
+            if fatia is None:
+                continue
+            l0, l1, c0, c1 = fatia
+            if np is not None:
+                self.ocupacao[l0:l1, c0:c1] = True
+            else:
+                for linha in range(l0, l1):
+                    self.ocupacao[linha][c0:c1] = [True] * (c1 - c0)
+        self.campo_folga = None
+
+    def rect_celula(self, linha, coluna):
+        t = self.tamanho_celula
+        return pygame.Rect(self.area.x + coluna * t, self.area.y + linha * t, t, t)
+
+    def folga(self):
+        """Distância (px) do centro de cada célula até a célula ocupada mais próxima - inf se nada ocupa o campo"""
+        if self.campo_folga is not None:
+            return self.campo_folga
+
+        if np is not None:
+            linhas_ocupadas, colunas_ocupadas = np.nonzero(self.ocupacao)
+            if len(linhas_ocupadas) == 0:
+                self.campo_folga = np.full((self.linhas, self.colunas), np.inf)
+            else:
+                ox = self.centros_x[0, colunas_ocupadas]
+                oy = self.centros_y[linhas_ocupadas, 0]
+                d2 = (self.centros_x[..., None] - ox) ** 2 + (self.centros_y[..., None] - oy) ** 2
+                self.campo_folga = np.sqrt(d2.min(axis=2))
+        else:
+            ocupadas = [(self.centros_x[c], self.centros_y[l])
+                        for l in range(self.linhas) for c in range(self.colunas) if self.ocupacao[l][c]]
+            self.campo_folga = [[min((math.hypot(cx - ox, cy - oy) for ox, oy in ocupadas), default=float('inf'))
+                                 for cx in self.centros_x] for cy in self.centros_y]
+        return self.campo_folga
+
+    def celula_livre_mais_proxima(self, ponto, folga_minima=0):
+        """Rect da célula livre mais próxima do ponto (com pelo menos folga_minima px até a ocupada mais perto)"""
+        px, py = ponto
+        if np is not None:
+            validas = ~self.ocupacao
+            if folga_minima:
+                validas &= self.folga() >= folga_minima
+            if not validas.any():
+                return None
+            d2 = np.where(validas, (self.centros_x - px) ** 2 + (self.centros_y - py) ** 2, np.inf)
+            linha, coluna = divmod(int(np.argmin(d2)), self.colunas)
+            return self.rect_celula(linha, coluna)
+
+        folga = self.folga() if folga_minima else None
+        candidatas = [((cx - px) ** 2 + (cy - py) ** 2, l, c)
+                      for l, cy in enumerate(self.centros_y) for c, cx in enumerate(self.centros_x)
+                      if not self.ocupacao[l][c] and (folga is None or folga[l][c] >= folga_minima)]
+        if not candidatas:
+            return None
+        _, linha, coluna = min(candidatas)
+        return self.rect_celula(linha, coluna)
+
+
+# Mesma área que o teleporte sempre usou: colunas de 40 px e uma margem de 100 px em cima e embaixo
+mapa_ocupacao = MapaOcupacao(pygame.Rect(0, 100, largura - 40, altura - 200), 40)
+
+
+# Reconstruir o pacote quando alguma fonte mudou ou apareceu variante nova (ou sob --empacotar-assets)
+if EMPACOTAR_ASSETS or pacote_assets.desatualizado:
+    pacote_assets.salvar()
+if EMPACOTAR_ASSETS:
+    pygame.quit()
+    sys.exit()
+
+for imagem_mascara in imagens_assets.values():
+    obter_mascara(imagem_mascara)
+if CONFIG_QUALIDADE["pre_renderizar_rotacoes"]:
+    pre_renderizar_rotacoes((meteoro_img, meteoro_grande_img, meteoro_enorme_img, projetil_img, portal_img))
 
 # == SISTEMA DE PROGRESSÃO E DESBLOQUEIO ==
 fonte = pygame.font.Font(None, 36)
@@ -668,7 +2335,7 @@ habilidades_naves = [
 ]
 
 # == SISTEMA DE TEMPO E NÍVEIS ==
-tempo_inicio = pygame.time.get_ticks()
+tempo_inicio = relogio.agora
 tempo_atual_jogo = 0
 nivel = 1
 velocidade_base = 3
@@ -680,7 +2347,7 @@ max_vida_admin = 10  # Vida máxima para naves admin
 # == SISTEMA DE MUNIÇÃO E RECARGA ==
 municao_maxima = 10
 municao_atual = municao_maxima
-ultimo_recarga = pygame.time.get_ticks()
+ultimo_recarga = relogio.agora
 intervalo_recarga = 10000
 recarregando = False
 tempo_inicio_recarga = 0
@@ -734,23 +2401,498 @@ nave_admin_solicitada = None
 
 # == SISTEMA DE ACELERAÇÃO DE METEOROS ==
 fator_aceleracao_meteoros = 0.0005  # REDUZIDO: Quanto os meteoros aceleram por frame
-tempo_jogo_inicio = pygame.time.get_ticks()
+tempo_jogo_inicio = relogio.agora
 
 # == SISTEMA DE SALVAMENTO ==
 progresso_salvo = None
 
+# == MUNDO DE ENTIDADES ==
+BITS_INDICE_ENTIDADE = 20
+MASCARA_INDICE_ENTIDADE = (1 << BITS_INDICE_ENTIDADE) - 1
+
+# Componentes conhecidos: dados (transform = Rect, velocidade = [vx, vy], rotacao = [ângulo, velocidade angular],
+# vida, sprite, congelado = fim do congelamento, ator = objeto de boss/drone) e marcadores do tipo de entidade
+COMPONENTES_ENTIDADE = ("transform", "velocidade", "rotacao", "vida", "sprite", "congelavel", "congelado", "ator",
+                        "meteoro", "coracao", "portal", "boss", "drone")
+
+
+class ArmazemComponente:
+    """Armazém denso de um componente: listas paralelas de entidades e valores, posição por entidade e remoção
+    trocando com o último. Os valores são os objetos que o jogo já usa (Rect, [vx, vy]) e não colunas numéricas"""
+
+    def __init__(self):
+        self.entidades = []
+        self.valores = []
+        self.posicoes = {}  # entidade -> índice em entidades/valores
+
+    def __len__(self):
+        return len(self.entidades)
+
+    def __contains__(self, entidade):
+        return entidade in self.posicoes
+
+    def definir(self, entidade, valor):
+        posicao = self.posicoes.get(entidade)
+        if posicao is None:
+            self.posicoes[entidade] = len(self.entidades)
+            self.entidades.append(entidade)
+            self.valores.append(valor)
+        else:
+            self.valores[posicao] = valor
+
+    def obter(self, entidade):
+        return self.valores[self.posicoes[entidade]]
+
+    def remover(self, entidade):
+        posicao = self.posicoes.pop(entidade, None)
+        if posicao is None:
+            return
+        ultima = self.entidades.pop()
+        valor_ultimo = self.valores.pop()
+        if ultima != entidade:
+            self.entidades[posicao] = ultima
+            self.valores[posicao] = valor_ultimo
+            self.posicoes[ultima] = posicao
+
+    def limpar(self):
+        self.entidades.clear()
+        self.valores.clear()
+        self.posicoes.clear()
+
+
+class MundoEntidades:
+    """Entidades com IDs geracionais (índice reaproveitado + geração) e um armazém denso por componente"""
+
+    def __init__(self):
+        self.geracoes = []
+        self.livres = []
+        self.componentes = {nome: ArmazemComponente() for nome in COMPONENTES_ENTIDADE}
+
+    def criar(self, **componentes):
+        if self.livres:
+            indice = self.livres.pop()
+        else:
+            indice = len(self.geracoes)
+            self.geracoes.append(0)
+        entidade = (self.geracoes[indice] << BITS_INDICE_ENTIDADE) | indice
+        for nome, valor in componentes.items():
+            self.componentes[nome].definir(entidade, valor)
+        return entidade
+
+    def vivo(self, entidade):
+        indice = entidade & MASCARA_INDICE_ENTIDADE
+        return indice < len(self.geracoes) and self.geracoes[indice] == entidade >> BITS_INDICE_ENTIDADE
+
+    def destruir(self, entidade):
+        """Remove a entidade de todos os componentes; IDs antigos param de valer porque a geração avança"""
+        if not self.vivo(entidade):
+            return False
+        for armazem in self.componentes.values():
+            armazem.remover(entidade)
+        indice = entidade & MASCARA_INDICE_ENTIDADE
+        self.geracoes[indice] += 1
+        self.livres.append(indice)
+        return True
+
+    def obter(self, entidade, nome):
+        return self.componentes[nome].obter(entidade)
+
+    def definir(self, entidade, nome, valor=True):
+        self.componentes[nome].definir(entidade, valor)
+
+    def tem(self, entidade, nome):
+        return entidade in self.componentes[nome]
+
+    def remover_componente(self, entidade, nome):
+        self.componentes[nome].remover(entidade)
+
+    def quantidade(self, nome):
+        return len(self.componentes[nome])
+
+    def entidades(self, nome):
+        """Cópia das entidades com o componente (pode destruir enquanto itera)"""
+        return list(self.componentes[nome].entidades)
+
+    def percorrer(self, *nomes):
+        """(entidade, valor1, valor2, ...) de quem tem todos os componentes, lidos direto dos arrays densos
+        sem montar lista - não crie nem destrua entidades durante o laço (para isso use consultar)"""
+        armazens = [self.componentes[nome] for nome in nomes]
+        if len(armazens) == 1:
+            yield from zip(armazens[0].entidades, armazens[0].valores)
+            return
+        base = min(armazens, key=len)
+        for entidade in base.entidades:
+            for armazem in armazens:
+                if entidade not in armazem.posicoes:
+                    break
+            else:
+                yield (entidade,) + tuple(armazem.valores[armazem.posicoes[entidade]] for armazem in armazens)
+
+    def consultar(self, *nomes):
+        """Cópia em lista do que percorrer devolve (pode criar e destruir enquanto itera)"""
+        return list(self.percorrer(*nomes))
+
+    def limpar(self):
+        """Destrói tudo de uma vez; as gerações avançam, então nenhum ID de antes volta a valer"""
+        for armazem in self.componentes.values():
+            armazem.limpar()
+        self.geracoes = [geracao + 1 for geracao in self.geracoes]
+        self.livres = list(range(len(self.geracoes)))
+
+
+mundo = MundoEntidades()
+
+
+class AtorMundo:
+    """Base de bosses e drones: ao entrar em jogo o objeto vira entidade (congelamento); o rect fica no objeto"""
+
+    entidade = None
+
+    def registrar_no_mundo(self, marcador):
+        self.entidade = mundo.criar(ator=self, congelavel=True, **{marcador: True})
+
+    def sair_do_mundo(self):
+        if self.entidade is not None:
+            mundo.destruir(self.entidade)
+            self.entidade = None
+
+    @property
+    def congelado(self):
+        return self.entidade is not None and mundo.tem(self.entidade, "congelado")
+
+
+def adicionar_boss(boss):
+    boss.registrar_no_mundo("boss")
+    bosses.append(boss)
+    indice_feixes.inserir("boss", boss)
+
+
+def remover_boss(boss):
+    bosses.remove(boss)
+    boss.sair_do_mundo()
+    indice_feixes.remover(boss)
+
+
+def limpar_inimigos():
+    """Tira todos os bosses e drones de jogo, inclusive do mundo"""
+    for boss in bosses[:]:
+        remover_boss(boss)
+    for drone in drones[:]:
+        remover_drone(drone)
+
+
+def rect_atual(entidade):
+    """Rect da entidade agora: bosses e drones leem o do objeto (que pode ser trocado), o resto o transform"""
+    if mundo.tem(entidade, "ator"):
+        return mundo.obter(entidade, "ator").rect
+    return mundo.obter(entidade, "transform")
+
+
+def adicionar_drone(drone):
+    drone.registrar_no_mundo("drone")
+    drones.append(drone)
+    indice_feixes.inserir("drone", drone)
+
+
+def remover_drone(drone):
+    drones.remove(drone)
+    drone.sair_do_mundo()
+    indice_feixes.remover(drone)
+
+
+def congelar_inimigos(tempo_fim):
+    """Congela de uma vez tudo que tem o componente congelavel (meteoros, bosses e drones)"""
+    congelado = mundo.componentes["congelado"]
+    for entidade in mundo.componentes["congelavel"].entidades:
+        congelado.definir(entidade, tempo_fim)
+
+
+def descongelar_inimigos():
+    mundo.componentes["congelado"].limpar()
+
+
+# == MOTOR DE PROJÉTEIS ==
+DONO_JOGADOR = 0
+DONO_BOSS = 1
+TAMANHO_PROJETIL = {DONO_JOGADOR: (15, 25), DONO_BOSS: (10, 20)}
+
+# Colunas da tabela de projéteis: uma linha por tiro vivo
+COLUNAS_PROJETIL = ("x", "y", "vx", "vy", "rotacao", "giro", "largura", "altura", "x_anterior", "y_anterior", "dono")
+(P_X, P_Y, P_VX, P_VY, P_ROTACAO, P_GIRO,
+ P_LARGURA, P_ALTURA, P_X_ANTERIOR, P_Y_ANTERIOR, P_DONO) = range(len(COLUNAS_PROJETIL))
+
+
+class MotorProjeteis:
+    """Pool de projéteis numa tabela de capacidade fixa; mover, descartar e colidir valem para a tabela inteira.
+
+    Os vivos ocupam sempre as primeiras linhas, na ordem em que foram emitidos. Sem NumPy a tabela é uma
+    lista de linhas com as mesmas colunas.
+    """
+
+    def __init__(self, capacidade):
+        self.capacidade = capacidade
+        self.quantidade = 0
+        self.perdidos = 0  # tiros que não couberam na tabela
+        if np is not None:
+            self.dados = np.zeros((capacidade, len(COLUNAS_PROJETIL)))
+        else:
+            self.dados = []
+
+    def __len__(self):
+        return self.quantidade
+
+    def vivos(self):
+        """Linhas dos projéteis vivos (com NumPy, uma view da tabela)"""
+        return self.dados[:self.quantidade]
+
+    def emitir(self, dono, x, y, vx, vy, rotacao=0.0, giro=0.0):
+        if self.quantidade >= self.capacidade:
+            self.perdidos += 1
+            return False
+        largura_projetil, altura_projetil = TAMANHO_PROJETIL[dono]
+        linha = [x, y, vx, vy, rotacao, giro, largura_projetil, altura_projetil, x, y, dono]
+        if np is not None:
+            self.dados[self.quantidade] = linha
+        else:
+            self.dados.append(linha)
+        self.quantidade += 1
+        return True
+
+    def emitir_lote(self, dono, x, y, tabela):
+        """Escreve uma rajada inteira de uma vez: cada linha da tabela é [dx, dy, vx, vy] a partir de (x, y)"""
+        cabem = min(len(tabela), self.capacidade - self.quantidade)
+        self.perdidos += len(tabela) - cabem
+        if np is None:
+            for dx, dy, vx, vy in tabela[:cabem]:
+                self.emitir(dono, x + dx, y + dy, vx, vy)
+            return cabem
+
+        bloco = self.dados[self.quantidade:self.quantidade + cabem]
+        bloco[:, P_X] = x + tabela[:cabem, 0]
+        bloco[:, P_Y] = y + tabela[:cabem, 1]
+        bloco[:, P_VX] = tabela[:cabem, 2]
+        bloco[:, P_VY] = tabela[:cabem, 3]
+        bloco[:, P_ROTACAO] = 0
+        bloco[:, P_GIRO] = 0
+        bloco[:, P_LARGURA], bloco[:, P_ALTURA] = TAMANHO_PROJETIL[dono]
+        bloco[:, P_X_ANTERIOR] = bloco[:, P_X]
+        bloco[:, P_Y_ANTERIOR] = bloco[:, P_Y]
+        bloco[:, P_DONO] = dono
+        self.quantidade += cabem
+        return cabem
+
+    def limpar(self):
+        self.quantidade = 0
+        if np is None:
+            self.dados.clear()
+
+    def truncar(self, quantidade):
+        """Mantém só as primeiras linhas (as mais antigas) e descarta o resto"""
+        self.quantidade = min(self.quantidade, quantidade)
+        if np is None:
+            del self.dados[quantidade:]
+
+    def manter(self, mascara):
+        """Compacta a tabela mantendo só as linhas marcadas, sem mudar a ordem"""
+        if np is not None:
+            mantidos = self.vivos()[mascara]
+            self.quantidade = len(mantidos)
+            self.dados[:self.quantidade] = mantidos
+        else:
+            self.dados = [linha for linha, manter in zip(self.dados, mascara) if manter]
+            self.quantidade = len(self.dados)
+
+    def remover(self, indices):
+        """Remove várias linhas de uma vez (índices repetidos não atrapalham)"""
+        if not indices:
+            return
+        if np is not None:
+            mascara = np.ones(self.quantidade, dtype=bool)
+            mascara[indices] = False
+        else:
+            removidos = set(indices)
+            mascara = [i not in removidos for i in range(self.quantidade)]
+        self.manter(mascara)
+
+    def definir_velocidade(self, dono, vx, vy):
+        """Mesma velocidade para todos os tiros de um dono (o do jogador muda com a velocidade dupla)"""
+        if np is not None:
+            vivos = self.vivos()
+            selecao = vivos[:, P_DONO] == dono
+            vivos[selecao, P_VX] = vx
+            vivos[selecao, P_VY] = vy
+        else:
+            for linha in self.dados:
+                if linha[P_DONO] == dono:
+                    linha[P_VX] = vx
+                    linha[P_VY] = vy
+
+    def guardar_anteriores(self):
+        if np is not None:
+            vivos = self.vivos()
+            vivos[:, P_X_ANTERIOR] = vivos[:, P_X]
+            vivos[:, P_Y_ANTERIOR] = vivos[:, P_Y]
+        else:
+            for linha in self.dados:
+                linha[P_X_ANTERIOR] = linha[P_X]
+                linha[P_Y_ANTERIOR] = linha[P_Y]
+
+    def mover(self):
+        if np is not None:
+            vivos = self.vivos()
+            vivos[:, P_X] += vivos[:, P_VX]
+            vivos[:, P_Y] += vivos[:, P_VY]
+            vivos[:, P_ROTACAO] += vivos[:, P_GIRO]
+        else:
+            for linha in self.dados:
+                linha[P_X] += linha[P_VX]
+                linha[P_Y] += linha[P_VY]
+                linha[P_ROTACAO] += linha[P_GIRO]
+
+    def descartar_fora(self, area):
+        """Remove quem já saiu inteiro da área"""
+        if np is not None:
+            vivos = self.vivos()
+            x, y = vivos[:, P_X], vivos[:, P_Y]
+            self.manter((x + vivos[:, P_LARGURA] >= area.left) & (x <= area.right)
+                        & (y + vivos[:, P_ALTURA] >= area.top) & (y <= area.bottom))
+        else:
+            self.manter([linha[P_X] + linha[P_LARGURA] >= area.left and linha[P_X] <= area.right
+                         and linha[P_Y] + linha[P_ALTURA] >= area.top and linha[P_Y] <= area.bottom
+                         for linha in self.dados])
+
+    def indices(self, dono):
+        if np is not None:
+            return np.flatnonzero(self.vivos()[:, P_DONO] == dono).tolist()
+        return [i for i, linha in enumerate(self.dados) if linha[P_DONO] == dono]
+
+    def rect(self, i):
+        linha = self.dados[i]
+        return pygame.Rect(int(linha[P_X]), int(linha[P_Y]), int(linha[P_LARGURA]), int(linha[P_ALTURA]))
+
+    def rotacao(self, i):
+        return float(self.dados[i][P_ROTACAO])
+
+    def acertos(self, rect, dono):
+        """Índices dos tiros do dono cujo rect encosta no rect dado - um teste só para a tabela toda"""
+        if np is None:
+            return [i for i, linha in enumerate(self.dados) if linha[P_DONO] == dono and self.rect(i).colliderect(rect)]
+        vivos = self.vivos()
+        caixas = vivos[:, [P_X, P_Y, P_LARGURA, P_ALTURA]].astype(int)  # trunca como pygame.Rect
+        x, y = caixas[:, 0], caixas[:, 1]
+        mascara = ((vivos[:, P_DONO] == dono) & (x < rect.right) & (x + caixas[:, 2] > rect.left)
+                   & (y < rect.bottom) & (y + caixas[:, 3] > rect.top))
+        return np.flatnonzero(mascara).tolist()
+
+    def posicoes_interpoladas(self, alpha, dono):
+        """[x, y, rotacao] dos tiros do dono entre o passo anterior e o atual, já arredondados para desenhar"""
+        if np is None:
+            return [[round(linha[P_X_ANTERIOR] + (linha[P_X] - linha[P_X_ANTERIOR]) * alpha),
+                     round(linha[P_Y_ANTERIOR] + (linha[P_Y] - linha[P_Y_ANTERIOR]) * alpha), linha[P_ROTACAO]]
+                    for linha in self.dados if linha[P_DONO] == dono]
+        vivos = self.vivos()
+        vivos = vivos[vivos[:, P_DONO] == dono]
+        x = np.rint(vivos[:, P_X_ANTERIOR] + (vivos[:, P_X] - vivos[:, P_X_ANTERIOR]) * alpha)
+        y = np.rint(vivos[:, P_Y_ANTERIOR] + (vivos[:, P_Y] - vivos[:, P_Y_ANTERIOR]) * alpha)
+        return np.column_stack((x, y, vivos[:, P_ROTACAO])).tolist()
+
+
+motor_projeteis = MotorProjeteis(CONFIG_QUALIDADE["capacidade_projeteis"])
+
+
+# == PADRÕES DE TIRO DOS BOSSES ==
+# Emissores declarativos. Ângulos em graus, 0 = para baixo e positivo = para a direita; velocidade é um número
+# ou (horizontal, vertical). Cada padrão vira uma tabela [dx, dy, vx, vy] por fase, calculada uma vez só.
+PADROES_TIRO = {
+    "linha": {"tipo": "linha", "quantidade": 3, "espacamento": 20, "velocidade": 7},
+    "leque": {"tipo": "leque", "quantidade": 5, "abertura": 60, "velocidade": (4, 7)},
+    "leque_mirado": {"tipo": "leque", "quantidade": 5, "abertura": 40, "velocidade": 5, "mirar": True},
+    "anel": {"tipo": "anel", "quantidade": 16, "raio": 20, "velocidade": 3.5},
+    "espiral": {"tipo": "espiral", "quantidade": 8, "passo": 1, "velocidade": (5, 6)},
+    "onda": {"tipo": "onda", "quantidade": 9, "abertura": 80, "amplitude": 20, "fases": 16, "velocidade": 4.5},
+}
+
+# Padrão da segunda metade da vida de cada tipo de boss comum (a primeira metade atira em linha)
+PADRAO_FASE2_BOSS = {1: "leque_mirado", 2: "anel", 3: "onda"}
+
+PASSO_MIRA = 5  # graus entre as direções pré-calculadas dos padrões que miram no jogador
+
+
+class PadraoTiro:
+    """Padrão compilado: tabelas de deslocamento e velocidade por fase, prontas para ir ao motor numa rajada"""
+
+    def __init__(self, definicao):
+        tipo = definicao["tipo"]
+        quantidade = definicao["quantidade"]
+        velocidade = definicao["velocidade"]
+        velocidade_x, velocidade_y = velocidade if isinstance(velocidade, tuple) else (velocidade, velocidade)
+        raio = definicao.get("raio", 0)
+        abertura = definicao.get("abertura", 0)
+        self.mirar = definicao.get("mirar", False)
+
+        # Ângulo de cada tiro numa fase; as fases são espiral girando, anel alternado, onda ou direções de mira
+        leque = [(-abertura / 2 + i * abertura / (quantidade - 1)) if quantidade > 1 else 0
+                 for i in range(quantidade)]
+        if tipo == "linha":
+            self.passo, self.fases = 0, 1
+            angulos = lambda fase: [0] * quantidade
+        elif tipo == "leque":
+            self.passo, self.fases = (PASSO_MIRA, 360 // PASSO_MIRA) if self.mirar else (0, 1)
+            angulos = lambda fase: [angulo + fase * self.passo for angulo in leque]
+        elif tipo == "anel":
+            self.passo, self.fases = 180 / quantidade, 2
+            angulos = lambda fase: [fase * self.passo + i * 360 / quantidade for i in range(quantidade)]
+        elif tipo == "espiral":
+            self.passo = definicao["passo"]
+            self.fases = max(1, round(360 / quantidade / self.passo))
+            angulos = lambda fase: [fase * self.passo + i * 360 / quantidade for i in range(quantidade)]
+        elif tipo == "onda":
+            self.passo, self.fases = 0, definicao["fases"]
+            amplitude = definicao["amplitude"]
+            angulos = lambda fase: [angulo + amplitude * math.sin(2 * math.pi * (fase / self.fases + i / quantidade))
+                                    for i, angulo in enumerate(leque)]
+        else:
+            raise ValueError(f"Emissor desconhecido: {tipo}")
+
+        espacamento = definicao.get("espacamento", 0) if tipo == "linha" else 0
+        tabelas = []
+        for fase in range(self.fases):
+            tabela = []
+            for i, angulo in enumerate(angulos(fase)):
+                seno, cosseno = math.sin(math.radians(angulo)), math.cos(math.radians(angulo))
+                tabela.append([(i - (quantidade - 1) / 2) * espacamento + seno * raio, cosseno * raio,
+                               seno * velocidade_x, cosseno * velocidade_y])
+            tabelas.append(tabela)
+        self.tabelas = np.array(tabelas) if np is not None else tabelas
+
+    def disparar(self, x, y, fase=0, alvo=None, motor=None):
+        """Manda a rajada da fase para o motor (o do jogo, se nenhum for dado); padrões que miram escolhem a fase
+        pela direção do alvo"""
+        if motor is None:
+            motor = motor_projeteis
+        if self.mirar and alvo is not None:
+            fase = round(math.degrees(math.atan2(alvo[0] - x, alvo[1] - y)) / self.passo)
+        return motor.emitir_lote(DONO_BOSS, x, y, self.tabelas[int(fase) % self.fases])
+
+
+padroes_compilados = {}
+
+
+def padrao_tiro(nome, **ajustes):
+    """Padrão de PADROES_TIRO compilado (com ajustes opcionais); cada variação é compilada uma vez só"""
+    chave = (nome,) + tuple(sorted(ajustes.items()))
+    if chave not in padroes_compilados:
+        padroes_compilados[chave] = PadraoTiro({**PADROES_TIRO[nome], **ajustes})
+    return padroes_compilados[chave]
+
+
 # == VARIÁVEIS GLOBAIS DO JOGO ==
 jogador = pygame.Rect(180, 500, 40, 40)
 velocidade_jogador = 5
-meteoros = []
-projeteis = []
-projeteis_boss = []
 explosoes = []
-coracoes = []
-portais = []
-ultimo_coracao = pygame.time.get_ticks()
+ultimo_coracao = relogio.agora
 intervalo_coracoes = 15000
-ultimo_portal = pygame.time.get_ticks()
+ultimo_portal = relogio.agora
 intervalo_portais = 30000
 
 # == EFEITOS ESPECIAIS ==
@@ -758,7 +2900,7 @@ portal_rotacao = 0
 
 
 # == CLASSE DRONE ==
-class Drone:
+class Drone(AtorMundo):
     def __init__(self, x, y, lado):
         self.x = x
         self.y = y
@@ -768,16 +2910,14 @@ class Drone:
         self.velocidade = 1.5
         self.escudo_ativado = False
         self.escudo_tempo_fim = 0
-        self.ultimo_escudo = pygame.time.get_ticks()
+        self.ultimo_escudo = relogio.agora
         self.escudo_cooldown = 8000
-        self.congelado = False
-        self.congelado_tempo = 0
 
     def atualizar(self, jogador_rect):
         if self.congelado:
             return
 
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
         if not self.escudo_ativado and tempo_atual - self.ultimo_escudo > self.escudo_cooldown:
             self.escudo_ativado = True
             self.escudo_tempo_fim = tempo_atual + 3000
@@ -810,7 +2950,7 @@ class Drone:
 
     def desenhar_escudo(self, surface):
         if self.escudo_ativado:
-            tempo_atual = pygame.time.get_ticks()
+            tempo_atual = relogio.agora
             raio = 25 + int(3 * math.sin(tempo_atual * 0.01))
 
             for i in range(3):
@@ -824,7 +2964,7 @@ class Drone:
 
 
 # == CLASSE BOSS NIVEL 15 ==
-class BossNivel15:
+class BossNivel15(AtorMundo):
     def __init__(self):
         self.vida_maxima = 200  # Vida suficiente para resistir a 4 lasers (50 de dano cada)
         self.vida = self.vida_maxima
@@ -835,7 +2975,7 @@ class BossNivel15:
         self.intervalo_tiros = 1000
         self.tiros_por_cycle = 3
         self.cycles_completos = 0
-        self.ultimo_tiro = pygame.time.get_ticks()
+        self.ultimo_tiro = relogio.agora
         self.ultimo_laser = 0
         self.laser_cooldown = 5000
         self.laser_ativado = False
@@ -846,14 +2986,14 @@ class BossNivel15:
         self.escudo_duracao = 3000
         self.bosses_gemeos = []  # Para os bosses do nível 10 que aparecem na metade da vida
         self.gemeos_ativados = False
-        self.congelado = False
-        self.congelado_tempo = 0
+        self.padroes_fase = {1: padrao_tiro("linha", quantidade=self.tiros_por_cycle), 2: padrao_tiro("anel")}
+        self.rajadas = 0
 
     def atualizar(self, jogador_rect):
         if self.congelado:
             return
 
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
 
         # Movimento
         if self.rect.centerx < jogador_rect.centerx:
@@ -914,17 +3054,12 @@ class BossNivel15:
         self.bosses_gemeos.append(boss_direita)
 
     def atirar(self):
-        """Dispara 3 tiros normais"""
-        for i in range(self.tiros_por_cycle):
-            offset = (i - 1) * 20  # -20, 0, 20
-            x = self.rect.centerx - 5 + offset
-            y = self.rect.bottom
-
-            projeteis_boss.append({
-                "rect": pygame.Rect(x, y, 10, 20),
-                "velocidade_x": 0,
-                "velocidade_y": 7
-            })
+        """Dispara 3 tiros em linha; com os gêmeos em campo passa a soltar anéis"""
+        if self.gemeos_ativados:
+            self.padroes_fase[2].disparar(self.rect.centerx - 5, self.rect.centery, self.rajadas)
+        else:
+            self.padroes_fase[1].disparar(self.rect.centerx - 5, self.rect.bottom)
+        self.rajadas += 1
 
     def levar_dano(self, dano):
         if self.escudo_ativado:
@@ -943,11 +3078,11 @@ class BossNivel15:
         vida_largura = int((self.vida / self.vida_maxima) * barra_largura)
         pygame.draw.rect(surface, (255, 255, 0), (x, y, vida_largura, barra_altura))
 
-    def desenhar_laser(self, surface, jogador_rect):
+    def laser_visivel(self):
         if not self.laser_ativado:
             return False
 
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
         tempo_decorrido_laser = tempo_atual - self.laser_tempo_inicio
 
         if tempo_decorrido_laser > self.laser_duracao:
@@ -957,6 +3092,26 @@ class BossNivel15:
         if tempo_decorrido_laser > self.laser_duracao * 0.7:
             if int(tempo_atual / 100) % 2 == 0:
                 return False
+        return True
+
+    def atualizar_laser(self, jogador_rect):
+        """Cria os efeitos do laser e retorna True se ele atingiu o jogador"""
+        if not self.laser_visivel():
+            return False
+
+        largura_lazer = 30
+        start_pos = (self.rect.centerx, self.rect.bottom)
+        end_pos = (self.rect.centerx, altura)
+
+        # Manter o feixe visual (rastro, brilhos e faíscas)
+        efeitos.manter_feixe(self, start_pos, end_pos, (255, 100, 100), 20, 500, alcance_faiscas=100)
+
+        # Verificar colisão com jogador
+        return feixe_atinge(start_pos, end_pos, largura_lazer, jogador_rect)
+
+    def desenhar_laser(self, surface):
+        if not self.laser_visivel():
+            return
 
         # Laser do boss nível 15
         largura_lazer = 30
@@ -987,30 +3142,9 @@ class BossNivel15:
             pygame.draw.rect(surf_borda, cor_borda, (0, 0, largura_lazer + 15, altura - self.rect.bottom), 2)
             surface.blit(surf_borda, (self.rect.centerx - (largura_lazer + 15) // 2, self.rect.bottom))
 
-        # Criar rastro visual
-        efeitos.criar_rastro_laser(start_pos, end_pos, (255, 100, 100), 20, 500)
-
-        # Criar partículas de laser
-        for _ in range(15):
-            criar_particulas_laser(self.rect.centerx + random.randint(-12, 12),
-                                   self.rect.bottom + random.randint(0, 100))
-
-        # Área de colisão do laser
-        lazer_rect = pygame.Rect(
-            self.rect.centerx - largura_lazer // 2,
-            self.rect.bottom,
-            largura_lazer,
-            altura - self.rect.bottom
-        )
-
-        # Verificar colisão com jogador
-        if lazer_rect.colliderect(jogador_rect):
-            return True
-        return False
-
     def desenhar_escudo(self, surface):
         if self.escudo_ativado:
-            tempo_atual = pygame.time.get_ticks()
+            tempo_atual = relogio.agora
             raio = 65
             raio += int(8 * math.sin(tempo_atual * 0.01))
 
@@ -1031,7 +3165,7 @@ class BossNivel15:
 
 
 # == CLASSE BOSS GABRIEL (NIVEL 20) ==
-class BossGabriel:
+class BossGabriel(AtorMundo):
     def __init__(self):
         self.vida_maxima = 300
         self.vida = self.vida_maxima
@@ -1040,7 +3174,7 @@ class BossGabriel:
         self.rect = pygame.Rect(largura // 2 - self.largura // 2, 30, self.largura, self.altura)
         self.velocidade = 2
         self.intervalo_tiros = 800
-        self.ultimo_tiro = pygame.time.get_ticks()
+        self.ultimo_tiro = relogio.agora
         self.ultimo_laser = 0
         self.laser_cooldown = 4000
         self.laser_ativado = False
@@ -1052,16 +3186,15 @@ class BossGabriel:
         self.ataque_especial_ativado = False
         self.ataque_especial_tempo = 0
         self.ataque_especial_duracao = 5000
-        self.congelado = False
-        self.congelado_tempo = 0
         self.phase = 1
         self.rotacao = 0
+        self.padroes_fase = {1: padrao_tiro("leque"), 2: padrao_tiro("espiral")}
 
     def atualizar(self, jogador_rect):
         if self.congelado:
             return
 
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
         self.rotacao += 1
 
         # Mudança de fase na metade da vida
@@ -1124,28 +3257,10 @@ class BossGabriel:
         """Dispara padrões de tiros complexos"""
         if self.phase == 1:
             # Fase 1: tiros em leque
-            for i in range(5):
-                angulo = math.radians(-30 + i * 15)
-                velocidade_x = math.sin(angulo) * 4
-                velocidade_y = math.cos(angulo) * 7
-
-                projeteis_boss.append({
-                    "rect": pygame.Rect(self.rect.centerx - 5, self.rect.bottom, 10, 20),
-                    "velocidade_x": velocidade_x,
-                    "velocidade_y": velocidade_y
-                })
+            self.padroes_fase[1].disparar(self.rect.centerx - 5, self.rect.bottom)
         else:
-            # Fase 2: tiros espiralados
-            for i in range(8):
-                angulo = math.radians(self.rotacao + i * 45)
-                velocidade_x = math.sin(angulo) * 5
-                velocidade_y = math.cos(angulo) * 6
-
-                projeteis_boss.append({
-                    "rect": pygame.Rect(self.rect.centerx - 5, self.rect.centery, 10, 20),
-                    "velocidade_x": velocidade_x,
-                    "velocidade_y": velocidade_y
-                })
+            # Fase 2: tiros espiralados, a espiral acompanha a rotação do boss
+            self.padroes_fase[2].disparar(self.rect.centerx - 5, self.rect.centery, self.rotacao)
 
     def levar_dano(self, dano):
         if self.escudo_ativado:
@@ -1165,16 +3280,33 @@ class BossGabriel:
         cor_vida = (0, 255, 0) if self.phase == 1 else (255, 255, 0)
         pygame.draw.rect(surface, cor_vida, (x, y, vida_largura, barra_altura))
 
-    def desenhar_laser(self, surface, jogador_rect):
+    def laser_visivel(self):
         if not self.laser_ativado:
             return False
 
-        tempo_atual = pygame.time.get_ticks()
-        tempo_decorrido_laser = tempo_atual - self.laser_tempo_inicio
+        tempo_decorrido_laser = relogio.agora - self.laser_tempo_inicio
+        return tempo_decorrido_laser <= self.laser_duracao
 
-        if tempo_decorrido_laser > self.laser_duracao:
+    def atualizar_laser(self, jogador_rect):
+        """Retorna True se algum dos três lasers atingiu o jogador"""
+        if not self.laser_visivel():
             return False
 
+        largura_lazer = 20
+        for i in range(3):
+            offset = (i - 1) * 40  # -40, 0, 40
+
+            # Verificar colisão com jogador
+            if feixe_atinge((self.rect.centerx + offset, self.rect.bottom), (self.rect.centerx + offset, altura),
+                            largura_lazer, jogador_rect):
+                return True
+
+        return False
+
+    def desenhar_laser(self, surface):
+        if not self.laser_visivel():
+            return
+
         # Laser múltiplo do boss Gabriel
         for i in range(3):
             offset = (i - 1) * 40  # -40, 0, 40
@@ -1198,31 +3330,31 @@ class BossGabriel:
                 x = self.rect.centerx + offset + random.randint(-10, 10)
                 y = random.randint(self.rect.bottom, altura)
                 cor_particula = (255, 255, 255)
-                pygame.draw.circle(surface, cor_particula, (x, y), random.randint(1, 3))
-
-            # Área de colisão do laser
-            lazer_rect = pygame.Rect(
-                self.rect.centerx + offset - largura_lazer // 2,
-                self.rect.bottom,
-                largura_lazer,
-                altura - self.rect.bottom
-            )
-
-            # Verificar colisão com jogador
-            if lazer_rect.colliderect(jogador_rect):
-                return True
+                pygame.draw.circle(surface, cor_particula, (x, y), random.randint(1, 3))
 
-        return False
+    def raio_ataque_especial(self):
+        """Raio pulsante do campo de força do ataque especial"""
+        return int(100 + 50 * math.sin(relogio.agora * 0.01))
 
-    def desenhar_ataque_especial(self, surface, jogador_rect):
+    def atualizar_ataque_especial(self, jogador_rect):
+        """Retorna True se o campo de força atingiu o jogador"""
         if not self.ataque_especial_ativado:
             return False
 
-        tempo_atual = pygame.time.get_ticks()
-        progresso = (tempo_atual - self.ataque_especial_tempo) / self.ataque_especial_duracao
+        # Verificar colisão com campo de força
+        raio = self.raio_ataque_especial()
+        campo_rect = pygame.Rect(self.rect.centerx - raio, self.rect.centery - raio, raio * 2, raio * 2)
+        if campo_rect.colliderect(jogador_rect):
+            return True
+
+        return False
+
+    def desenhar_ataque_especial(self, surface):
+        if not self.ataque_especial_ativado:
+            return
 
         # Campo de força pulsante
-        raio = int(100 + 50 * math.sin(tempo_atual * 0.01))
+        raio = self.raio_ataque_especial()
         for i in range(3):
             alpha = 100 - i * 30
             surf_campo = pygame.Surface((raio * 2, raio * 2), pygame.SRCALPHA)
@@ -1239,16 +3371,9 @@ class BossGabriel:
 
             pygame.draw.line(surface, (200, 100, 255), (start_x, start_y), (end_x, end_y), 2)
 
-        # Verificar colisão com campo de força
-        campo_rect = pygame.Rect(self.rect.centerx - raio, self.rect.centery - raio, raio * 2, raio * 2)
-        if campo_rect.colliderect(jogador_rect):
-            return True
-
-        return False
-
     def desenhar_escudo(self, surface):
         if self.escudo_ativado:
-            tempo_atual = pygame.time.get_ticks()
+            tempo_atual = relogio.agora
             raio = 80
             raio += int(10 * math.sin(tempo_atual * 0.01))
 
@@ -1261,7 +3386,7 @@ class BossGabriel:
 
 
 # == CLASSE BOSS MELHORADA (ORIGINAL) ==
-class Boss:
+class Boss(AtorMundo):
     def __init__(self, nivel_boss, x, usar_lazer=False, tipo_boss=1):
         self.nivel_boss = nivel_boss
         self.usar_lazer = usar_lazer
@@ -1293,20 +3418,21 @@ class Boss:
             self.intervalo_tiros = max(400, 900 - (nivel_boss // 5) * 100)
             self.tiros_simultaneos = 2 + (nivel_boss // 5)
             self.lazer_duracao = 2500
-            self.ultimo_drone = pygame.time.get_ticks()
+            self.ultimo_drone = relogio.agora
             self.intervalo_drones = 15000
 
-        self.ultimo_tiro = pygame.time.get_ticks()
+        self.padroes_fase = {1: padrao_tiro("linha", quantidade=self.tiros_simultaneos, espacamento=15),
+                             2: padrao_tiro(PADRAO_FASE2_BOSS[tipo_boss])}
+        self.rajadas = 0
+        self.ultimo_tiro = relogio.agora
         self.lazer_ativado = False
         self.lazer_tempo_inicio = 0
         self.ultimo_lazer = 0
         self.lazer_cooldown = 8000
-        self.congelado = False
-        self.congelado_tempo = 0
         self.escudo_ativado = False
         self.escudo_tempo_fim = 0
         self.modo_agressivo = False
-        self.ultimo_escudo = pygame.time.get_ticks()
+        self.ultimo_escudo = relogio.agora
         self.escudo_cooldown = 10000
 
     def atualizar(self, jogador_rect):
@@ -1328,7 +3454,7 @@ class Boss:
                 if random.random() < 0.01:
                     self.modo_agressivo = True
                     self.escudo_ativado = True
-                    self.escudo_tempo_fim = pygame.time.get_ticks() + 3000
+                    self.escudo_tempo_fim = relogio.agora + 3000
             else:
                 dx = jogador_rect.centerx - self.rect.centerx
                 dy = jogador_rect.centery - self.rect.centery
@@ -1338,20 +3464,20 @@ class Boss:
                     self.rect.x += (dx / distancia) * self.velocidade * 0.7
                     self.rect.y += (dy / distancia) * self.velocidade * 0.7
 
-                if pygame.time.get_ticks() > self.escudo_tempo_fim:
+                if relogio.agora > self.escudo_tempo_fim:
                     self.modo_agressivo = False
                     self.escudo_ativado = False
-                    self.ultimo_escudo = pygame.time.get_ticks()
+                    self.ultimo_escudo = relogio.agora
         else:
             if self.rect.centerx < jogador_rect.centerx:
                 self.rect.x += min(self.velocidade, jogador_rect.centerx - self.rect.centerx)
             elif self.rect.centerx > jogador_rect.centerx:
                 self.rect.x -= min(self.velocidade, self.rect.centerx - jogador_rect.centerx)
 
-            tempo_atual = pygame.time.get_ticks()
+            tempo_atual = relogio.agora
             if tempo_atual - self.ultimo_drone > self.intervalo_drones and len(drones) < 4:
-                drones.append(Drone(self.rect.left - 40, self.rect.centery, 'esquerda'))
-                drones.append(Drone(self.rect.right + 10, self.rect.centery, 'direita'))
+                adicionar_drone(Drone(self.rect.left - 40, self.rect.centery, 'esquerda'))
+                adicionar_drone(Drone(self.rect.right + 10, self.rect.centery, 'direita'))
                 self.ultimo_drone = tempo_atual
 
         if self.rect.left < 0:
@@ -1366,46 +3492,30 @@ class Boss:
     def pode_atirar(self):
         if self.congelado:
             return False
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
         return tempo_atual - self.ultimo_tiro > self.intervalo_tiros
 
     def pode_usar_lazer(self):
         if not self.usar_lazer or self.congelado:
             return False
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
         return tempo_atual - self.ultimo_lazer > self.lazer_cooldown
 
     def ativar_lazer(self):
         if self.pode_usar_lazer():
             self.lazer_ativado = True
-            self.lazer_tempo_inicio = pygame.time.get_ticks()
-            self.ultimo_lazer = pygame.time.get_ticks()
+            self.lazer_tempo_inicio = relogio.agora
+            self.ultimo_lazer = relogio.agora
             return True
         return False
 
     def atirar(self, jogador_rect):
-        self.ultimo_tiro = pygame.time.get_ticks()
-        projeteis_boss_local = []
-
-        if self.tiros_simultaneos == 1:
-            x = self.rect.centerx - 5
-            y = self.rect.bottom
-            projeteis_boss_local.append({
-                "rect": pygame.Rect(x, y, 10, 20),
-                "velocidade_x": 0,
-                "velocidade_y": 7
-            })
-        else:
-            for i in range(self.tiros_simultaneos):
-                offset = (i - (self.tiros_simultaneos - 1) / 2) * 15
-                x = self.rect.centerx - 5 + offset
-                y = self.rect.bottom
-                projeteis_boss_local.append({
-                    "rect": pygame.Rect(x, y, 10, 20),
-                    "velocidade_x": 0,
-                    "velocidade_y": 7
-                })
-        return projeteis_boss_local
+        self.ultimo_tiro = relogio.agora
+
+        # Tiros em linha até a metade da vida; depois o padrão do tipo do boss
+        fase = 1 if self.vida > self.vida_maxima // 2 else 2
+        self.padroes_fase[fase].disparar(self.rect.centerx - 5, self.rect.bottom, self.rajadas, jogador_rect.center)
+        self.rajadas += 1
 
     def levar_dano(self, dano):
         if self.escudo_ativado:
@@ -1432,20 +3542,40 @@ class Boss:
 
         pygame.draw.rect(surface, cor_vida, (x, y, vida_largura, barra_altura))
 
-    def desenhar_laser(self, surface, jogador_rect):
+    def laser_visivel(self):
         if not self.lazer_ativado:
             return False
 
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.agora
         tempo_decorrido_laser = tempo_atual - self.lazer_tempo_inicio
 
         if tempo_decorrido_laser > self.lazer_duracao:
-            self.lazer_ativado = False
             return False
 
         if tempo_decorrido_laser > self.lazer_duracao * 0.7:
             if int(tempo_atual / 100) % 2 == 0:
                 return False
+        return True
+
+    def atualizar_laser(self, jogador_rect):
+        """Cria os efeitos do laser e retorna True se ele atingiu o jogador"""
+        if self.lazer_ativado and relogio.agora - self.lazer_tempo_inicio > self.lazer_duracao:
+            self.lazer_ativado = False
+
+        if not self.laser_visivel():
+            return False
+
+        largura_lazer = 25
+        start_pos = (self.rect.centerx, self.rect.bottom)
+        end_pos = (self.rect.centerx, altura)
+
+        efeitos.manter_feixe(self, start_pos, end_pos, (255, 100, 100), 15, 500, alcance_faiscas=100)
+
+        return feixe_atinge(start_pos, end_pos, largura_lazer, jogador_rect)
+
+    def desenhar_laser(self, surface):
+        if not self.laser_visivel():
+            return
 
         largura_lazer = 25
         start_pos = (self.rect.centerx, self.rect.bottom)
@@ -1471,26 +3601,9 @@ class Boss:
             pygame.draw.rect(surf_borda, cor_borda, (0, 0, largura_lazer + 10, altura - self.rect.bottom), 2)
             surface.blit(surf_borda, (self.rect.centerx - (largura_lazer + 10) // 2, self.rect.bottom))
 
-        efeitos.criar_rastro_laser(start_pos, end_pos, (255, 100, 100), 15, 500)
-
-        for _ in range(10):
-            criar_particulas_laser(self.rect.centerx + random.randint(-10, 10),
-                                   self.rect.bottom + random.randint(0, 100))
-
-        lazer_rect = pygame.Rect(
-            self.rect.centerx - largura_lazer // 2,
-            self.rect.bottom,
-            largura_lazer,
-            altura - self.rect.bottom
-        )
-
-        if lazer_rect.colliderect(jogador_rect):
-            return True
-        return False
-
     def desenhar_escudo(self, surface):
         if self.escudo_ativado:
-            tempo_atual = pygame.time.get_ticks()
+            tempo_atual = relogio.agora
             raio = 45 if self.tipo_boss == 3 else 40
             raio += int(5 * math.sin(tempo_atual * 0.01))
 
@@ -1542,14 +3655,14 @@ def mostrar_tela_senha(nave_admin):
                             trocar_nave(8)
                             # Se for Paulo ou Vitor, spawnar boss nível 15 imediatamente
                             if not any(isinstance(boss, BossNivel15) for boss in bosses):
-                                bosses.append(BossNivel15())
+                                adicionar_boss(BossNivel15())
                                 boss_ativo = True
                                 print("BOSS NÍVEL 15 apareceu instantaneamente!")
                         elif nave_admin == "vitor":
                             trocar_nave(9)
                             # Se for Paulo ou Vitor, spawnar boss nível 15 imediatamente
                             if not any(isinstance(boss, BossNivel15) for boss in bosses):
-                                bosses.append(BossNivel15())
+                                adicionar_boss(BossNivel15())
                                 boss_ativo = True
                                 print("BOSS NÍVEL 15 apareceu instantaneamente!")
                         digitando_senha = False
@@ -1579,7 +3692,7 @@ def atualizar_velocidade_meteoros():
     """Atualiza a velocidade dos meteoros baseado no tempo de jogo"""
     global velocidade_base
 
-    tempo_decorrido = (pygame.time.get_ticks() - tempo_jogo_inicio) / 1000  # Tempo em segundos
+    tempo_decorrido = (relogio.agora - tempo_jogo_inicio) / 1000  # Tempo em segundos
     nova_velocidade = velocidade_base + tempo_decorrido * fator_aceleracao_meteoros
 
     # CORREÇÃO: Limitar velocidade máxima (velocidade do nível 15)
@@ -1641,12 +3754,7 @@ def resetar_habilidades_ao_trocar_nave():
     vida_jogador = max_vida
 
     # Descongelar todos os inimigos
-    for meteoro in meteoros:
-        meteoro["congelado"] = False
-    for boss in bosses:
-        boss.congelado = False
-    for drone in drones:
-        drone.congelado = False
+    descongelar_inimigos()
 
     print("Habilidades resetadas ao trocar de nave!")
 
@@ -1659,7 +3767,7 @@ def ativar_habilidade():
     global lazer_ativado, lazer_tempo_inicio, ultimo_lazer, teleporte_ativado, teleporte_cooldown
     global habilidades_admin_ativas, municao_infinita_ativa, vida_jogador, max_vida_admin
 
-    tempo_atual = pygame.time.get_ticks()
+    tempo_atual = relogio.agora
 
     # Verificar se é uma nave admin
     is_nave_admin = nave_selecionada >= 6  # Naves 7, 8, 9 são admin
@@ -1696,70 +3804,12 @@ def ativar_habilidade():
                 congelar_ativado = True
                 congelar_tempo_fim = tempo_atual + 5000  # 5 segundos
 
-                for meteoro in meteoros:
-                    meteoro["congelado"] = True
-                    meteoro["congelado_tempo"] = congelar_tempo_fim
-
-                for boss in bosses:
-                    boss.congelado = True
-                    boss.congelado_tempo = congelar_tempo_fim
-
-                for drone in drones:
-                    drone.congelado = True
-                    drone.congelado_tempo = congelar_tempo_fim
+                congelar_inimigos(congelar_tempo_fim)
 
                 print("Campo de congelamento ativado!")
             else:
                 # Ativar teleporte
-                areas_seguras = []
-
-                for x in range(0, largura - 40, 40):
-                    for y in range(100, altura - 100, 40):
-                        area_teste = pygame.Rect(x, y, 40, 40)
-                        area_segura = True
-
-                        for meteoro in meteoros:
-                            if area_teste.colliderect(meteoro["rect"]):
-                                area_segura = False
-                                break
-
-                        for boss in bosses:
-                            if area_teste.colliderect(boss.rect):
-                                area_segura = False
-                                break
-
-                        for drone in drones:
-                            if area_teste.colliderect(drone.rect):
-                                area_segura = False
-                                break
-
-                        if area_segura:
-                            areas_seguras.append((x, y))
-
-                if areas_seguras:
-                    melhor_area = None
-                    menor_distancia = float('inf')
-
-                    for x, y in areas_seguras:
-                        distancia = math.sqrt((jogador.centerx - x) ** 2 + (jogador.centery - y) ** 2)
-                        if distancia < menor_distancia:
-                            menor_distancia = distancia
-                            melhor_area = (x, y)
-
-                    if melhor_area:
-                        for _ in range(30):
-                            criar_particulas_explosao_avancada(jogador.centerx, jogador.centery, 1, (200, 100, 255))
-
-                        jogador.x, jogador.y = melhor_area
-
-                        for _ in range(30):
-                            criar_particulas_explosao_avancada(jogador.centerx, jogador.centery, 1, (100, 200, 255))
-
-                        print("Teleporte realizado para área segura!")
-                    else:
-                        print("Nenhuma área segura encontrada!")
-                else:
-                    print("Nenhuma área segura disponível!")
+                teleportar_para_area_segura()
             return True
 
     # Habilidades normais para naves não-admin
@@ -1767,17 +3817,7 @@ def ativar_habilidade():
         congelar_ativado = True
         congelar_tempo_fim = tempo_atual + 3000
 
-        for meteoro in meteoros:
-            meteoro["congelado"] = True
-            meteoro["congelado_tempo"] = congelar_tempo_fim
-
-        for boss in bosses:
-            boss.congelado = True
-            boss.congelado_tempo = congelar_tempo_fim
-
-        for drone in drones:
-            drone.congelado = True
-            drone.congelado_tempo = congelar_tempo_fim
+        congelar_inimigos(congelar_tempo_fim)
 
         print("Campo de congelamento ativado!")
 
@@ -1803,55 +3843,7 @@ def ativar_habilidade():
         print("Lazer/Kamehameha ativado!")
 
     elif habilidade == "teleporte":
-        areas_seguras = []
-
-        for x in range(0, largura - 40, 40):
-            for y in range(100, altura - 100, 40):
-                area_teste = pygame.Rect(x, y, 40, 40)
-                area_segura = True
-
-                for meteoro in meteoros:
-                    if area_teste.colliderect(meteoro["rect"]):
-                        area_segura = False
-                        break
-
-                for boss in bosses:
-                    if area_teste.colliderect(boss.rect):
-                        area_segura = False
-                        break
-
-                for drone in drones:
-                    if area_teste.colliderect(drone.rect):
-                        area_segura = False
-                        break
-
-                if area_segura:
-                    areas_seguras.append((x, y))
-
-        if areas_seguras:
-            melhor_area = None
-            menor_distancia = float('inf')
-
-            for x, y in areas_seguras:
-                distancia = math.sqrt((jogador.centerx - x) ** 2 + (jogador.centery - y) ** 2)
-                if distancia < menor_distancia:
-                    menor_distancia = distancia
-                    melhor_area = (x, y)
-
-            if melhor_area:
-                for _ in range(30):
-                    criar_particulas_explosao_avancada(jogador.centerx, jogador.centery, 1, (200, 100, 255))
-
-                jogador.x, jogador.y = melhor_area
-
-                for _ in range(30):
-                    criar_particulas_explosao_avancada(jogador.centerx, jogador.centery, 1, (100, 200, 255))
-
-                print("Teleporte realizado para área segura!")
-            else:
-                print("Nenhuma área segura encontrada!")
-        else:
-            print("Nenhuma área segura disponível!")
+        teleportar_para_area_segura()
 
     if not is_nave_admin:
         habilidade_ativa = True
@@ -1864,7 +3856,7 @@ def ativar_habilidade():
 def ativar_lazer_geral():
     global lazer_ativado, lazer_tempo_inicio, ultimo_lazer
 
-    tempo_atual = pygame.time.get_ticks()
+    tempo_atual = relogio.agora
     if tempo_atual - ultimo_lazer >= lazer_cooldown:
         lazer_ativado = True
         lazer_tempo_inicio = tempo_atual
@@ -1881,7 +3873,7 @@ def atualizar_habilidades():
     global escudo_ativo, velocidade_dupla_ativa, tiro_triplo_ativo, congelar_ativado
     global lazer_ativado, habilidades_admin_ativas
 
-    tempo_atual = pygame.time.get_ticks()
+    tempo_atual = relogio.agora
 
     # Para naves admin, escudo, velocidade e tiro triplo são permanentes
     if not habilidades_admin_ativas:
@@ -1899,12 +3891,7 @@ def atualizar_habilidades():
 
     if congelar_ativado and tempo_atual >= congelar_tempo_fim:
         congelar_ativado = False
-        for meteoro in meteoros:
-            meteoro["congelado"] = False
-        for boss in bosses:
-            boss.congelado = False
-        for drone in drones:
-            drone.congelado = False
+        descongelar_inimigos()
         print("Campo de congelamento desativado!")
 
     if lazer_ativado and tempo_atual - lazer_tempo_inicio > lazer_duracao:
@@ -1912,70 +3899,35 @@ def atualizar_habilidades():
 
 
 # == EFEITOS ESPECIAIS PARA CONGELAMENTO ==
-def desenhar_meteoros_congelados(surface):
-    tempo_atual = pygame.time.get_ticks()
-    for meteoro in meteoros:
-        if meteoro["congelado"]:
-            pulsacao = 0.5 + 0.5 * math.sin(tempo_atual * 0.01)
-            alpha = int(100 + 50 * pulsacao)
-
-            surf_gelo = pygame.Surface((meteoro["rect"].width, meteoro["rect"].height), pygame.SRCALPHA)
-
-            for i in range(5):
-                tamanho = random.randint(3, 8)
-                x = random.randint(0, meteoro["rect"].width)
-                y = random.randint(0, meteoro["rect"].height)
-                cor_gelo = (150, 200, 255, alpha)
-                pygame.draw.circle(surf_gelo, cor_gelo, (x, y), tamanho)
-
-            surface.blit(surf_gelo, meteoro["rect"])
-
-            if random.random() < 0.3:
-                criar_efeito_congelamento(meteoro["rect"].centerx, meteoro["rect"].centery)
-
-
-def desenhar_bosses_congelados(surface):
-    tempo_atual = pygame.time.get_ticks()
-    for boss in bosses:
-        if boss.congelado:
-            pulsacao = 0.5 + 0.5 * math.sin(tempo_atual * 0.01)
-            alpha = int(100 + 50 * pulsacao)
-
-            surf_gelo_boss = pygame.Surface((boss.rect.width, boss.rect.height), pygame.SRCALPHA)
-
-            for i in range(8):
-                tamanho = random.randint(4, 10)
-                x = random.randint(0, boss.rect.width)
-                y = random.randint(0, boss.rect.height)
-                cor_gelo = (150, 220, 255, alpha)
-                pygame.draw.circle(surf_gelo_boss, cor_gelo, (x, y), tamanho)
-
-            surface.blit(surf_gelo_boss, boss.rect)
-
-            if random.random() < 0.4:
-                criar_efeito_congelamento(boss.rect.centerx, boss.rect.centery)
+# Por tipo de entidade: cristais de gelo, faixa de tamanho, cor e chance de soltar partícula por frame
+GELO_CONGELAMENTO = {
+    "meteoro": (5, (3, 8), (150, 200, 255), 0.3),
+    "boss": (8, (4, 10), (150, 220, 255), 0.4),
+    "drone": (4, (2, 6), (150, 200, 255), 0.3),
+}
 
 
-def desenhar_drones_congelados(surface):
-    tempo_atual = pygame.time.get_ticks()
-    for drone in drones:
-        if drone.congelado:
+def desenhar_inimigos_congelados(surface):
+    """Camada de gelo sobre toda entidade com o componente congelado"""
+    tempo_atual = relogio.agora
+    for tipo, (cristais, (tamanho_min, tamanho_max), cor, chance_efeito) in GELO_CONGELAMENTO.items():
+        for entidade, _, _ in mundo.percorrer("congelado", tipo):
+            rect = rect_atual(entidade)
             pulsacao = 0.5 + 0.5 * math.sin(tempo_atual * 0.01)
             alpha = int(100 + 50 * pulsacao)
 
-            surf_gelo_drone = pygame.Surface((drone.rect.width, drone.rect.height), pygame.SRCALPHA)
+            surf_gelo = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
 
-            for i in range(4):
-                tamanho = random.randint(2, 6)
-                x = random.randint(0, drone.rect.width)
-                y = random.randint(0, drone.rect.height)
-                cor_gelo = (150, 200, 255, alpha)
-                pygame.draw.circle(surf_gelo_drone, cor_gelo, (x, y), tamanho)
+            for i in range(cristais):
+                tamanho = random.randint(tamanho_min, tamanho_max)
+                x = random.randint(0, rect.width)
+                y = random.randint(0, rect.height)
+                pygame.draw.circle(surf_gelo, cor + (alpha,), (x, y), tamanho)
 
-            surface.blit(surf_gelo_drone, drone.rect)
+            surface.blit(surf_gelo, rect)
 
-            if random.random() < 0.3:
-                criar_efeito_congelamento(drone.rect.centerx, drone.rect.centery)
+            if random.random() < chance_efeito:
+                criar_efeito_congelamento(rect.centerx, rect.centery)
 
 
 # == EFEITOS ESPECIAIS PARA PORTAL ==
@@ -1983,11 +3935,9 @@ def desenhar_portal(surface, portal_rect):
     global portal_rotacao
 
     portal_rotacao += 2
-    tempo_atual = pygame.time.get_ticks()
+    tempo_atual = relogio.agora
 
-    portal_img_rotacionada = pygame.transform.rotate(portal_img, portal_rotacao)
-    rect_rotacionado = portal_img_rotacionada.get_rect(center=portal_rect.center)
-    surface.blit(portal_img_rotacionada, rect_rotacionado)
+    desenhar_rotacionado(surface, quadro_asset("portal", (60, 60)), portal_rotacao, portal_rect.center)
 
     for i in range(3):
         raio = 15 + i * 5
@@ -2017,32 +3967,87 @@ def desenhar_portal(surface, portal_rect):
 
 
 # == SISTEMA DE LAZER DO JOGADOR MELHORADO ==
-def desenhar_lazer_jogador(surface):
-    """LAZER DO JOGADOR COM EFEITOS VISUAIS MELHORADOS"""
-    global lazer_ativado, pontuacao
-
+def lazer_jogador_visivel():
+    """Indica se o lazer do jogador aparece neste instante (ele pisca no final)"""
     if not lazer_ativado:
-        return
+        return False
 
-    tempo_atual = pygame.time.get_ticks()
+    tempo_atual = relogio.agora
     tempo_decorrido_lazer = tempo_atual - lazer_tempo_inicio
 
     if tempo_decorrido_lazer > lazer_duracao:
-        lazer_ativado = False
-        return
+        return False
 
     # Efeito de piscagem no final
     if tempo_decorrido_lazer > lazer_duracao * 0.7:
         if int(tempo_atual / 100) % 2 == 0:
-            return
+            return False
+    return True
+
+
+def largura_lazer_jogador():
+    """O núcleo do lazer afina conforme a duração se esgota"""
+    progresso = 1.0 - ((relogio.agora - lazer_tempo_inicio) / lazer_duracao)
+    return int(30 * progresso)
+
+
+def atualizar_lazer_jogador():
+    """Efeitos e colisões do lazer do jogador - executado a cada passo da simulação"""
+    global lazer_ativado, pontuacao
+
+    if lazer_ativado and relogio.agora - lazer_tempo_inicio > lazer_duracao:
+        lazer_ativado = False
+
+    if not lazer_jogador_visivel():
+        return
+
+    start_pos = (jogador.centerx, jogador.top - 10)
+    end_pos = (jogador.centerx, 0)
+    largura_nucleo = largura_lazer_jogador()
+
+    # Manter o feixe visual SUPER MELHORADO (rastro, brilhos e faíscas)
+    efeitos.manter_feixe("jogador", start_pos, end_pos, (255, 100, 100), 20, 600)
+
+    # Verificar colisões só com quem o índice de varredura põe na coluna do laser
+    atingidos = acertos_feixe((jogador.centerx, jogador.top), (jogador.centerx, 0), largura_nucleo)
+
+    for categoria, meteoro_lazer in atingidos:
+        if categoria == "meteoro":
+            rect_meteoro = mundo.obter(meteoro_lazer, "transform")
+            explosoes.append(criar_explosao_efeitos(rect_meteoro.centerx, rect_meteoro.centery, 70))
+            pontuacao += 50
+            mundo.destruir(meteoro_lazer)
+            indice_feixes.remover(meteoro_lazer)
+
+    for categoria, boss_lazer in atingidos:
+        if categoria == "boss":
+            if boss_lazer.levar_dano(5):
+                explosoes.append(criar_explosao_efeitos(boss_lazer.rect.centerx, boss_lazer.rect.centery, 100))
+                pontuacao += 500
+                remover_boss(boss_lazer)
+                if len(bosses) == 0:
+                    global boss_ativo
+                    boss_ativo = False
+
+    for categoria, drone_lazer in atingidos:
+        if categoria == "drone":
+            if drone_lazer.levar_dano(3):
+                explosoes.append(criar_explosao_efeitos(drone_lazer.rect.centerx, drone_lazer.rect.centery, 40))
+                pontuacao += 100
+                remover_drone(drone_lazer)
+
+
+def desenhar_lazer_jogador(surface):
+    """LAZER DO JOGADOR COM EFEITOS VISUAIS MELHORADOS"""
+    if not lazer_jogador_visivel():
+        return
 
     # Configurações do laser do jogador
     start_pos = (jogador.centerx, jogador.top - 10)
     end_pos = (jogador.centerx, 0)
-    progresso = 1.0 - (tempo_decorrido_lazer / lazer_duracao)
 
     # 1. Núcleo principal super brilhante
-    largura_nucleo = int(30 * progresso)
+    largura_nucleo = largura_lazer_jogador()
     cor_nucleo = (255, 0, 0)
     pygame.draw.line(surface, cor_nucleo, start_pos, end_pos, largura_nucleo)
 
@@ -2069,42 +4074,6 @@ def desenhar_lazer_jogador(surface):
                          max(1, 3 - i))
         surface.blit(surf_aura, (jogador.centerx - (largura_nucleo + 20 + i * 10) // 2, 0))
 
-    # Criar rastro visual SUPER MELHORADO
-    efeitos.criar_rastro_laser(start_pos, end_pos, (255, 100, 100), 20, 600)
-
-    # Criar partículas de laser especiais
-    for _ in range(15):
-        criar_particulas_laser(jogador.centerx + random.randint(-12, 12),
-                               random.randint(0, jogador.top))
-
-    # Área de colisão do laser
-    lazer_rect = pygame.Rect(jogador.centerx - largura_nucleo // 2, 0, largura_nucleo, jogador.top)
-
-    # Verificar colisões
-    for meteoro_lazer in meteoros[:]:
-        if lazer_rect.colliderect(meteoro_lazer["rect"]):
-            explosoes.append(
-                criar_explosao_efeitos(meteoro_lazer["rect"].centerx, meteoro_lazer["rect"].centery, 70))
-            pontuacao += 50
-            meteoros.remove(meteoro_lazer)
-
-    for boss_lazer in bosses[:]:
-        if lazer_rect.colliderect(boss_lazer.rect):
-            if boss_lazer.levar_dano(5):
-                explosoes.append(criar_explosao_efeitos(boss_lazer.rect.centerx, boss_lazer.rect.centery, 100))
-                pontuacao += 500
-                bosses.remove(boss_lazer)
-                if len(bosses) == 0:
-                    global boss_ativo
-                    boss_ativo = False
-
-    for drone_lazer in drones[:]:
-        if lazer_rect.colliderect(drone_lazer.rect):
-            if drone_lazer.levar_dano(3):
-                explosoes.append(criar_explosao_efeitos(drone_lazer.rect.centerx, drone_lazer.rect.centery, 40))
-                pontuacao += 100
-                drones.remove(drone_lazer)
-
 
 # == MENU PRINCIPAL ==
 def mostrar_menu_principal():
@@ -2114,8 +4083,8 @@ def mostrar_menu_principal():
     while menu_ativo:
         tela.fill((0, 0, 40))
 
-        # Desenhar fundo estelar sem causar erros
-        fundo_estelar.atualizar()
+        # Desenhar fundo estelar sem causar erros (o menu não tem passo fixo: avança pelo tempo real do frame)
+        fundo_estelar.atualizar(clock.tick(60))
         fundo_estelar.desenhar(tela)
 
         titulo = fonte.render("NAVE vs METEOROS", True, (255, 255, 255))
@@ -2192,6 +4161,14 @@ def trocar_nave(numero):
 
 
 # == SISTEMA DE METEOROS MELHORADO ==
+def criar_entidade_meteoro(rect, velocidade_x, velocidade_y, rotacao_speed, tipo, vida):
+    """Meteoro no mundo de entidades: cada dado num componente, com rotação começando em 0"""
+    meteoro = mundo.criar(meteoro=True, transform=rect, velocidade=[velocidade_x, velocidade_y],
+                          rotacao=[0, rotacao_speed], vida=vida, sprite=tipo, congelavel=True)
+    indice_feixes.inserir("meteoro", meteoro)
+    return meteoro
+
+
 def criar_meteoro():
     if nivel >= 15 and random.random() < 0.2:
         tamanho = 100
@@ -2200,17 +4177,7 @@ def criar_meteoro():
         rotacao_speed = random.uniform(-1, 1)
         x = random.randint(0, largura - tamanho)
         rect = pygame.Rect(x, -tamanho, tamanho, tamanho)
-        return {
-            "rect": rect,
-            "velocidade_y": velocidade_y,
-            "velocidade_x": velocidade_x,
-            "rotacao": 0,
-            "rotacao_speed": rotacao_speed,
-            "tipo": "enorme",
-            "vida": 3,
-            "congelado": False,
-            "congelado_tempo": 0
-        }
+        return criar_entidade_meteoro(rect, velocidade_x, velocidade_y, rotacao_speed, "enorme", 3)
     elif nivel >= 10 and random.random() < 0.3:
         tamanho = 80
         velocidade_x = random.uniform(-1.5, 1.5)
@@ -2218,17 +4185,7 @@ def criar_meteoro():
         rotacao_speed = random.uniform(-1.5, 1.5)
         x = random.randint(0, largura - tamanho)
         rect = pygame.Rect(x, -tamanho, tamanho, tamanho)
-        return {
-            "rect": rect,
-            "velocidade_y": velocidade_y,
-            "velocidade_x": velocidade_x,
-            "rotacao": 0,
-            "rotacao_speed": rotacao_speed,
-            "tipo": "grande",
-            "vida": 2,
-            "congelado": False,
-            "congelado_tempo": 0
-        }
+        return criar_entidade_meteoro(rect, velocidade_x, velocidade_y, rotacao_speed, "grande", 2)
     elif nivel >= 5 and random.random() < 0.4:
         tamanho = 60
         velocidade_x = random.uniform(-2, 2)
@@ -2236,34 +4193,14 @@ def criar_meteoro():
         rotacao_speed = random.uniform(-2, 2)
         x = random.randint(0, largura - tamanho)
         rect = pygame.Rect(x, -tamanho, tamanho, tamanho)
-        return {
-            "rect": rect,
-            "velocidade_y": velocidade_y,
-            "velocidade_x": velocidade_x,
-            "rotacao": 0,
-            "rotacao_speed": rotacao_speed,
-            "tipo": "medio",
-            "vida": 1,
-            "congelado": False,
-            "congelado_tempo": 0
-        }
+        return criar_entidade_meteoro(rect, velocidade_x, velocidade_y, rotacao_speed, "medio", 1)
     else:
         tamanho = 40
         x = random.randint(0, largura - tamanho)
         rect = pygame.Rect(x, -tamanho, tamanho, tamanho)
         velocidade_y = velocidade_base + (nivel * 1.5)
         rotacao_speed = random.uniform(-2, 2)
-        return {
-            "rect": rect,
-            "velocidade_y": velocidade_y,
-            "velocidade_x": 0,
-            "rotacao": 0,
-            "rotacao_speed": rotacao_speed,
-            "tipo": "pequeno",
-            "vida": 1,
-            "congelado": False,
-            "congelado_tempo": 0
-        }
+        return criar_entidade_meteoro(rect, 0, velocidade_y, rotacao_speed, "pequeno", 1)
 
 
 def criar_meteoros_filhos(x, y, tipo_pai):
@@ -2280,17 +4217,8 @@ def criar_meteoros_filhos(x, y, tipo_pai):
             offset_y = random.randint(-20, 20)
 
             rect = pygame.Rect(x + offset_x, y + offset_y, tamanho, tamanho)
-            meteoros_filhos.append({
-                "rect": rect,
-                "velocidade_y": velocidade_y,
-                "velocidade_x": velocidade_x,
-                "rotacao": 0,
-                "rotacao_speed": rotacao_speed,
-                "tipo": "pequeno",
-                "vida": 1,
-                "congelado": False,
-                "congelado_tempo": 0
-            })
+            meteoros_filhos.append(
+                criar_entidade_meteoro(rect, velocidade_x, velocidade_y, rotacao_speed, "pequeno", 1))
 
     elif tipo_pai == "enorme":
         for _ in range(3):
@@ -2303,17 +4231,8 @@ def criar_meteoros_filhos(x, y, tipo_pai):
             offset_y = random.randint(-30, 30)
 
             rect = pygame.Rect(x + offset_x, y + offset_y, tamanho, tamanho)
-            meteoros_filhos.append({
-                "rect": rect,
-                "velocidade_y": velocidade_y,
-                "velocidade_x": velocidade_x,
-                "rotacao": 0,
-                "rotacao_speed": rotacao_speed,
-                "tipo": "medio",
-                "vida": 1,
-                "congelado": False,
-                "congelado_tempo": 0
-            })
+            meteoros_filhos.append(
+                criar_entidade_meteoro(rect, velocidade_x, velocidade_y, rotacao_speed, "medio", 1))
 
     return meteoros_filhos
 
@@ -2323,28 +4242,26 @@ def criar_projetil():
     if municao_infinita_ativa or (municao_atual > 0 and not recarregando):
         x = jogador.centerx - 7
         y = jogador.top
-        return {"rect": pygame.Rect(x, y, 15, 25), "rotacao": 0}
-    return None
+        return motor_projeteis.emitir(DONO_JOGADOR, x, y, 0, -10, 0, 5)
+    return False
 
 
 def criar_projeteis_triplo():
-    projeteis_local = []
     # Para naves admin com munição infinita, sempre pode atirar
     if municao_infinita_ativa or (municao_atual > 0 and not recarregando):
-        projeteis_local.append({"rect": pygame.Rect(jogador.centerx - 7, jogador.top, 15, 25), "rotacao": 0})
-        projeteis_local.append({"rect": pygame.Rect(jogador.centerx - 20, jogador.top, 15, 25), "rotacao": -10})
-        projeteis_local.append({"rect": pygame.Rect(jogador.centerx + 6, jogador.top, 15, 25), "rotacao": 10})
-    return projeteis_local
+        motor_projeteis.emitir(DONO_JOGADOR, jogador.centerx - 7, jogador.top, 0, -10, 0, 5)
+        motor_projeteis.emitir(DONO_JOGADOR, jogador.centerx - 20, jogador.top, 0, -10, -10, 5)
+        motor_projeteis.emitir(DONO_JOGADOR, jogador.centerx + 6, jogador.top, 0, -10, 10, 5)
 
 
 def criar_coracao():
     x = random.randint(30, largura - 30)
-    return pygame.Rect(x, -30, 30, 30)
+    return mundo.criar(coracao=True, transform=pygame.Rect(x, -30, 30, 30), velocidade=[0, 3])
 
 
 def criar_portal():
     x = random.randint(60, largura - 60)
-    return pygame.Rect(x, -60, 60, 60)
+    return mundo.criar(portal=True, transform=pygame.Rect(x, -60, 60, 60), velocidade=[0, 2])
 
 
 def criar_explosao_efeitos(x, y, tamanho=50, tipo="normal"):
@@ -2352,28 +4269,29 @@ def criar_explosao_efeitos(x, y, tamanho=50, tipo="normal"):
         criar_particulas_explosao_avancada(x, y, 15, (255, 100, 100))
         efeitos.criar_brilho(x, y, (255, 100, 100), tamanho, 500, 0.8)
     elif tipo == "portal":
-        for _ in range(20):
+        for _ in range(orcamento_particulas.solicitar("explosao", 20)):
             angulo = random.uniform(0, 2 * math.pi)
             distancia = random.uniform(0, 40)
             velocidade = random.uniform(2, 6)
 
-            particulas.append(ParticulaAvancada(
+            particulas.emitir(
                 x, y, (100, 150, 255),
                 math.cos(angulo) * velocidade,
                 math.sin(angulo) * velocidade,
-                1200, random.uniform(3, 6), "estrela"
-            ))
+                1200, random.uniform(3, 6), "estrela",
+                prioridade=PRIORIDADE_EMISSORES["explosao"]
+            )
         efeitos.criar_brilho(x, y, (100, 150, 255), tamanho * 2, 1000, 1.0)
     else:
         criar_particulas_explosao_avancada(x, y, 30)
         efeitos.criar_brilho(x, y, (255, 200, 100), tamanho * 2, 800, 1.0)
 
     return {"rect": pygame.Rect(x - tamanho // 2, y - tamanho // 2, tamanho, tamanho),
-            "tempo_inicio": pygame.time.get_ticks(), "duracao": 500}
+            "tempo_inicio": relogio.agora, "duracao": 500}
 
 
 def desenhar_explosao(surface, explosao_obj):
-    tempo_decorrido_explosao = pygame.time.get_ticks() - explosao_obj["tempo_inicio"]
+    tempo_decorrido_explosao = relogio.agora - explosao_obj["tempo_inicio"]
     progresso = min(tempo_decorrido_explosao / explosao_obj["duracao"], 1.0)
 
     raio = int(progresso * explosao_obj["rect"].width // 2)
@@ -2398,7 +4316,7 @@ def atualizar_municao():
         recarregando = False
         return
 
-    tempo_atual_municao = pygame.time.get_ticks()
+    tempo_atual_municao = relogio.agora
 
     if municao_atual <= 0 and not recarregando:
         recarregando = True
@@ -2419,7 +4337,7 @@ def atualizar_municao():
 
 def desenhar_escudo(surface):
     if escudo_ativo:
-        tempo_escudo = pygame.time.get_ticks()
+        tempo_escudo = relogio.agora
         raio = 35 + int(5 * math.sin(tempo_escudo * 0.01))
 
         for i in range(3):
@@ -2434,7 +4352,7 @@ def desenhar_escudo(surface):
 
 def desenhar_efeito_velocidade(surface):
     if velocidade_dupla_ativa:
-        tempo_velocidade = pygame.time.get_ticks()
+        tempo_velocidade = relogio.agora
         for i in range(3):
             offset = int(10 * math.sin(tempo_velocidade * 0.01 + i * 2))
             pygame.draw.line(surface, (255, 255, 0),
@@ -2469,27 +4387,26 @@ def spawnar_boss(nivel_boss):
     global boss_ativo, bosses
 
     boss_ativo = True
-    bosses.clear()
-    drones.clear()
+    limpar_inimigos()
 
     if nivel_boss == 5:
-        bosses.append(Boss(nivel_boss, largura // 2, usar_lazer=True, tipo_boss=1))
+        adicionar_boss(Boss(nivel_boss, largura // 2, usar_lazer=True, tipo_boss=1))
         print(f"BOSS nível {nivel_boss} apareceu! (Atirador Rápido)")
 
     elif nivel_boss == 10:
-        bosses.append(Boss(nivel_boss, largura // 3, usar_lazer=False, tipo_boss=2))
-        bosses.append(Boss(nivel_boss, 2 * largura // 3, usar_lazer=True, tipo_boss=2))
+        adicionar_boss(Boss(nivel_boss, largura // 3, usar_lazer=False, tipo_boss=2))
+        adicionar_boss(Boss(nivel_boss, 2 * largura // 3, usar_lazer=True, tipo_boss=2))
         bosses[1].largura = 50
         bosses[1].altura = 50
         bosses[1].rect = pygame.Rect(2 * largura // 3, 50, 50, 50)
         print(f"BOSS nível {nivel_boss} apareceu! (Dupla Dinâmica)")
 
     elif nivel_boss == 15:
-        bosses.append(BossNivel15())
+        adicionar_boss(BossNivel15())
         print("BOSS NÍVEL 15 apareceu! (Boss Especial)")
 
     elif nivel_boss == 20:
-        bosses.append(BossGabriel())
+        adicionar_boss(BossGabriel())
         print("BOSS GABRIEL apareceu! (Boss Final)")
 
 
@@ -2517,8 +4434,7 @@ def desenhar_interface():
     texto_nivel = fonte_pequena.render(f"Nível: {nivel}", True, (255, 255, 255))
     tela.blit(texto_nivel, (10, 40))
 
-    for i in range(vida_jogador):
-        tela.blit(coracao_img, (10 + i * 35, 70))
+    tela.blits([(coracao_img, (10 + i * 35, 70)) for i in range(vida_jogador)], False)
 
     # Mostrar munição de forma diferente para naves admin
     if municao_infinita_ativa:
@@ -2528,13 +4444,13 @@ def desenhar_interface():
     tela.blit(texto_municao, (largura - 150, 10))
 
     if recarregando and not municao_infinita_ativa:
-        tempo_atual_recarga = pygame.time.get_ticks()
+        tempo_atual_recarga = relogio.agora
         tempo_decorrido_recarga = tempo_atual_recarga - tempo_inicio_recarga
         progresso = min(tempo_decorrido_recarga / intervalo_recarga, 1.0)
         pygame.draw.rect(tela, (255, 0, 0), (largura - 150, 40, 100, 10))
         pygame.draw.rect(tela, (0, 255, 0), (largura - 150, 40, int(100 * progresso), 10))
 
-    tempo_atual_lazer_interface = pygame.time.get_ticks()
+    tempo_atual_lazer_interface = relogio.agora
     tempo_restante_lazer = max(0, lazer_cooldown - (tempo_atual_lazer_interface - ultimo_lazer))
     if tempo_restante_lazer > 0:
         texto_lazer = fonte_pequena.render(f"Lazer: {int(tempo_restante_lazer / 1000)}s", True, (255, 100, 100))
@@ -2547,7 +4463,7 @@ def desenhar_interface():
     tela.blit(texto_nave, (largura - 150, 85))
 
     habilidade_atual = habilidades_naves[nave_selecionada]
-    tempo_atual = pygame.time.get_ticks()
+    tempo_atual = relogio.agora
 
     # Para naves admin, mostrar status especial
     if nave_selecionada >= 6:  # Naves admin
@@ -2576,19 +4492,463 @@ def desenhar_fundo_completo(surface):
         # Limpar efeitos problemáticos
         efeitos.particulas_brilho.clear()
         efeitos.luzes_dinamicas.clear()
-        efeitos.rastros_laser.clear()
+        efeitos.feixes.clear()
 
-    for particula in particulas:
-        particula.desenhar(surface)
+    particulas.desenhar(surface)
 
 
 def atualizar_efeitos_visuais():
-    fundo_estelar.atualizar()
+    fundo_estelar.atualizar(PASSO_SIMULACAO)
     efeitos.atualizar_brilhos()
+    particulas.atualizar()
+
+
+# == PÓS-PROCESSAMENTO ==
+COR_CONGELAMENTO = (190, 220, 255)  # Tinta multiplicada na tela enquanto o congelamento está ativo
+
+
+class PosProcessamento:
+    """Estágio final do frame: passes em ordem, cada um pode ser desligado e mede o próprio custo"""
+
+    def __init__(self):
+        self.passes = [
+            ("brilho", self.passe_brilho),
+            ("congelamento", self.passe_congelamento),
+            ("vinheta", self.passe_vinheta),
+            ("scanlines", self.passe_scanlines),
+        ]
+        self.custos_ms = {nome: 0.0 for nome, _ in self.passes}
+
+        # Scanlines e vinheta pré-calculadas como superfícies opacas para BLEND_MULT (sem alpha por pixel)
+        self.scanlines = pygame.Surface((largura, altura))
+        self.scanlines.fill((255, 255, 255))
+        for y in range(0, altura, 4):
+            self.scanlines.fill((240, 240, 240), (0, y, largura, 1))
+
+        self.tinta_congelamento = pygame.Surface((largura, altura))
+        self.tinta_congelamento.fill(COR_CONGELAMENTO)
+
+        self.vinheta = pygame.Surface((largura, altura))
+        self.vinheta.fill((150, 150, 150))
+        for i in range(16):
+            tom = 150 + (255 - 150) * (i + 1) // 16
+            margem_x = largura * i // 40
+            margem_y = altura * i // 40
+            pygame.draw.ellipse(self.vinheta, (tom, tom, tom),
+                                (margem_x - largura // 4, margem_y - altura // 4,
+                                 largura * 3 // 2 - margem_x * 2, altura * 3 // 2 - margem_y * 2))
+
+    def aplicar(self, surface):
+        passes_ativos = CONFIG_QUALIDADE["pos_processamento"]
+        for nome, passe in self.passes:
+            if not passes_ativos.get(nome):
+                self.custos_ms[nome] = 0.0
+                continue
+            inicio = time.perf_counter()
+            passe(surface)
+            self.custos_ms[nome] = (time.perf_counter() - inicio) * 1000
+
+    def alternar(self, nome):
+        passes_ativos = CONFIG_QUALIDADE["pos_processamento"]
+        passes_ativos[nome] = not passes_ativos.get(nome)
+        print(f"Pós-processamento '{nome}': {'ligado' if passes_ativos[nome] else 'desligado'}")
+
+    def passe_brilho(self, surface):
+        efeitos.compor_lightmap(surface)
+
+    def passe_congelamento(self, surface):
+        if congelar_ativado:
+            surface.blit(self.tinta_congelamento, (0, 0), special_flags=pygame.BLEND_MULT)
+
+    def passe_vinheta(self, surface):
+        surface.blit(self.vinheta, (0, 0), special_flags=pygame.BLEND_MULT)
+
+    def passe_scanlines(self, surface):
+        surface.blit(self.scanlines, (0, 0), special_flags=pygame.BLEND_MULT)
+
+
+pos_processamento = PosProcessamento()
+
+TECLAS_POS_PROCESSAMENTO = {
+    pygame.K_F5: "brilho",
+    pygame.K_F6: "congelamento",
+    pygame.K_F7: "vinheta",
+    pygame.K_F8: "scanlines",
+}
+
+
+# == COLISÕES DA SIMULAÇÃO ==
+def montar_grade_colisao():
+    """Registra na grade todas as entidades colidíveis - uma vez por passo, depois do movimento"""
+    grade_colisao.limpar()
+    for meteoro, _, rect in mundo.percorrer("meteoro", "transform"):
+        grade_colisao.inserir("meteoro", meteoro, rect)
+    for boss in bosses:
+        grade_colisao.inserir("boss", boss, boss.rect)
+    for drone in drones:
+        grade_colisao.inserir("drone", drone, drone.rect)
+    for coracao, _, rect in mundo.percorrer("coracao", "transform"):
+        grade_colisao.inserir("coracao", coracao, rect)
+    for portal, _, rect in mundo.percorrer("portal", "transform"):
+        grade_colisao.inserir("portal", portal, rect)
+
+
+def rect_previsto(meteoro, passos):
+    """Faixa que o meteoro varre nos próximos passos (o próprio rect se estiver congelado)"""
+    rect = mundo.obter(meteoro, "transform")
+    if passos <= 0 or mundo.tem(meteoro, "congelado"):
+        return rect
+    velocidade_x, velocidade_y = mundo.obter(meteoro, "velocidade")
+    return rect.union(rect.move(velocidade_x * passos, velocidade_y * passos))
+
+
+def atualizar_mapa_ocupacao(passos_previsao=0):
+    """Rasteriza meteoros (com previsão opcional), bosses e drones no mapa de ocupação"""
+    rects = [rect_previsto(meteoro, passos_previsao) for meteoro in mundo.entidades("meteoro")]
+    rects.extend(boss.rect for boss in bosses)
+    rects.extend(drone.rect for drone in drones)
+    mapa_ocupacao.reconstruir(rects)
+    return mapa_ocupacao
+
+
+def teleportar_para_area_segura():
+    """Leva o jogador à célula livre mais próxima do mapa de ocupação"""
+    atualizar_mapa_ocupacao(CONFIG_QUALIDADE["previsao_teleporte_passos"])
+    melhor_area = mapa_ocupacao.celula_livre_mais_proxima(jogador.center)
+    if melhor_area is None:
+        print("Nenhuma área segura disponível!")
+        return
+
+    for _ in range(30):
+        criar_particulas_explosao_avancada(jogador.centerx, jogador.centery, 1, (200, 100, 255))
+
+    jogador.topleft = melhor_area.topleft
+
+    for _ in range(30):
+        criar_particulas_explosao_avancada(jogador.centerx, jogador.centery, 1, (100, 200, 255))
+
+    print("Teleporte realizado para área segura!")
+
+
+def resolver_colisoes_jogador():
+    """Contato do jogador com drones, meteoros, projéteis de boss, corações e portais"""
+    global vida_jogador, game_over, pontuacao, nivel, nivel_maximo_alcancado
+
+    if not escudo_ativo:
+        for drone in grade_colisao.acertos("drone", jogador, imagem_jogador()):
+            explosoes.append(criar_explosao_efeitos(drone.rect.centerx, drone.rect.centery, 40))
+            remover_drone(drone)
+            grade_colisao.remover(drone)
+            vida_jogador -= 1
+            if vida_jogador <= 0:
+                game_over = True
+
+    for meteoro in grade_colisao.acertos("meteoro", jogador, imagem_jogador()):
+        rect_meteoro = mundo.obter(meteoro, "transform")
+        if not escudo_ativo:
+            explosoes.append(criar_explosao_efeitos(rect_meteoro.centerx, rect_meteoro.centery, 70))
+            vida_jogador -= 1
+            if vida_jogador <= 0:
+                game_over = True
+        else:
+            explosoes.append(criar_explosao_efeitos(rect_meteoro.centerx, rect_meteoro.centery, 50))
+            pontuacao += 25
+
+        mundo.destruir(meteoro)
+        grade_colisao.remover(meteoro)
+        indice_feixes.remover(meteoro)
+
+    # Tiros de boss: o motor filtra a tabela toda pelo rect do jogador; só os que encostam testam máscara
+    acertos_boss = [i for i in motor_projeteis.acertos(jogador, DONO_BOSS)
+                    if sprites_colidem(jogador, imagem_jogador(), motor_projeteis.rect(i), projetil_boss_img)]
+    for i in acertos_boss:
+        rect_projetil = motor_projeteis.rect(i)
+        if not escudo_ativo:
+            explosoes.append(criar_explosao_efeitos(rect_projetil.centerx, rect_projetil.centery, 40))
+            vida_jogador -= 1
+            if vida_jogador <= 0:
+                game_over = True
+        else:
+            explosoes.append(criar_explosao_efeitos(rect_projetil.centerx, rect_projetil.centery, 20))
+            pontuacao += 10
+    motor_projeteis.remover(acertos_boss)
+
+    for coracao in grade_colisao.acertos("coracao", jogador):
+        if vida_jogador < (max_vida_admin if nave_selecionada >= 6 else max_vida):
+            vida_jogador += 1
+            rect_coracao = mundo.obter(coracao, "transform")
+            mundo.destruir(coracao)
+            grade_colisao.remover(coracao)
+            explosoes.append(criar_explosao_efeitos(rect_coracao.centerx, rect_coracao.centery, 30, "coracao"))
+
+    for portal in grade_colisao.acertos("portal", jogador):
+        nivel_anterior = nivel
+        nivel += 3
+        nivel_maximo_alcancado = max(nivel_maximo_alcancado, nivel)
+        pontuacao += 600
+        rect_portal = mundo.obter(portal, "transform")
+        mundo.destruir(portal)
+        grade_colisao.remover(portal)
+        explosoes.append(criar_explosao_efeitos(rect_portal.centerx, rect_portal.centery, 80, "portal"))
+        print(f"Portal usado! Avançou do nível {nivel_anterior} para o nível {nivel}")
+
+        # Verificar se ao passar pelo portal, o jogador alcançou um nível que deveria ter boss
+        verificar_spawn_boss()
+
+
+def resolver_projeteis_jogador():
+    """Acertos dos projéteis do jogador em meteoros, bosses e drones próximos (consulta a grade)"""
+    global pontuacao, boss_ativo, ultimo_boss_derrotado
+
+    acertaram = []
+
+    # Candidatos de todos os projéteis de uma vez; quem for destruído no meio do passo é descartado depois
+    indices_projeteis = motor_projeteis.indices(DONO_JOGADOR)
+    rects_projeteis = [motor_projeteis.rect(i) for i in indices_projeteis]
+    candidatos = {categoria: grade_colisao.consultar_lote(categoria, rects_projeteis)
+                  for categoria in ("meteoro", "boss", "drone")}
 
-    for particula in particulas[:]:
-        if not particula.atualizar():
-            particulas.remove(particula)
+    def primeiro_acerto(categoria, n, rect_projetil, rotacao):
+        vivos = [entidade for entidade in candidatos[categoria][n] if grade_colisao.contem(entidade)]
+        acertos = filtrar_acertos(categoria, vivos, rect_projetil, projetil_img, rotacao)
+        return acertos[0] if acertos else None
+
+    for n, (i, rect_projetil) in enumerate(zip(indices_projeteis, rects_projeteis)):
+        rotacao = motor_projeteis.rotacao(i)
+
+        meteoro = primeiro_acerto("meteoro", n, rect_projetil, rotacao)
+        if meteoro is not None:
+            rect_meteoro = mundo.obter(meteoro, "transform")
+            vida_meteoro = mundo.obter(meteoro, "vida")
+            if vida_meteoro > 1:
+                mundo.definir(meteoro, "vida", vida_meteoro - 1)
+                explosoes.append(criar_explosao_efeitos(rect_meteoro.centerx, rect_meteoro.centery, 40))
+                pontuacao += 25
+            else:
+                explosoes.append(criar_explosao_efeitos(rect_meteoro.centerx, rect_meteoro.centery, 70))
+                pontuacao += 50
+
+                tipo_meteoro = mundo.obter(meteoro, "sprite")
+                if tipo_meteoro in ["grande", "enorme"]:
+                    novos_meteoros = criar_meteoros_filhos(rect_meteoro.centerx, rect_meteoro.centery, tipo_meteoro)
+                    print(f"Meteoro {tipo_meteoro} se partiu em {len(novos_meteoros)} pedaços!")
+
+                mundo.destruir(meteoro)
+                grade_colisao.remover(meteoro)
+                indice_feixes.remover(meteoro)
+
+            acertaram.append(i)
+
+        boss = primeiro_acerto("boss", n, rect_projetil, rotacao)
+        if boss is not None:
+            explosoes.append(criar_explosao_efeitos(rect_projetil.centerx, rect_projetil.centery, 30))
+            acertaram.append(i)
+            if boss.levar_dano(10):
+                explosoes.append(criar_explosao_efeitos(boss.rect.centerx, boss.rect.centery, 100))
+                pontuacao += 500
+                ultimo_boss_derrotado = boss.nivel_boss if hasattr(boss, 'nivel_boss') else 15
+                # Adicionar à lista de bosses derrotados
+                if ultimo_boss_derrotado not in bosses_derrotados:
+                    bosses_derrotados.append(ultimo_boss_derrotado)
+                remover_boss(boss)
+                grade_colisao.remover(boss)
+                # CORREÇÃO: Atualizar boss_ativo quando qualquer boss é derrotado
+                if len(bosses) == 0:
+                    boss_ativo = False
+                    print(f"BOSS nível {ultimo_boss_derrotado} derrotado!")
+
+        drone = primeiro_acerto("drone", n, rect_projetil, rotacao)
+        if drone is not None:
+            explosoes.append(criar_explosao_efeitos(rect_projetil.centerx, rect_projetil.centery, 20))
+            acertaram.append(i)
+            if drone.levar_dano(1):
+                explosoes.append(criar_explosao_efeitos(drone.rect.centerx, drone.rect.centery, 40))
+                pontuacao += 100
+                remover_drone(drone)
+                grade_colisao.remover(drone)
+
+    motor_projeteis.remover(acertaram)
+
+
+# == BENCHMARKS ==
+BENCHMARK = "--benchmark" in sys.argv
+
+
+def medir_ms(funcao, repeticoes):
+    """Melhor tempo (ms) entre as repetições, com o resultado da última chamada"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, (time.perf_counter() - inicio) * 1000)
+    return melhor, resultado
+
+
+def benchmark_colisoes(repeticoes=20):
+    """Projéteis contra meteoros: laço aninhado original x grade espacial x kernel NumPy (só a broadphase)"""
+    print("\nBroadphase projéteis x meteoros (ms, melhor de %d; inclui montar a estrutura)" % repeticoes)
+    print(f"{'entidades':>10} {'aninhado':>10} {'grade':>10} {'numpy':>10} {'pares':>8}")
+    for quantidade in (10, 100, 1000):
+        gerador = random.Random(quantidade)
+        meteoros_teste = [{"rect": pygame.Rect(gerador.randint(0, largura), gerador.randint(0, altura), 60, 60)}
+                          for _ in range(quantidade)]
+        projeteis_teste = [pygame.Rect(gerador.randint(0, largura), gerador.randint(0, altura), 15, 25)
+                           for _ in range(quantidade)]
+
+        def aninhado():
+            pares = 0
+            for projetil in projeteis_teste:
+                for meteoro in meteoros_teste[:]:
+                    if projetil.colliderect(meteoro["rect"]):
+                        pares += 1
+            return pares
+
+        def com_estrutura(estrutura):
+            for meteoro in meteoros_teste:
+                estrutura.inserir("meteoro", meteoro, meteoro["rect"])
+            candidatos = estrutura.consultar_lote("meteoro", projeteis_teste)
+            return sum(1 for projetil, lista in zip(projeteis_teste, candidatos)
+                       for meteoro in lista if projetil.colliderect(meteoro["rect"]))
+
+        tempo_aninhado, pares = medir_ms(aninhado, repeticoes)
+        tempo_grade, pares_grade = medir_ms(
+            lambda: com_estrutura(GradeEspacial(CONFIG_QUALIDADE["celula_grade_colisao"])), repeticoes)
+        if np is not None:
+            tempo_numpy, pares_numpy = medir_ms(lambda: com_estrutura(BroadphaseVetorizada()), repeticoes)
+            texto_numpy = f"{tempo_numpy:10.3f}"
+        else:
+            pares_numpy = pares
+            texto_numpy = f"{'-':>10}"
+
+        if not pares == pares_grade == pares_numpy:
+            print(f"Divergência nos pares: {pares}, {pares_grade}, {pares_numpy}")
+        print(f"{quantidade:>10} {tempo_aninhado:10.3f} {tempo_grade:10.3f} {texto_numpy} {pares:>8}")
+
+
+def benchmark_projeteis(repeticoes=20):
+    """Passo dos tiros de boss com N vivos: lista de dicts (como era) x motor de projéteis com padrões.
+    Usa um motor só seu, então rodar no meio de uma partida não mexe nos tiros do jogo"""
+    print("\nTiros de boss por passo (ms, melhor de %d): rajada em anel + mover + descartar + colidir" % repeticoes)
+    print(f"{'vivos':>10} {'dicts':>10} {'motor':>10} {'desenho':>10}")
+    jogador_teste = pygame.Rect(180, 500, 40, 40)
+    anel = padrao_tiro("anel")
+    superficie = pygame.Surface((largura, altura))
+    motor = MotorProjeteis(CONFIG_QUALIDADE["capacidade_projeteis"])
+    for quantidade in (0, 250, 1000, 2000, 4000):
+        gerador = random.Random(quantidade)
+        # Parados e longe do jogador: todo passo processa os mesmos N tiros
+        posicoes = [(gerador.randint(0, largura - 10), gerador.randint(0, altura - 200)) for _ in range(quantidade)]
+
+        dicts = [{"rect": pygame.Rect(x, y, 10, 20), "velocidade_x": 0, "velocidade_y": 0} for x, y in posicoes]
+
+        def passo_dicts():
+            nonlocal dicts
+            for i in range(16):
+                angulo = math.radians(i * 22.5)
+                dicts.append({"rect": pygame.Rect(200, 100, 10, 20),
+                              "velocidade_x": math.sin(angulo) * 3.5, "velocidade_y": math.cos(angulo) * 3.5})
+            for projetil in dicts:
+                projetil["rect"].x += projetil["velocidade_x"]
+                projetil["rect"].y += projetil["velocidade_y"]
+            dicts = [projetil for projetil in dicts if projetil["rect"].top <= altura
+                     and projetil["rect"].left >= 0 and projetil["rect"].right <= largura]
+            acertos = [projetil for projetil in dicts if jogador_teste.colliderect(projetil["rect"])]
+            del dicts[quantidade:]
+            return acertos
+
+        motor.limpar()
+        for x, y in posicoes:
+            motor.emitir(DONO_BOSS, x, y, 0, 0)
+
+        def passo_motor():
+            anel.disparar(200, 100, motor=motor)
+            motor.mover()
+            motor.descartar_fora(superficie.get_rect())
+            acertos = motor.acertos(jogador_teste, DONO_BOSS)
+            motor.truncar(quantidade)
+            return acertos
+
+        tempo_dicts, _ = medir_ms(passo_dicts, repeticoes)
+        tempo_motor, _ = medir_ms(passo_motor, repeticoes)
+        tempo_desenho, _ = medir_ms(lambda: desenhar_projeteis(superficie, 1.0, motor), repeticoes)
+        print(f"{quantidade:>10} {tempo_dicts:10.3f} {tempo_motor:10.3f} {tempo_desenho:10.3f}")
+
+
+# == SIMULAÇÃO EM PASSO FIXO ==
+PASSO_SIMULACAO = 1000 / 60  # ms por passo de simulação
+MAX_PASSOS_POR_FRAME = 5  # evita a espiral da morte quando o render atrasa
+
+posicoes_anteriores = {}
+metricas_loop = {'passos': 0, 'simulacao_ms': 0.0, 'render_ms': 0.0}
+mostrar_metricas = False
+
+
+def guardar_posicoes_anteriores():
+    """Guarda a posição de cada corpo móvel antes do passo, para interpolar no desenho"""
+    posicoes_anteriores.clear()
+    for _, rect, _ in mundo.percorrer("transform", "velocidade"):
+        posicoes_anteriores[id(rect)] = (rect, rect.x, rect.y)
+    motor_projeteis.guardar_anteriores()
+
+
+def posicao_interpolada(rect, alpha):
+    """Posição de desenho entre o passo anterior e o atual (alpha de 0 a 1)"""
+    anterior = posicoes_anteriores.get(id(rect))
+    if anterior is None or anterior[0] is not rect:
+        return rect.x, rect.y
+    _, x_anterior, y_anterior = anterior
+    return (round(x_anterior + (rect.x - x_anterior) * alpha),
+            round(y_anterior + (rect.y - y_anterior) * alpha))
+
+
+def centro_interpolado(rect, alpha):
+    x, y = posicao_interpolada(rect, alpha)
+    return x + rect.width / 2, y + rect.height / 2
+
+
+def desenhar_projeteis(surface, alpha, motor=None):
+    """Todos os projéteis num único blits, com as posições interpoladas calculadas em lote pelo motor"""
+    if motor is None:
+        motor = motor_projeteis
+    meio_x, meio_y = TAMANHO_PROJETIL[DONO_JOGADOR][0] / 2, TAMANHO_PROJETIL[DONO_JOGADOR][1] / 2
+    lote = []
+    for x, y, rotacao in motor.posicoes_interpoladas(alpha, DONO_JOGADOR):
+        sprite = obter_rotacao(projetil_img, rotacao)
+        lote.append((sprite, sprite.get_rect(center=(x + meio_x, y + meio_y))))
+    lote.extend((projetil_boss_img, (x, y)) for x, y, _ in motor.posicoes_interpoladas(alpha, DONO_BOSS))
+    surface.blits(lote, False)
+
+
+def desenhar_metricas_loop(surface):
+    """Mostra passos por frame e o custo de simulação e render (tecla F3)"""
+    texto = fonte_pequena.render(
+        f"FPS: {clock.get_fps():.0f}  passos: {metricas_loop['passos']}  "
+        f"sim: {metricas_loop['simulacao_ms']:.1f}ms  render: {metricas_loop['render_ms']:.1f}ms",
+        True, (180, 255, 180))
+    surface.blit(texto, (10, altura - 25))
+
+    custos = "  ".join(f"{nome[:4]} {custo:.2f}" for nome, custo in pos_processamento.custos_ms.items())
+    texto_pos = fonte_pequena.render(f"pós ms: {custos}", True, (180, 255, 180))
+    surface.blit(texto_pos, (10, altura - 45))
+
+    texto_colisao = fonte_pequena.render(
+        f"colisões: {metricas_colisao['amplas']} rect  {metricas_colisao['precisas']} máscara  "
+        f"projéteis: {len(motor_projeteis)}/{motor_projeteis.capacidade}", True, (180, 255, 180))
+    surface.blit(texto_colisao, (10, altura - 65))
+
+    estatisticas_particulas = particulas.estatisticas()
+    texto_particulas = fonte_pequena.render(
+        f"partículas: {estatisticas_particulas['em_uso']}  "
+        f"aloc/frame: {estatisticas_particulas.get('alocacoes_por_frame', 0)}  "
+        f"reuso: {estatisticas_particulas.get('taxa_reuso', 1.0):.0%}", True, (180, 255, 180))
+    surface.blit(texto_particulas, (10, altura - 85))
+
+    estatisticas_orcamento = orcamento_particulas.estatisticas()
+    negadas = sum(emissor['negadas'] for emissor in estatisticas_orcamento['emissores'].values())
+    texto_orcamento = fonte_pequena.render(
+        f"orçamento: {estatisticas_orcamento['particulas']}/{estatisticas_orcamento['limite']}  "
+        f"despejadas: {estatisticas_orcamento['despejadas']}  negadas: {negadas}", True, (180, 255, 180))
+    surface.blit(texto_orcamento, (10, altura - 105))
 
 
 # == INICIALIZAÇÃO DO JOGO ==
@@ -2603,13 +4963,16 @@ bosses_derrotados = []
 
 # == LOOP PRINCIPAL DO JOGO ==
 if __name__ == "__main__":
-    if mostrar_menu_principal():
+    if BENCHMARK:
+        benchmark_colisoes()
+        benchmark_projeteis()
+    elif mostrar_menu_principal():
+        relogio.amostrar()
+        acumulador_simulacao = 0.0
         while rodando:
-            desenhar_fundo_completo(tela)
-            atualizar_efeitos_visuais()
-
-            criar_particulas_estrelas_avancadas()
-            criar_particulas_propulsao_avancada()
+            clock.tick(60)
+            # Relógio do jogo é lido uma vez por frame e alimenta o acumulador; a simulação anda em passos fixos
+            acumulador_simulacao += relogio.amostrar()
 
             for evento_jogo in pygame.event.get():
                 if evento_jogo.type == pygame.QUIT:
@@ -2635,18 +4998,20 @@ if __name__ == "__main__":
                         mostrar_tela_senha("paulo")
                     elif evento_jogo.key == pygame.K_i:  # Nave Vitor (Admin)
                         mostrar_tela_senha("vitor")
+                    elif evento_jogo.key == pygame.K_F3:
+                        mostrar_metricas = not mostrar_metricas
+                    elif evento_jogo.key == pygame.K_F4:
+                        relogio.alternar_pausa()
+                    elif evento_jogo.key in TECLAS_POS_PROCESSAMENTO:
+                        pos_processamento.alternar(TECLAS_POS_PROCESSAMENTO[evento_jogo.key])
                     elif evento_jogo.key == pygame.K_SPACE and not game_over and not digitando_senha:
                         if tiro_triplo_ativo:
-                            novos_projeteis = criar_projeteis_triplo()
-                            for projetil_novo in novos_projeteis:
-                                projeteis.append(projetil_novo)
+                            criar_projeteis_triplo()
                             # Para naves normais, reduz munição
                             if not municao_infinita_ativa:
                                 municao_atual -= 1
                         else:
-                            novo_projetil = criar_projetil()
-                            if novo_projetil is not None:
-                                projeteis.append(novo_projetil)
+                            if criar_projetil():
                                 # Para naves normais, reduz munição
                                 if not municao_infinita_ativa:
                                     municao_atual -= 1
@@ -2657,12 +5022,10 @@ if __name__ == "__main__":
                     elif evento_jogo.key == pygame.K_r and game_over:
                         salvar_progresso()
                         jogador = pygame.Rect(180, 500, 40, 40)
-                        meteoros = []
-                        projeteis = []
-                        projeteis_boss = []
+                        mundo.limpar()
+                        indice_feixes.limpar()
+                        motor_projeteis.limpar()
                         explosoes = []
-                        coracoes = []
-                        portais = []
                         bosses = []
                         drones = []
                         boss_ativo = False
@@ -2680,49 +5043,62 @@ if __name__ == "__main__":
                         teleporte_ativado = False
                         habilidades_admin_ativas = False
                         municao_infinita_ativa = False
-                        tempo_inicio = pygame.time.get_ticks()
+                        tempo_inicio = relogio.agora
                         ultimo_boss_derrotado = 0
                         nave_selecionada = 0
                         bosses_derrotados = []
                         particulas.clear()
                         efeitos.particulas_brilho.clear()
                         efeitos.luzes_dinamicas.clear()
-                        efeitos.rastros_laser.clear()
+                        efeitos.feixes.clear()
                         game_over = False
 
-            if not game_over and not digitando_senha:
+
+            # == SIMULAÇÃO: passos fixos consumindo o tempo real acumulado ==
+            inicio_simulacao = time.perf_counter()
+            passos_frame = 0
+            metricas_colisao['amplas'] = metricas_colisao['precisas'] = 0
+            particulas.iniciar_frame()
+            orcamento_particulas.iniciar_frame()
+            while acumulador_simulacao >= PASSO_SIMULACAO and passos_frame < MAX_PASSOS_POR_FRAME:
+                acumulador_simulacao -= PASSO_SIMULACAO
+                passos_frame += 1
+                relogio.avancar(PASSO_SIMULACAO)
+
+                guardar_posicoes_anteriores()
+                atualizar_efeitos_visuais()
+
+                criar_particulas_estrelas_avancadas()
+                criar_particulas_propulsao_avancada()
+
+                if game_over or digitando_senha:
+                    continue
+
                 # Atualizar velocidade dos meteoros
                 atualizar_velocidade_meteoros()
 
                 # Atualizar drones
-                for drone in drones[:]:
+                for drone in drones:
                     drone.atualizar(jogador)
 
-                    if drone.rect.colliderect(jogador) and not escudo_ativo:
-                        explosoes.append(criar_explosao_efeitos(drone.rect.centerx, drone.rect.centery, 40))
-                        drones.remove(drone)
-                        vida_jogador -= 1
-                        if vida_jogador <= 0:
-                            game_over = True
-
                 for boss_obj in bosses[:]:
                     boss_obj.atualizar(jogador)
 
                     # Verificar tipo específico de boss para comportamentos especiais
                     if isinstance(boss_obj, BossNivel15):
                         # Boss nível 15 - comportamento específico
-                        if pygame.time.get_ticks() - boss_obj.ultimo_tiro > boss_obj.intervalo_tiros:
+                        if relogio.agora - boss_obj.ultimo_tiro > boss_obj.intervalo_tiros:
                             if boss_obj.cycles_completos < 5:
                                 boss_obj.atirar()
                                 boss_obj.cycles_completos += 1
-                                boss_obj.ultimo_tiro = pygame.time.get_ticks()
+                                boss_obj.ultimo_tiro = relogio.agora
                             else:
                                 boss_obj.laser_ativado = True
-                                boss_obj.laser_tempo_inicio = pygame.time.get_ticks()
+                                boss_obj.laser_tempo_inicio = relogio.agora
                                 boss_obj.cycles_completos = 0
 
-                        # Laser do boss nível 15 - CORREÇÃO: método correto
-                        if boss_obj.desenhar_laser(tela, jogador):
+                        # Laser do boss nível 15
+                        if boss_obj.atualizar_laser(jogador):
                             # Nave Gabriel é imune ao boss nível 15
                             if nave_selecionada != 6:  # Não é a nave Gabriel
                                 if not escudo_ativo:
@@ -2735,14 +5111,13 @@ if __name__ == "__main__":
                         for gemeo in boss_obj.bosses_gemeos[:]:
                             gemeo.atualizar(jogador)
                             if gemeo.pode_atirar():
-                                novos_projeteis_boss_gemeo = gemeo.atirar(jogador)
-                                projeteis_boss.extend(novos_projeteis_boss_gemeo)
+                                gemeo.atirar(jogador)
 
                             if gemeo.usar_lazer and random.random() < 0.02:
                                 gemeo.ativar_lazer()
 
-                            # Laser dos gêmeos - CORREÇÃO: método correto
-                            if gemeo.desenhar_laser(tela, jogador):
+                            # Laser dos gêmeos
+                            if gemeo.atualizar_laser(jogador):
                                 if nave_selecionada != 6 and not escudo_ativo:  # Não é Gabriel e sem escudo
                                     explosoes.append(criar_explosao_efeitos(jogador.centerx, jogador.centery, 60))
                                     vida_jogador -= 2
@@ -2751,12 +5126,12 @@ if __name__ == "__main__":
 
                     elif isinstance(boss_obj, BossGabriel):
                         # Boss Gabriel - comportamento específico
-                        if pygame.time.get_ticks() - boss_obj.ultimo_tiro > boss_obj.intervalo_tiros:
+                        if relogio.agora - boss_obj.ultimo_tiro > boss_obj.intervalo_tiros:
                             boss_obj.atirar()
-                            boss_obj.ultimo_tiro = pygame.time.get_ticks()
+                            boss_obj.ultimo_tiro = relogio.agora
 
-                        # Laser do boss Gabriel - CORREÇÃO: método correto
-                        if boss_obj.desenhar_laser(tela, jogador):
+                        # Laser do boss Gabriel
+                        if boss_obj.atualizar_laser(jogador):
                             if not escudo_ativo:
                                 explosoes.append(criar_explosao_efeitos(jogador.centerx, jogador.centery, 70))
                                 vida_jogador -= 3
@@ -2764,7 +5139,7 @@ if __name__ == "__main__":
                                     game_over = True
 
                         # Ataque especial do boss Gabriel
-                        if boss_obj.desenhar_ataque_especial(tela, jogador):
+                        if boss_obj.atualizar_ataque_especial(jogador):
                             if not escudo_ativo:
                                 explosoes.append(criar_explosao_efeitos(jogador.centerx, jogador.centery, 80))
                                 vida_jogador -= 4
@@ -2774,35 +5149,34 @@ if __name__ == "__main__":
                     else:
                         # Bosses normais
                         if boss_obj.pode_atirar():
-                            novos_projeteis_boss = boss_obj.atirar(jogador)
-                            projeteis_boss.extend(novos_projeteis_boss)
+                            boss_obj.atirar(jogador)
 
                         if boss_obj.usar_lazer and random.random() < 0.02:
                             boss_obj.ativar_lazer()
 
-                        # LAZER DO BOSS AGORA CAUSA 2 DE DANO (não mais instantâneo) - CORREÇÃO: método correto
-                        if boss_obj.desenhar_laser(tela, jogador):
+                        # LAZER DO BOSS AGORA CAUSA 2 DE DANO (não mais instantâneo)
+                        if boss_obj.atualizar_laser(jogador):
                             if not escudo_ativo:
                                 explosoes.append(criar_explosao_efeitos(jogador.centerx, jogador.centery, 60))
                                 vida_jogador -= 2  # Alterado de 0 para 2
                                 if vida_jogador <= 0:
                                     game_over = True
 
-                tempo_atual_jogo = pygame.time.get_ticks()
+                tempo_atual_jogo = relogio.agora
 
                 if tempo_atual_jogo - ultimo_salvamento > intervalo_salvamento:
                     salvar_progresso()
                     ultimo_salvamento = tempo_atual_jogo
 
-                if tempo_atual_jogo - ultimo_coracao > intervalo_coracoes and len(coracoes) < 3:
-                    coracoes.append(criar_coracao())
+                if tempo_atual_jogo - ultimo_coracao > intervalo_coracoes and mundo.quantidade("coracao") < 3:
+                    criar_coracao()
                     ultimo_coracao = tempo_atual_jogo
 
                 # Não spawnar portais durante bosses (exceto boss Gabriel)
                 boss_gabriel_ativo = any(isinstance(boss, BossGabriel) for boss in bosses)
-                if tempo_atual_jogo - ultimo_portal > intervalo_portais and len(
-                        portais) < 1 and not boss_ativo and not boss_gabriel_ativo:
-                    portais.append(criar_portal())
+                if tempo_atual_jogo - ultimo_portal > intervalo_portais and mundo.quantidade(
+                        "portal") < 1 and not boss_ativo and not boss_gabriel_ativo:
+                    criar_portal()
                     ultimo_portal = tempo_atual_jogo
 
                 atualizar_municao()
@@ -2826,192 +5200,87 @@ if __name__ == "__main__":
                     # Apenas spawnar meteoros se não houver boss ou se for o boss Gabriel
                     chance_spawn = max(5, 60 - nivel * 3)
                     if random.randint(1, chance_spawn) == 1:
-                        meteoros.append(criar_meteoro())
-
-                for meteoro_obj in meteoros[:]:
-                    if not meteoro_obj["congelado"]:
-                        meteoro_obj["rect"].y += meteoro_obj["velocidade_y"]
-                        meteoro_obj["rect"].x += meteoro_obj["velocidade_x"]
-                        meteoro_obj["rotacao"] += meteoro_obj["rotacao_speed"]
-
-                        if meteoro_obj["rect"].left <= 0 or meteoro_obj["rect"].right >= largura:
-                            meteoro_obj["velocidade_x"] *= -1
-
-                    if meteoro_obj["rect"].colliderect(jogador):
-                        if not escudo_ativo:
-                            explosoes.append(
-                                criar_explosao_efeitos(meteoro_obj["rect"].centerx, meteoro_obj["rect"].centery, 70))
-                            vida_jogador -= 1
-                            if vida_jogador <= 0:
-                                game_over = True
-                        else:
-                            explosoes.append(
-                                criar_explosao_efeitos(meteoro_obj["rect"].centerx, meteoro_obj["rect"].centery, 50))
-                            pontuacao += 25
+                        criar_meteoro()
+
+                # Sistema de movimento: meteoros, corações e portais - tudo que tem velocidade
+                for entidade, rect_entidade, velocidade_entidade in mundo.consultar("transform", "velocidade"):
+                    if mundo.tem(entidade, "congelado"):
+                        continue
+                    rect_entidade.y += velocidade_entidade[1]
+                    rect_entidade.x += velocidade_entidade[0]
+                    if rect_entidade.left <= 0 or rect_entidade.right >= largura:
+                        velocidade_entidade[0] *= -1
+                    if rect_entidade.y >= altura:
+                        mundo.destruir(entidade)
+                        indice_feixes.remover(entidade)
+
+                for entidade, rotacao_entidade in mundo.percorrer("rotacao"):
+                    if not mundo.tem(entidade, "congelado"):
+                        rotacao_entidade[0] += rotacao_entidade[1]
+
+                velocidade_projetil = 15 if velocidade_dupla_ativa else 10
+                motor_projeteis.definir_velocidade(DONO_JOGADOR, 0, -velocidade_projetil)
+                motor_projeteis.mover()
+                motor_projeteis.descartar_fora(tela.get_rect())
+
+                # Colisões: tudo já se moveu neste passo, então a grade é montada uma vez e consultada por área
+                montar_grade_colisao()
+                indice_feixes.marcar_movidas()
+                resolver_colisoes_jogador()
+                resolver_projeteis_jogador()
+
+                atualizar_lazer_jogador()
 
-                        if meteoro_obj in meteoros:
-                            meteoros.remove(meteoro_obj)
-
-                    if meteoro_obj["tipo"] == "enorme":
-                        meteoro_img_rotacionada = pygame.transform.rotate(meteoro_enorme_img, meteoro_obj["rotacao"])
-                    elif meteoro_obj["tipo"] == "grande":
-                        meteoro_img_rotacionada = pygame.transform.rotate(meteoro_grande_img, meteoro_obj["rotacao"])
-                    else:
-                        meteoro_img_rotacionada = pygame.transform.rotate(meteoro_img, meteoro_obj["rotacao"])
+                for explosao_final in explosoes[:]:
+                    tempo_decorrido_explosao_final = relogio.agora - explosao_final["tempo_inicio"]
+                    if tempo_decorrido_explosao_final > explosao_final["duracao"]:
+                        explosoes.remove(explosao_final)
 
-                    tela.blit(meteoro_img_rotacionada, meteoro_obj["rect"])
+                atualizar_pontuacao()
 
-                for coracao_obj in coracoes[:]:
-                    coracao_obj.y += 3
+            # Se a simulação ficou para trás demais, descartar o atraso em vez de acumular
+            if passos_frame == MAX_PASSOS_POR_FRAME:
+                acumulador_simulacao = min(acumulador_simulacao, PASSO_SIMULACAO)
 
-                    if coracao_obj.colliderect(jogador) and vida_jogador < (
-                    max_vida_admin if nave_selecionada >= 6 else max_vida):
-                        vida_jogador += 1
-                        coracoes.remove(coracao_obj)
-                        explosoes.append(
-                            criar_explosao_efeitos(coracao_obj.centerx, coracao_obj.centery, 30, "coracao"))
+            inicio_render = time.perf_counter()
+            metricas_loop['passos'] = passos_frame
+            metricas_loop['simulacao_ms'] = (inicio_render - inicio_simulacao) * 1000
 
-                    elif coracao_obj.y < altura:
-                        tela.blit(coracao_img, coracao_obj)
-                    else:
-                        coracoes.remove(coracao_obj)
+            # == RENDERIZAÇÃO: interpolando entre o passo anterior e o atual ==
+            alpha_interpolacao = acumulador_simulacao / PASSO_SIMULACAO
+            desenhar_fundo_completo(tela)
 
-                for portal_obj in portais[:]:
-                    portal_obj.y += 2
+            if not game_over and not digitando_senha:
+                for boss_obj in bosses:
+                    boss_obj.desenhar_laser(tela)
+                    if isinstance(boss_obj, BossNivel15):
+                        for gemeo in boss_obj.bosses_gemeos:
+                            gemeo.desenhar_laser(tela)
+                    elif isinstance(boss_obj, BossGabriel):
+                        boss_obj.desenhar_ataque_especial(tela)
 
-                    if portal_obj.colliderect(jogador):
-                        nivel_anterior = nivel
-                        nivel += 3
-                        nivel_maximo_alcancado = max(nivel_maximo_alcancado, nivel)
-                        pontuacao += 600
-                        portais.remove(portal_obj)
-                        explosoes.append(criar_explosao_efeitos(portal_obj.centerx, portal_obj.centery, 80, "portal"))
-                        print(f"Portal usado! Avançou do nível {nivel_anterior} para o nível {nivel}")
+                for meteoro_obj, _, rect_meteoro, rotacao_meteoro in mundo.percorrer("meteoro", "transform", "rotacao"):
+                    desenhar_rotacionado(tela, imagem_meteoro(meteoro_obj), rotacao_meteoro[0],
+                                         centro_interpolado(rect_meteoro, alpha_interpolacao))
 
-                        # Verificar se ao passar pelo portal, o jogador alcançou um nível que deveria ter boss
-                        verificar_spawn_boss()
+                tela.blits([(coracao_img, posicao_interpolada(rect_coracao, alpha_interpolacao))
+                            for _, _, rect_coracao in mundo.percorrer("coracao", "transform")], False)
 
-                    elif portal_obj.y < altura:
-                        desenhar_portal(tela, portal_obj)
-                    else:
-                        portais.remove(portal_obj)
-
-                projeteis_a_remover = []
-
-                for projetil_obj in projeteis[:]:
-                    velocidade_projetil = 15 if velocidade_dupla_ativa else 10
-                    projetil_obj["rect"].y -= velocidade_projetil
-                    projetil_obj["rotacao"] += 5
-
-                    for meteoro_projetil in meteoros[:]:
-                        if projetil_obj["rect"].colliderect(meteoro_projetil["rect"]):
-                            if meteoro_projetil["vida"] > 1:
-                                meteoro_projetil["vida"] -= 1
-                                explosoes.append(criar_explosao_efeitos(meteoro_projetil["rect"].centerx,
-                                                                        meteoro_projetil["rect"].centery, 40))
-                                pontuacao += 25
-                            else:
-                                explosoes.append(criar_explosao_efeitos(meteoro_projetil["rect"].centerx,
-                                                                        meteoro_projetil["rect"].centery, 70))
-                                pontuacao += 50
-
-                                if meteoro_projetil["tipo"] in ["grande", "enorme"]:
-                                    novos_meteoros = criar_meteoros_filhos(
-                                        meteoro_projetil["rect"].centerx,
-                                        meteoro_projetil["rect"].centery,
-                                        meteoro_projetil["tipo"]
-                                    )
-                                    meteoros.extend(novos_meteoros)
-                                    print(
-                                        f"Meteoro {meteoro_projetil['tipo']} se partiu em {len(novos_meteoros)} pedaços!")
-
-                                meteoros.remove(meteoro_projetil)
-
-                            projeteis_a_remover.append(projetil_obj)
-                            break
-
-                    for boss_projetil in bosses[:]:
-                        if projetil_obj["rect"].colliderect(boss_projetil.rect):
-                            explosoes.append(
-                                criar_explosao_efeitos(projetil_obj["rect"].centerx, projetil_obj["rect"].centery, 30))
-                            projeteis_a_remover.append(projetil_obj)
-                            if boss_projetil.levar_dano(10):
-                                explosoes.append(
-                                    criar_explosao_efeitos(boss_projetil.rect.centerx, boss_projetil.rect.centery, 100))
-                                pontuacao += 500
-                                ultimo_boss_derrotado = boss_projetil.nivel_boss if hasattr(boss_projetil,
-                                                                                            'nivel_boss') else 15
-                                # Adicionar à lista de bosses derrotados
-                                if ultimo_boss_derrotado not in bosses_derrotados:
-                                    bosses_derrotados.append(ultimo_boss_derrotado)
-                                bosses.remove(boss_projetil)
-                                # CORREÇÃO: Atualizar boss_ativo quando qualquer boss é derrotado
-                                if len(bosses) == 0:
-                                    boss_ativo = False
-                                    print(f"BOSS nível {ultimo_boss_derrotado} derrotado!")
-                            break
-
-                    for drone_projetil in drones[:]:
-                        if projetil_obj["rect"].colliderect(drone_projetil.rect):
-                            explosoes.append(
-                                criar_explosao_efeitos(projetil_obj["rect"].centerx, projetil_obj["rect"].centery, 20))
-                            projeteis_a_remover.append(projetil_obj)
-                            if drone_projetil.levar_dano(1):
-                                explosoes.append(
-                                    criar_explosao_efeitos(drone_projetil.rect.centerx, drone_projetil.rect.centery,
-                                                           40))
-                                pontuacao += 100
-                                drones.remove(drone_projetil)
-                            break
-
-                    if projetil_obj["rect"].bottom < 0:
-                        projeteis_a_remover.append(projetil_obj)
-                    else:
-                        projetil_img_rotacionada = pygame.transform.rotate(projetil_img, projetil_obj["rotacao"])
-                        tela.blit(projetil_img_rotacionada, projetil_obj["rect"])
-
-                for projetil_remover in projeteis_a_remover:
-                    if projetil_remover in projeteis:
-                        projeteis.remove(projetil_remover)
-
-                for projetil_boss_obj in projeteis_boss[:]:
-                    projetil_boss_obj["rect"].x += projetil_boss_obj["velocidade_x"]
-                    projetil_boss_obj["rect"].y += projetil_boss_obj["velocidade_y"]
-
-                    if projetil_boss_obj["rect"].colliderect(jogador):
-                        if not escudo_ativo:
-                            explosoes.append(criar_explosao_efeitos(projetil_boss_obj["rect"].centerx,
-                                                                    projetil_boss_obj["rect"].centery, 40))
-                            projeteis_boss.remove(projetil_boss_obj)
-                            vida_jogador -= 1
-                            if vida_jogador <= 0:
-                                game_over = True
-                        else:
-                            explosoes.append(criar_explosao_efeitos(projetil_boss_obj["rect"].centerx,
-                                                                    projetil_boss_obj["rect"].centery, 20))
-                            projeteis_boss.remove(projetil_boss_obj)
-                            pontuacao += 10
-
-                    elif (projetil_boss_obj["rect"].top > altura or
-                          projetil_boss_obj["rect"].left < 0 or
-                          projetil_boss_obj["rect"].right > largura):
-                        projeteis_boss.remove(projetil_boss_obj)
-                    else:
-                        tela.blit(projetil_boss_img, projetil_boss_obj["rect"])
+                for _, _, rect_portal in mundo.percorrer("portal", "transform"):
+                    desenhar_portal(tela, pygame.Rect(posicao_interpolada(rect_portal, alpha_interpolacao),
+                                                      rect_portal.size))
 
-                meteoros = [meteoro_final for meteoro_final in meteoros if meteoro_final["rect"].y < altura]
+                desenhar_projeteis(tela, alpha_interpolacao)
 
                 # Desenhar efeitos visuais
-                desenhar_meteoros_congelados(tela)
-                desenhar_bosses_congelados(tela)
-                desenhar_drones_congelados(tela)
+                desenhar_inimigos_congelados(tela)
                 desenhar_escudo(tela)
                 desenhar_efeito_velocidade(tela)
-                desenhar_lazer_jogador(tela)  # Substituído pela função melhorada
+                desenhar_lazer_jogador(tela)
 
                 # Desenhar drones
                 for drone in drones:
-                    tela.blit(drone_img, drone.rect)
+                    tela.blit(quadro_asset("boss", (30, 30)), drone.rect)
                     drone.desenhar_escudo(tela)
 
                     barra_largura = 30
@@ -3025,59 +5294,54 @@ if __name__ == "__main__":
                 for boss_desenho in bosses:
                     if isinstance(boss_desenho, BossNivel15):
                         # Desenhar boss nível 15
-                        tela.blit(mega_boss_img, boss_desenho.rect)
+                        tela.blit(quadro_asset(*asset_boss(boss_desenho)), boss_desenho.rect)
                         boss_desenho.desenhar_barra_vida(tela)
                         boss_desenho.desenhar_escudo(tela)
 
                         # Desenhar bosses gêmeos
                         for gemeo in boss_desenho.bosses_gemeos:
-                            if gemeo.usar_lazer:
-                                tela.blit(boss_menor_img, gemeo.rect)
-                            else:
-                                tela.blit(boss_img, gemeo.rect)
+                            tela.blit(quadro_asset(*asset_boss(gemeo)), gemeo.rect)
                             gemeo.desenhar_barra_vida(tela)
                             gemeo.desenhar_escudo(tela)
 
                     elif isinstance(boss_desenho, BossGabriel):
                         # Desenhar boss Gabriel
-                        tela.blit(boss_gabriel_img, boss_desenho.rect)
+                        tela.blit(quadro_asset(*asset_boss(boss_desenho)), boss_desenho.rect)
                         boss_desenho.desenhar_barra_vida(tela)
                         boss_desenho.desenhar_escudo(tela)
 
                     else:
                         # Bosses normais
-                        if boss_desenho.tipo_boss == 3:
-                            tela.blit(mega_boss_img, boss_desenho.rect)
-                        elif boss_desenho.tipo_boss == 2 and boss_desenho.usar_lazer:
-                            tela.blit(boss_menor_img, boss_desenho.rect)
-                        else:
-                            tela.blit(boss_img, boss_desenho.rect)
+                        tela.blit(quadro_asset(*asset_boss(boss_desenho)), boss_desenho.rect)
 
                         boss_desenho.desenhar_barra_vida(tela)
                         boss_desenho.desenhar_escudo(tela)
 
-                for explosao_final in explosoes[:]:
-                    tempo_decorrido_explosao_final = pygame.time.get_ticks() - explosao_final["tempo_inicio"]
-                    if tempo_decorrido_explosao_final > explosao_final["duracao"]:
-                        explosoes.remove(explosao_final)
-                    else:
-                        desenhar_explosao(tela, explosao_final)
-
-                atualizar_pontuacao()
+                for explosao_final in explosoes:
+                    desenhar_explosao(tela, explosao_final)
 
                 if naves_imagens:
-                    tela.blit(naves_imagens[nave_selecionada], jogador)
+                    tela.blit(quadro_asset(NAVES_ASSETS[nave_selecionada], (40, 40)), jogador)
+
+            pos_processamento.aplicar(tela)
 
             desenhar_interface()
 
+            if relogio.pausado:
+                texto_pausa = fonte.render('PAUSADO', True, (255, 255, 0))
+                tela.blit(texto_pausa, (largura // 2 - 60, altura // 2 - 100))
+
             if game_over:
                 texto_gameover = fonte.render('GAME OVER', True, (255, 0, 0))
                 texto_reiniciar = fonte.render('Pressione R para reiniciar', True, (255, 255, 255))
                 tela.blit(texto_gameover, (largura // 2 - 80, altura // 2 - 50))
                 tela.blit(texto_reiniciar, (largura // 2 - 150, altura // 2))
 
+            metricas_loop['render_ms'] = (time.perf_counter() - inicio_render) * 1000
+            if mostrar_metricas:
+                desenhar_metricas_loop(tela)
+
             pygame.display.flip()
-            clock.tick(60)
 
         salvar_progresso()
 